@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import secrets
-import time
 from typing import TYPE_CHECKING
 
 from src.business_logic.authorization.mixins import UpdateRedirectUrlMixin
@@ -87,8 +86,8 @@ class CodeAuthService(UpdateRedirectUrlMixin):
 
     async def _create_grant(self, request_data: AuthRequestModel):
         """
-        Create a persistent grant for the authorization code. We need this grant to get an access
-        token later on in an authorization process.
+        Store the authorization code, in the ephemeral store or as a persistent grant.
+        We need it to get an access token later on in an authorization process.
 
         Args:
             request_data: An instance of AuthRequestModel containing the request data.
@@ -98,16 +97,15 @@ class CodeAuthService(UpdateRedirectUrlMixin):
                 request_data.client_id
             )
         )
-        await self._persistent_grant_repo.create(
+        await self._persistent_grant_repo.create_authorization_code(
             client_id=request_data.client_id,
-            grant_type="authorization_code",
-            grant_data=self._secret_code,
+            code=self._secret_code,
             user_id=(
                 await self._user_repo.get_user_by_username(
                     request_data.username
                 )
             ).id,
-            expiration_time=auth_code_lifetime + int(time.time()),
+            lifetime=auth_code_lifetime,
             scope=request_data.scope
         )
 
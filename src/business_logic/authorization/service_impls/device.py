@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 from typing import TYPE_CHECKING
 
+from src.data_access.redis import device_polling
 from src.dyna_config import BASE_URL
 
 if TYPE_CHECKING:
@@ -90,16 +91,20 @@ class DeviceAuthService:
         Create a persistent grant for the device authorization code. We need this grant
         to get an access token later on in an authorization process.
 
+        The device code is marked approved for polling, so the token endpoint
+        reads the grant from the database from now on.
+
         Args:
             request_data: An instance of AuthRequestModel containing the request data.
             grant_duration: The duration of the grant in seconds.
         """
+        device_code = await self._device_repo.get_device_code_by_user_code(
+            user_code=request_data.user_code
+        )
         await self._persistent_grant_repo.create(
             client_id=request_data.client_id,
             grant_type="urn:ietf:params:oauth:grant-type:device_code",
-            grant_data=await self._device_repo.get_device_code_by_user_code(
-                user_code=request_data.user_code
-            ),
+            grant_data=device_code,
             user_id=(
                 await self._user_repo.get_user_by_username(
                     request_data.username
@@ -108,6 +113,8 @@ class DeviceAuthService:
             expiration_time=int(time.time()) + grant_duration,
             scope=request_data.scope
         )
+        if device_polling is not None:
+            await device_polling.approve(device_code, ttl=grant_duration)
 
     async def get_redirect_url(self, request_data: AuthRequestModel) -> str:
         """
@@ -103,7 +103,7 @@ class IdTokenTokenAuthService(UpdateRedirectUrlMixin):
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm="RS256")
+        return await self._jwt_manager.encode(payload=payload, algorithm="RS256")
 
     async def _get_id_token(
         self, request_data: AuthRequestModel, user_id: int, unix_time: int
@@ -128,7 +128,7 @@ class IdTokenTokenAuthService(UpdateRedirectUrlMixin):
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm="RS256")
+        return await self._jwt_manager.encode(payload=payload, algorithm="RS256")
 
     async def get_redirect_url(self, request_data: AuthRequestModel) -> str:
         """
@@ -101,7 +101,7 @@ class TokenAuthService(UpdateRedirectUrlMixin):
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm="RS256")
+        return await self._jwt_manager.encode(payload=payload, algorithm="RS256")
 
     async def get_redirect_url(self, request_data: AuthRequestModel) -> str:
         """
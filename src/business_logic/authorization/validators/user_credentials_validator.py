@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 from src.data_access.postgresql.errors import (
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
     from src.business_logic.services.password import PasswordHash
     from src.data_access.postgresql.repositories import UserRepository
 
+logger = logging.getLogger(__name__)
+
 
 class UserCredentialsValidator:
     """Validates the requested user credentials against the credentials stored in the database."""
@@ -48,7 +51,32 @@ class UserCredentialsValidator:
         hashed_password = (
             await self._user_repo.get_hashed_password_by_username(username)
         )
-        if not self._password_service.is_password_valid(
-            password, hashed_password
+        if (
+            not hashed_password
+            or not await self._password_service.is_password_valid(
+                password, hashed_password
+            )
         ):
             raise WrongPasswordError("Invalid username or password.")
+
+        if self._password_service.needs_rehash(hashed_password):
+            await self._rehash_password(username, password, hashed_password)
+
+    async def _rehash_password(
+        self, username: str, password: SecretStr, hashed_password: str
+    ) -> None:
+        """
+        Replaces a hash made with another algorithm or cost than the
+        configured ones. Failures are logged, they never fail the login.
+        """
+        try:
+            new_hash = await self._password_service.hash_password(
+                password.get_secret_value()
+            )
+            await self._user_repo.replace_hashed_password(
+                username, hashed_password, new_hash
+            )
+        except Exception as exception:
+            logger.warning(
+                f"Can not rehash the password of {username}: {exception}"
+            )
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from redis import Redis
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.data_access.redis.invalidation import InvalidationChannel
+from src.dyna_config import (
+    INTROSPECTION_CACHE_BACKEND,
+    INTROSPECTION_CACHE_CHANNEL,
+    INTROSPECTION_CACHE_ENABLED,
+    INTROSPECTION_CACHE_INVALIDATION,
+    INTROSPECTION_CACHE_MAX_SIZE,
+    INTROSPECTION_CACHE_NEGATIVE_TTL,
+    INTROSPECTION_CACHE_TTL,
+    REDIS_URL,
+)
+from src.metrics import INTROSPECTION_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+Response = dict[str, Any]
+
+
+@dataclass
+class IntrospectionLookup:
+    """Result of a cache lookup, passed back to `put` on a miss."""
+
+    digest: str
+    field: str
+    response: Optional[Response]
+    # Invalidations seen by this process when the lookup started.
+    generation: int
+    # Revocation epoch of the Redis tier read with the entry.
+    epoch: Optional[int] = None
+    # Invalidations of the token digest seen by the Redis tier.
+    version: Optional[int] = None
+
+
+class IntrospectionCache:
+    """
+    Introspection responses keyed by token digest and token type hint.
+
+    Active responses are kept until the token expires, at most `ttl`
+    seconds; inactive ones for `negative_ttl` seconds. Entries live in a
+    size bounded LRU of the process and, with a `redis_url`, in a tier
+    shared by every worker.
+
+    `invalidate` drops the responses of one token (revocation, grant
+    deletion), `flush` drops every response by bumping the revocation
+    epoch, for deletions that do not know their tokens (logout). Both are
+    broadcast on `channel`; entries of the Redis tier written under an
+    older epoch are ignored. `invalidate` also bumps a version of the token
+    digest, a response is written to the Redis tier only while the epoch
+    and the version are those read by its lookup, so a lookup racing with
+    an invalidation can not store the response from before the change.
+    """
+
+    KEY_PREFIX = "introspection"
+    EPOCH_KEY = f"{KEY_PREFIX}:epoch"
+
+    # KEYS: epoch, digest version, entry; ARGV: epoch and version of the
+    # lookup, field, entry, ttl.
+    PUT_SCRIPT = """
+    if tonumber(redis.call('GET', KEYS[1]) or 0) ~= tonumber(ARGV[1])
+        or tonumber(redis.call('GET', KEYS[2]) or 0) ~= tonumber(ARGV[2]) then
+        return 0
+    end
+    redis.call('HSET', KEYS[3], ARGV[3], ARGV[4])
+    redis.call('EXPIRE', KEYS[3], ARGV[5])
+    return 1
+    """
+
+    def __init__(
+        self,
+        ttl: int,
+        negative_ttl: int,
+        max_size: int,
+        redis_url: Optional[str] = None,
+        channel: Optional[InvalidationChannel] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self.redis_url = redis_url
+        self.channel = channel
+        self.enabled = enabled
+        self._entries: OrderedDict[
+            str, dict[str, tuple[Response, float]]
+        ] = OrderedDict()
+        self._generation = 0
+        self._redis: Optional[aioredis.Redis[str]] = None
+
+    @property
+    def redis(self) -> aioredis.Redis[str]:
+        if self._redis is None:
+            if self.redis_url is None:
+                raise RuntimeError("The introspection cache has no Redis tier.")
+            self._redis = aioredis.from_url(
+                self.redis_url, encoding="utf8", decode_responses=True
+            )
+        return self._redis
+
+    @staticmethod
+    def get_digest(token: str) -> str:
+        return hashlib.sha256(token.replace("Bearer ", "").encode()).hexdigest()
+
+    def _redis_key(self, digest: str) -> str:
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    def _version_key(self, digest: str) -> str:
+        return f"{self.KEY_PREFIX}:{digest}:version"
+
+    def _expires_at(self, response: Response) -> float:
+        now = time.time()
+        if not response.get("active"):
+            return now + self.negative_ttl
+        expires_at = now + self.ttl
+        if isinstance(response.get("exp"), (int, float)):
+            expires_at = min(expires_at, response["exp"])
+        return expires_at
+
+    def _get_local(self, digest: str, field: str) -> Optional[Response]:
+        entry = self._entries.get(digest, {}).get(field)
+        if entry is None:
+            return None
+        response, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[digest][field]
+            return None
+        self._entries.move_to_end(digest)
+        return response
+
+    def _put_local(
+        self, digest: str, field: str, response: Response, expires_at: float
+    ) -> None:
+        self._entries.setdefault(digest, {})[field] = (response, expires_at)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_many(
+        self, requests: list[tuple[str, Optional[str]]]
+    ) -> list[IntrospectionLookup]:
+        """
+        Looks up the responses of (token, token_type_hint) pairs.
+
+        The memory tier is checked first, the remaining pairs are read from
+        the Redis tier with one round trip.
+        """
+        lookups = []
+        for token, token_type_hint in requests:
+            lookup = IntrospectionLookup(
+                digest=self.get_digest(token),
+                field=token_type_hint or "",
+                response=None,
+                generation=self._generation,
+            )
+            if self.enabled:
+                lookup.response = self._get_local(lookup.digest, lookup.field)
+                INTROSPECTION_CACHE_REQUESTS.labels(
+                    "memory", "hit" if lookup.response is not None else "miss"
+                ).inc()
+            lookups.append(lookup)
+
+        missing = [lookup for lookup in lookups if lookup.response is None]
+        if not self.enabled or self.redis_url is None or not missing:
+            return lookups
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(self.EPOCH_KEY)
+                for lookup in missing:
+                    pipe.get(self._version_key(lookup.digest))
+                    pipe.hget(self._redis_key(lookup.digest), lookup.field)
+                epoch, *values = await pipe.execute()
+        except RedisError as exc:
+            logger.warning(f"Introspection cache lookup failed: {exc}")
+            return lookups
+
+        epoch = int(epoch or 0)
+        for lookup, version, value in zip(missing, values[::2], values[1::2]):
+            lookup.epoch = epoch
+            lookup.version = int(version or 0)
+            entry = json.loads(value) if value is not None else None
+            if (
+                entry is not None
+                and entry["epoch"] == epoch
+                and entry["expires_at"] > time.time()
+            ):
+                response = lookup.response = entry["response"]
+                self._put_local(
+                    lookup.digest, lookup.field, response, entry["expires_at"]
+                )
+            INTROSPECTION_CACHE_REQUESTS.labels(
+                "redis", "hit" if lookup.response is not None else "miss"
+            ).inc()
+        return lookups
+
+    async def get(
+        self, token: str, token_type_hint: Optional[str]
+    ) -> IntrospectionLookup:
+        return (await self.get_many([(token, token_type_hint)]))[0]
+
+    async def put_many(
+        self, items: list[tuple[IntrospectionLookup, Response]]
+    ) -> None:
+        """
+        Stores the responses computed after a miss.
+
+        A response is dropped when an invalidation happened since its
+        lookup, it may have been computed from the data before the change;
+        the Redis tier checks it with `PUT_SCRIPT`.
+        """
+        if not self.enabled:
+            return
+        shared = []
+        for lookup, response in items:
+            expires_at = self._expires_at(response)
+            if lookup.generation == self._generation:
+                self._put_local(
+                    lookup.digest, lookup.field, response, expires_at
+                )
+            if lookup.epoch is not None:
+                shared.append((lookup, response, expires_at))
+        if not shared:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for lookup, response, expires_at in shared:
+                    pipe.eval(
+                        self.PUT_SCRIPT,
+                        3,
+                        self.EPOCH_KEY,
+                        self._version_key(lookup.digest),
+                        self._redis_key(lookup.digest),
+                        lookup.epoch,
+                        lookup.version or 0,
+                        lookup.field,
+                        json.dumps(
+                            {
+                                "epoch": lookup.epoch,
+                                "expires_at": expires_at,
+                                "response": response,
+                            }
+                        ),
+                        self.ttl,
+                    )
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning(f"Can not store introspection responses: {exc}")
+
+    async def put(
+        self, lookup: IntrospectionLookup, response: Response
+    ) -> None:
+        await self.put_many([(lookup, response)])
+
+    def invalidate_local(self, digest: Optional[str] = None) -> None:
+        """Drops the responses of a token digest, all without one, here only."""
+        self._generation += 1
+        if digest is None or digest == InvalidationChannel.RESUBSCRIBED:
+            self._entries.clear()
+        else:
+            self._entries.pop(digest, None)
+
+    async def invalidate(self, token: str) -> None:
+        """Drops the responses of the token in every worker."""
+        digest = self.get_digest(token)
+        self.invalidate_local(digest)
+        if self.redis_url is not None:
+            try:
+                # The version outlives the lookups that could have read the
+                # previous one, those take far less than `ttl`.
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    pipe.incr(self._version_key(digest))
+                    pipe.expire(self._version_key(digest), self.ttl)
+                    pipe.delete(self._redis_key(digest))
+                    await pipe.execute()
+            except RedisError as exc:
+                logger.error(f"Can not drop introspection responses: {exc}")
+        if self.channel is not None:
+            await self.channel.publish(digest)
+
+    async def flush(self) -> None:
+        """Drops every response by bumping the revocation epoch."""
+        self.invalidate_local()
+        if self.redis_url is not None:
+            try:
+                await self.redis.incr(self.EPOCH_KEY)
+            except RedisError as exc:
+                logger.error(f"Can not bump the revocation epoch: {exc}")
+        if self.channel is not None:
+            await self.channel.publish(InvalidationChannel.RESUBSCRIBED)
+
+    def flush_sync(self) -> None:
+        """`flush` for the Celery worker, which has no local tier."""
+        try:
+            if self.redis_url is not None:
+                with Redis.from_url(self.redis_url) as redis:
+                    redis.incr(self.EPOCH_KEY)
+            if self.channel is not None:
+                with Redis.from_url(self.channel.redis_url) as redis:
+                    redis.publish(
+                        self.channel.channel, InvalidationChannel.RESUBSCRIBED
+                    )
+        except RedisError as exc:
+            logger.error(f"Can not flush the introspection cache: {exc}")
+
+    def start(self) -> None:
+        if self.channel is not None:
+            self.channel.start(self.invalidate_local)
+
+    async def close(self) -> None:
+        if self.channel is not None:
+            await self.channel.close()
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def create_introspection_cache(
+    backend: str, invalidation: str
+) -> IntrospectionCache:
+    if backend not in ("memory", "redis"):
+        raise ValueError(f"Unknown introspection cache backend: {backend}")
+    if invalidation == "redis":
+        channel = InvalidationChannel(
+            redis_url=REDIS_URL, channel=INTROSPECTION_CACHE_CHANNEL
+        )
+    elif invalidation == "local":
+        channel = None
+    else:
+        raise ValueError(
+            f"Unknown introspection cache invalidation: {invalidation}"
+        )
+    return IntrospectionCache(
+        ttl=INTROSPECTION_CACHE_TTL,
+        negative_ttl=INTROSPECTION_CACHE_NEGATIVE_TTL,
+        max_size=INTROSPECTION_CACHE_MAX_SIZE,
+        redis_url=REDIS_URL if backend == "redis" else None,
+        channel=channel,
+        enabled=INTROSPECTION_CACHE_ENABLED,
+    )
+
+
+introspection_cache = create_introspection_cache(
+    INTROSPECTION_CACHE_BACKEND, INTROSPECTION_CACHE_INVALIDATION
+)
@@ -3,6 +3,10 @@ import logging
 from typing import Optional, Callable, Any
 
 from fastapi import Request, Response
+from fastapi_cache import FastAPICache
+
+from src.business_logic.services.jwt_token import JWTService
+from src.data_access.postgresql.user_claims import user_claims_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,4 +35,58 @@ def builder_with_parametr(
         )
         logger.info(f"Redis key: {cache_key}")
         return cache_key
-    raise ValueError
\ No newline at end of file
+    raise ValueError
+
+USERINFO_NAMESPACE = "userinfo"
+
+
+async def userinfo_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Optional[tuple[Any, ...]] = None,
+    kwargs: Optional[dict[str, Any]] = None,
+) -> str:
+    """
+    Keys a userinfo response by the subject and the scope set of the token.
+
+    The response only depends on the claims of the subject and the scopes,
+    so tokens of one user with the same scopes share the entry. The token
+    was verified by the authorization middleware, its claims come from the
+    verified token cache. The subject leads the key, so
+    `invalidate_userinfo` can drop every response of the user.
+    """
+    if request is None:
+        raise ValueError
+    token = request.headers.get("authorization") or request.headers.get(
+        "auth-swagger"
+    )
+    if token is None:
+        raise ValueError
+    decoded_token = await JWTService().decode_token_no_aud_iss_check(token)
+    scope = decoded_token.get("scope") or ""
+    if isinstance(scope, str):
+        scope = scope.split()
+    scope_digest = hashlib.sha256(
+        " ".join(sorted(set(scope))).encode()
+    ).hexdigest()
+    return f"{namespace}:{decoded_token.get('sub')}:{func.__name__}:{scope_digest}"
+
+
+async def invalidate_userinfo(user_id: Optional[int] = None) -> None:
+    """
+    Drops the cached claims and userinfo responses of the user, of every
+    user if none is given. Call it after the change is committed.
+    """
+    await user_claims_cache.publish_invalidation(user_id)
+    namespace = USERINFO_NAMESPACE
+    if user_id is not None:
+        namespace = f"{namespace}:{user_id}"
+    try:
+        await FastAPICache.clear(namespace=namespace)
+    except Exception:
+        logger.warning(
+            f"Can not drop the cached userinfo of {namespace}:", exc_info=True
+        )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from src.config.settings.cache_time import CacheTimeSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StaticDocument:
+    """JSON document serialized once, together with its strong ETag."""
+
+    body: bytes
+    etag: str
+    version: Hashable
+    built_at: float
+
+    @classmethod
+    def from_content(cls, content: Any, version: Hashable) -> StaticDocument:
+        body = json.dumps(content, separators=(",", ":")).encode()
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()}"',
+            version=version,
+            built_at=time.monotonic(),
+        )
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Checks an If-None-Match header against the ETag of the document."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in tags
+
+
+class StaticDocumentCache:
+    """
+    Documents of the process served as pre-serialized bytes.
+
+    A document is rebuilt when its version changes (e.g. the set of
+    published signing keys), when it is invalidated (e.g. by the admin UI)
+    or once it is `max_age` seconds old, which bounds the time other worker
+    processes serve a document invalidated elsewhere.
+    """
+
+    def __init__(self, max_age: int) -> None:
+        self.max_age = max_age
+        self._documents: dict[str, StaticDocument] = {}
+
+    async def get(
+        self,
+        name: str,
+        build: Callable[[], Awaitable[Any]],
+        version: Hashable = None,
+    ) -> StaticDocument:
+        document = self._documents.get(name)
+        if (
+            document is None
+            or document.version != version
+            or time.monotonic() - document.built_at >= self.max_age
+        ):
+            document = StaticDocument.from_content(await build(), version)
+            self._documents[name] = document
+            logger.info(f"Document {name} rebuilt, ETag {document.etag}.")
+        return document
+
+    def invalidate(self, *names: str) -> None:
+        """Drops the named documents, or every document if none is named."""
+        if not names:
+            self._documents.clear()
+        for name in names:
+            self._documents.pop(name, None)
+
+
+well_known_documents = StaticDocumentCache(
+    max_age=CacheTimeSettings.WELL_KNOWN_REBUILD
+)
@@ -16,3 +16,19 @@ class InvalidClientCredentialsError(Exception):
 
 class InvalidPkceCodeError(Exception):
     ...
+
+
+class AuthorizationPendingError(Exception):
+    ...
+
+
+class SlowDownError(Exception):
+    ...
+
+
+class AccessDeniedError(Exception):
+    ...
+
+
+class ExpiredTokenError(Exception):
+    ...
@@ -60,10 +60,7 @@ class TokenServiceFactory:
         if grant_type == 'authorization_code':
             return AuthorizationCodeTokenService(
                 session=self._session,
-                grant_validator=ValidatePersistentGrant(persistent_grant_repo=self._persistent_grant_repo),
-                redirect_uri_validator=ValidateRedirectUri(client_repo=self._client_repo),
                 client_validator=ClientIdValidator(client_repo=self._client_repo),
-                code_validator=ValidateGrantByClient(persistent_grant_repo=self._persistent_grant_repo),
                 grant_exp_validator=ValidateGrantExpired(),
                 pkce_code_validator=ValidatePKCECode(code_challenge_repo=self._code_challenge_repo),
                 jwt_manager=self._jwt_manager,
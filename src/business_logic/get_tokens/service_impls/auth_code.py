@@ -3,7 +3,9 @@ import time
 import uuid
 from typing import TYPE_CHECKING
 
+from src.business_logic.cache.introspection import introspection_cache
 from src.business_logic.get_tokens.dto import RequestTokenModel, ResponseTokenModel
+from src.business_logic.get_tokens.errors import InvalidGrantError, InvalidRedirectUriError
 from src.business_logic.jwt_manager.dto import (
     AccessTokenPayload,
     RefreshTokenPayload,
@@ -14,6 +16,7 @@ from src.dyna_config import DOMAIN_NAME
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from src.business_logic.common.interfaces import ValidatorProtocol
+    from src.business_logic.get_tokens.validators import ValidatePKCECode
     from src.business_logic.jwt_manager.interfaces import JWTManagerProtocol
     from src.data_access.postgresql.repositories import PersistentGrantRepository
 
@@ -27,20 +30,14 @@ class AuthorizationCodeTokenService:
     def __init__(
             self,
             session: AsyncSession,
-            grant_validator: ValidatorProtocol,
-            redirect_uri_validator: ValidatorProtocol,
             client_validator: ValidatorProtocol,
-            code_validator: ValidatorProtocol,
             grant_exp_validator: ValidatorProtocol,
-            pkce_code_validator: ValidatorProtocol,
+            pkce_code_validator: ValidatePKCECode,
             jwt_manager: JWTManagerProtocol,
             persistent_grant_repo: PersistentGrantRepository
     ) -> None:
         self._session = session
-        self._grant_validator = grant_validator
-        self._redirect_uri_validator = redirect_uri_validator
         self._client_validator = client_validator
-        self._code_validator = code_validator
         self._grant_expiration_validator = grant_exp_validator
         self._pkce_code_validator = pkce_code_validator
         self._jwt_manager = jwt_manager
@@ -48,41 +45,62 @@ class AuthorizationCodeTokenService:
         
 
     async def get_tokens(self, request_data: RequestTokenModel) -> ResponseTokenModel:
-        await self._client_validator(request_data.client_id)
-        await self._code_validator(request_data.code, request_data.client_id, request_data.grant_type)
-        await self._grant_validator(request_data.code, request_data.grant_type)
-        await self._redirect_uri_validator(request_data.redirect_uri, request_data.client_id)
-
-        grant = await self._persistent_grant_repo.get_grant(
-            grant_type=request_data.grant_type, 
-            grant_data=request_data.code
+        if request_data.code is None or request_data.client_id is None:
+            await self._client_validator(request_data.client_id)
+            raise InvalidGrantError('Invalid data provided.')
+        # Grant, client, redirect uri and code challenge come in one query.
+        resolved = await self._persistent_grant_repo.resolve_authorization_code(
+            grant_data=request_data.code,
+            grant_type=request_data.grant_type,
+            client_id=request_data.client_id,
+            redirect_uri=request_data.redirect_uri,
         )
+        if resolved is None:
+            # Tells an unknown client apart from a wrong code.
+            await self._client_validator(request_data.client_id)
+            raise InvalidGrantError('Invalid data provided.')
+        if not resolved.redirect_uri_matches:
+            raise InvalidRedirectUriError
 
+        grant = resolved.grant
         await self._grant_expiration_validator(grant.expiration)
-        await self._pkce_code_validator(request_data.client_id, request_data.code_verifier)
+        await self._pkce_code_validator.validate(
+            client_id=request_data.client_id,
+            code_verifier=request_data.code_verifier,
+            code_challenge=resolved.code_challenge,
+            code_challenge_method=resolved.code_challenge_method,
+        )
 
         user_id = grant.user_id
         current_unix_time = int(time.time())
         aud = grant.scope.split(' ') + [request_data.client_id]
-        access_token = await self._get_access_token(
-            request_data=request_data,
-            user_id=user_id,
-            unix_time=current_unix_time,
-            aud=aud
-        )
-        refresh_token = await self._get_refresh_token(request_data=request_data)
-        id_token = await self._get_id_token(
-            request_data=request_data,
-            user_id=user_id,
-            unix_time=current_unix_time
+        access_token, refresh_token, id_token = await self._jwt_manager.encode_many(
+            payloads=[
+                self._get_access_token_payload(
+                    request_data=request_data,
+                    user_id=user_id,
+                    unix_time=current_unix_time,
+                    aud=aud
+                ),
+                self._get_refresh_token_payload(request_data=request_data),
+                self._get_id_token_payload(
+                    request_data=request_data,
+                    user_id=user_id,
+                    unix_time=current_unix_time
+                ),
+            ],
+            algorithm='RS256'
         )
         scope = ' '.join(aud)
         await self._persistent_grant_repo.delete_grant(grant=grant)
+        await introspection_cache.invalidate(grant.grant_data)
         await self._persistent_grant_repo.create_grant(
             client_id=grant.client_id, 
             grant_data=refresh_token,
             user_id=user_id,
-            grant_type_id=2,
+            grant_type_id=await self._persistent_grant_repo.get_type_id(
+                "refresh_token"
+            ),
             expiration_time=current_unix_time + 84700,
             scope=scope
         )
@@ -97,7 +115,7 @@ class AuthorizationCodeTokenService:
             refresh_expires_in=1800
         )
 
-    async def _get_access_token(self, request_data: RequestTokenModel, user_id: int, unix_time: int, aud: list[str]) -> str:
+    def _get_access_token_payload(self, request_data: RequestTokenModel, user_id: int, unix_time: int, aud: list[str]) -> AccessTokenPayload:
         payload = AccessTokenPayload(
             sub=user_id,
             iss=DOMAIN_NAME,
@@ -108,15 +126,15 @@ class AuthorizationCodeTokenService:
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256')
+        return payload
 
-    async def _get_refresh_token(self, request_data: RequestTokenModel) -> str:
+    def _get_refresh_token_payload(self, request_data: RequestTokenModel) -> RefreshTokenPayload:
         payload = RefreshTokenPayload(
             jti=str(uuid.uuid4())
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256') 
+        return payload
 
-    async def _get_id_token(self, request_data: RequestTokenModel, user_id: int, unix_time: int) -> str:
+    def _get_id_token_payload(self, request_data: RequestTokenModel, user_id: int, unix_time: int) -> IdTokenPayload:
         payload = IdTokenPayload(
             sub=user_id,
             iss=DOMAIN_NAME,
@@ -126,4 +144,4 @@ class AuthorizationCodeTokenService:
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256')
+        return payload
@@ -60,4 +60,4 @@ class ClientCredentialsTokenService:
             jti=str(uuid.uuid4()),
             acr=0
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256')
+        return await self._jwt_manager.encode(payload=payload, algorithm='RS256')
@@ -1,12 +1,28 @@
 from __future__ import annotations
 import time
 import uuid
+from src.business_logic.cache.introspection import introspection_cache
 from src.business_logic.get_tokens.dto import RequestTokenModel, ResponseTokenModel
+from src.business_logic.get_tokens.errors import (
+    AccessDeniedError,
+    AuthorizationPendingError,
+    ExpiredTokenError,
+    InvalidGrantError,
+    SlowDownError,
+)
 from src.business_logic.jwt_manager.dto import (
     AccessTokenPayload,
     IdTokenPayload,
     RefreshTokenPayload
 )
+from src.data_access.redis import device_polling
+from src.data_access.redis.device_polling import (
+    APPROVED,
+    DENIED,
+    EXPIRED,
+    PENDING,
+    SLOW_DOWN,
+)
 from src.dyna_config import DOMAIN_NAME
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -16,6 +32,14 @@ if TYPE_CHECKING:
     from src.data_access.postgresql.repositories import PersistentGrantRepository
 
 
+POLLING_ERRORS = {
+    PENDING: AuthorizationPendingError,
+    SLOW_DOWN: SlowDownError,
+    DENIED: AccessDeniedError,
+    EXPIRED: ExpiredTokenError,
+}
+
+
 class DeviceCodeTokenService:
     def __init__(
             self,
@@ -37,7 +61,22 @@ class DeviceCodeTokenService:
 
     async def get_tokens(self, request_data: RequestTokenModel) -> ResponseTokenModel:
         await self._client_validator(request_data.client_id)
-        await self._device_code_validator(request_data.device_code, request_data.client_id, request_data.grant_type)
+        if request_data.device_code is None or request_data.client_id is None:
+            raise InvalidGrantError('Invalid data provided.')
+        # Pending, throttled, denied and expired codes are answered from the
+        # ephemeral store, the database is only read for approved codes.
+        status = None
+        if device_polling is not None:
+            status = await device_polling.poll(request_data.device_code, request_data.client_id)
+            if status in POLLING_ERRORS:
+                raise POLLING_ERRORS[status]
+        try:
+            await self._device_code_validator(request_data.device_code, request_data.client_id, request_data.grant_type)
+        except InvalidGrantError:
+            # The approval is recorded before the grant is committed.
+            if status == APPROVED:
+                raise AuthorizationPendingError
+            raise
         await self._redirect_uri_validator(request_data.redirect_uri, request_data.client_id)
 
         grant = await self._persistent_grant_repo.get_grant(
@@ -50,20 +89,30 @@ class DeviceCodeTokenService:
         user_id = grant.user_id
         current_unix_time = int(time.time())
         aud = grant.scope
-        access_token = await self._get_access_token(request_data=request_data, user_id=user_id, unix_time=current_unix_time, aud=aud)
-        refresh_token = await self._get_refresh_token(request_data=request_data)
-        id_token = await self._get_id_token(request_data=request_data, user_id=user_id, unix_time=current_unix_time)
+        access_token, refresh_token, id_token = await self._jwt_manager.encode_many(
+            payloads=[
+                self._get_access_token_payload(request_data=request_data, user_id=user_id, unix_time=current_unix_time, aud=aud),
+                self._get_refresh_token_payload(request_data=request_data),
+                self._get_id_token_payload(request_data=request_data, user_id=user_id, unix_time=current_unix_time),
+            ],
+            algorithm='RS256'
+        )
 
         await self._persistent_grant_repo.delete_grant(grant=grant)
+        await introspection_cache.invalidate(grant.grant_data)
         await self._persistent_grant_repo.create_grant(
             client_id=grant.client_id, 
             grant_data=refresh_token,
             user_id=user_id,
-            grant_type_id=2,
+            grant_type_id=await self._persistent_grant_repo.get_type_id(
+                "refresh_token"
+            ),
             expiration_time=current_unix_time + 84700,
             scope=aud
         )
         await self._session.commit()
+        if device_polling is not None:
+            await device_polling.finish(request_data.device_code)
 
         return ResponseTokenModel(
             access_token=access_token,
@@ -74,7 +123,7 @@ class DeviceCodeTokenService:
             refresh_expires_in=1800
         )
 
-    async def _get_access_token(self, request_data: RequestTokenModel, user_id: int, unix_time: int, aud:list[str]) -> str:
+    def _get_access_token_payload(self, request_data: RequestTokenModel, user_id: int, unix_time: int, aud:list[str]) -> AccessTokenPayload:
         payload = AccessTokenPayload(
             sub=user_id,
             iss=DOMAIN_NAME,
@@ -85,15 +134,15 @@ class DeviceCodeTokenService:
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256')
+        return payload
 
-    async def _get_refresh_token(self, request_data: RequestTokenModel) -> str:
+    def _get_refresh_token_payload(self, request_data: RequestTokenModel) -> RefreshTokenPayload:
         payload = RefreshTokenPayload(
             jti=str(uuid.uuid4())
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256') 
+        return payload
 
-    async def _get_id_token(self, request_data: RequestTokenModel, user_id: int, unix_time: int) -> str:
+    def _get_id_token_payload(self, request_data: RequestTokenModel, user_id: int, unix_time: int) -> IdTokenPayload:
         payload = IdTokenPayload(
             sub=user_id,
             iss=DOMAIN_NAME,
@@ -103,4 +152,4 @@ class DeviceCodeTokenService:
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256')
+        return payload
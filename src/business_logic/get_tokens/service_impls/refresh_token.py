@@ -51,12 +51,17 @@ class RefreshTokenGrantService:
         user_id = grant.user_id
         current_unix_time = int(time.time())
 
-        access_token = await self._get_access_token(
-            request_data=request_data, user_id=user_id,
-            unix_time=current_unix_time,
-            aud=grant.scope.split(' ')
+        access_token, id_token = await self._jwt_manager.encode_many(
+            payloads=[
+                self._get_access_token_payload(
+                    request_data=request_data, user_id=user_id,
+                    unix_time=current_unix_time,
+                    aud=grant.scope.split(' ')
+                ),
+                self._get_id_token_payload(request_data=request_data, user_id=user_id, unix_time=current_unix_time),
+            ],
+            algorithm='RS256'
         )
-        id_token = await self._get_id_token(request_data=request_data, user_id=user_id, unix_time=current_unix_time)
         
         return ResponseTokenModel(
             access_token=access_token,
@@ -67,7 +72,7 @@ class RefreshTokenGrantService:
             refresh_expires_in=1800
         )
 
-    async def _get_access_token(self, request_data: RequestTokenModel, user_id: int, unix_time: int, aud = list[str]) -> str:
+    def _get_access_token_payload(self, request_data: RequestTokenModel, user_id: int, unix_time: int, aud = list[str]) -> AccessTokenPayload:
         payload = AccessTokenPayload(
             sub=user_id,
             iss=DOMAIN_NAME,
@@ -78,9 +83,9 @@ class RefreshTokenGrantService:
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256')
+        return payload
 
-    async def _get_id_token(self, request_data: RequestTokenModel, user_id: int, unix_time: int) -> str:
+    def _get_id_token_payload(self, request_data: RequestTokenModel, user_id: int, unix_time: int) -> IdTokenPayload:
         payload = IdTokenPayload(
             sub=user_id,
             iss=DOMAIN_NAME,
@@ -91,4 +96,4 @@ class RefreshTokenGrantService:
             jti=str(uuid.uuid4()),
             acr=0,
         )
-        return self._jwt_manager.encode(payload=payload, algorithm='RS256')
+        return payload
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import base64
 import hashlib
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from sqlalchemy.exc import NoResultFound
 from cryptography.fernet import Fernet
 
@@ -30,8 +30,22 @@ class ValidatePKCECode:
         except NoResultFound:
             code_challenge = None
             code_challenge_method = None
-        
+
+        await self.validate(client_id, code_verifier, code_challenge, code_challenge_method)
+
+    async def validate(
+            self,
+            client_id: str,
+            code_verifier: Optional[str],
+            code_challenge: Optional[str],
+            code_challenge_method: Optional[str],
+    ) -> None:
+        """
+        Checks the verifier against an already loaded code challenge.
+        """
         if code_challenge:
+            if code_verifier is None:
+                raise InvalidPkceCodeError
             if code_challenge_method == "plain":
                 if code_verifier != code_challenge:
                     raise InvalidPkceCodeError
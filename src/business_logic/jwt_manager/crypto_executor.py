@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import jwt
+from jwt.algorithms import get_default_algorithms
+from jwt.utils import base64url_encode
+
+from src.config.rsa_keys import rsa_key_cache
+from src.dyna_config import (
+    CRYPTO_EXECUTOR_MODE,
+    CRYPTO_MAX_QUEUE_SIZE,
+    CRYPTO_MAX_WORKERS,
+)
+from src.metrics import (
+    CRYPTO_EXECUTOR_QUEUE_DEPTH,
+    CRYPTO_EXECUTOR_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+INLINE = "inline"
+THREAD = "thread"
+PROCESS = "process"
+EXECUTION_MODES = (INLINE, THREAD, PROCESS)
+
+
+def sign_token(
+    payload: dict[str, Any],
+    private_key: bytes,
+    algorithm: str,
+    headers: Optional[dict[str, Any]] = None,
+) -> str:
+    """Signs the payload with the PEM encoded private key."""
+    return jwt.encode(
+        payload=payload,
+        key=rsa_key_cache.get_private_key(private_key),
+        algorithm=algorithm,
+        headers=headers,
+    )
+
+
+def sign_tokens(
+    payloads: list[dict[str, Any]],
+    private_key: bytes,
+    algorithm: str,
+    kid: Optional[str] = None,
+) -> list[str]:
+    """
+    Signs several payloads with the PEM encoded private key in one pass.
+
+    The header segment and the prepared signing key are shared by every
+    token; the output is byte for byte what `sign_token` would produce.
+    """
+    signer = get_default_algorithms()[algorithm]
+    key = signer.prepare_key(rsa_key_cache.get_private_key(private_key))
+    header = {"alg": algorithm, "typ": "JWT"}
+    if kid is not None:
+        header["kid"] = kid
+    header_segment = base64url_encode(
+        json.dumps(
+            header,
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode()
+    )
+
+    tokens = []
+    for payload in payloads:
+        payload_segment = base64url_encode(
+            json.dumps(payload, separators=(",", ":")).encode()
+        )
+        signing_input = header_segment + b"." + payload_segment
+        signature = base64url_encode(signer.sign(signing_input, key))
+        tokens.append((signing_input + b"." + signature).decode())
+    return tokens
+
+
+def verify_token(
+    token: str, public_key: bytes, algorithms: list[str], **kwargs: Any
+) -> dict[str, Any]:
+    """Verifies the token with the PEM encoded public key and returns its claims."""
+    return jwt.decode(
+        token,
+        key=rsa_key_cache.get_public_key(public_key),
+        algorithms=algorithms,
+        **kwargs,
+    )
+
+
+def verify_tokens(
+    tokens: list[str],
+    public_keys: list[bytes],
+    algorithms: list[str],
+    **kwargs: Any,
+) -> list[Optional[dict[str, Any]]]:
+    """
+    Verifies several tokens, each with its PEM encoded public key, in one job.
+
+    Returns the claims in the order of the tokens, None for a token that
+    is expired or otherwise invalid.
+    """
+    results: list[Optional[dict[str, Any]]] = []
+    for token, public_key in zip(tokens, public_keys):
+        try:
+            results.append(
+                verify_token(token, public_key, algorithms, **kwargs)
+            )
+        except jwt.PyJWTError:
+            results.append(None)
+    return results
+
+
+def _timed_call(
+    submitted_at: float, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> tuple[float, T]:
+    # time.monotonic is system wide, so it can be compared across processes.
+    waited = time.monotonic() - submitted_at
+    return waited, func(*args, **kwargs)
+
+
+class CryptoExecutor:
+    """
+    Runs CPU bound signing and verification jobs.
+
+    Depending on the mode the job runs on the event loop ("inline"), on a
+    thread pool ("thread") or on a process pool ("process"). Pool modes
+    accept at most `max_queue_size` jobs at a time; further callers are
+    suspended until a slot is free, which keeps the pool queue bounded.
+    Jobs must be module level functions taking picklable arguments, so that
+    they can be sent to a process pool (see `sign_token`, `verify_token`).
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        max_workers: int,
+        max_queue_size: int,
+        name: str = "jwt",
+    ) -> None:
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown crypto executor mode: {mode}")
+        self.name = name
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == PROCESS:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"crypto-{self.name}",
+                )
+            logger.info(
+                f"Crypto executor {self.name} started: {self.mode} pool "
+                f"of {self.max_workers} workers."
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_queue_size)
+            self._slots_loop = loop
+        return self._slots
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if self.mode == INLINE:
+            return func(*args, **kwargs)
+
+        submitted_at = time.monotonic()
+        queue_depth = CRYPTO_EXECUTOR_QUEUE_DEPTH.labels(self.name, self.mode)
+        queue_depth.inc()
+        try:
+            async with self._get_slots():
+                loop = asyncio.get_running_loop()
+                waited, result = await loop.run_in_executor(
+                    self._get_executor(),
+                    functools.partial(
+                        _timed_call, submitted_at, func, *args, **kwargs
+                    ),
+                )
+        finally:
+            queue_depth.dec()
+
+        CRYPTO_EXECUTOR_WAIT_SECONDS.labels(self.name, self.mode).observe(
+            waited
+        )
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            logger.info(f"Crypto executor {self.name} stopped.")
+
+
+crypto_executor = CryptoExecutor(
+    mode=CRYPTO_EXECUTOR_MODE,
+    max_workers=CRYPTO_MAX_WORKERS,
+    max_queue_size=CRYPTO_MAX_QUEUE_SIZE,
+)
@@ -10,11 +10,16 @@ Payload = Union[AccessTokenPayload, RefreshTokenPayload, IdTokenPayload]
 
 
 class JWTManagerProtocol(Protocol):
-    def encode(self, payload: Payload, algorithm: str) -> str:
+    async def encode(self, payload: Payload, algorithm: str) -> str:
         raise NotImplementedError
     
-    def decode(self, token: str, audience: str,**kwargs: Any) -> dict[str, Any]:
+    async def encode_many(
+            self, payloads: list[Payload], algorithm: str, parallel: bool = False
+    ) -> list[str]:
+        raise NotImplementedError
+
+    async def decode(self, token: str, audience: str,**kwargs: Any) -> dict[str, Any]:
         raise NotImplementedError
     
-    def decode_token_no_aud_iss_check(self, token: str, **kwargs: Any) -> dict[str, Any]:
+    async def decode_token_no_aud_iss_check(self, token: str, **kwargs: Any) -> dict[str, Any]:
         raise NotImplementedError
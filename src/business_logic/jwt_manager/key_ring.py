@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+import jwt
+from jwt.exceptions import InvalidTokenError
+
+from src.business_logic.jwt_manager.key_store import (
+    DatabaseKeyStore,
+    FileKeyStore,
+    KeyStore,
+    MemoryKeyStore,
+)
+from src.config.rsa_keys import CreateRSAKeypair, RSAKeypair
+from src.dyna_config import (
+    KEY_RING_BACKEND,
+    KEY_RING_PATH,
+    KEY_RING_PUBLISH_AHEAD,
+    KEY_RING_RELOAD_INTERVAL,
+    KEY_RING_RETENTION,
+    KEY_RING_ROTATION_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownKeyError(InvalidTokenError):
+    """The token was signed by a key the key ring does not publish."""
+
+
+class KeyRingNotLoadedError(RuntimeError):
+    """The signing key was read before the key ring was loaded."""
+
+
+class RSAKeyRing:
+    """
+    RSA keys used to sign and verify tokens, shared through a `KeyStore`.
+
+    The newest key whose `not_before` has passed signs the tokens, every
+    key that has not expired verifies them and is published in the JWKS.
+    A rotation adds a key that is published `publish_ahead` seconds before
+    it starts signing and gives the replaced keys `retention` more seconds
+    of life. Workers reload the store every `reload_interval` seconds, and
+    at once when a token names a key they have not seen yet.
+    """
+
+    # Unknown kids trigger a reload at most this often.
+    MIN_RELOAD_INTERVAL = 5
+
+    def __init__(
+        self,
+        store: KeyStore,
+        rotation_interval: int,
+        publish_ahead: int,
+        retention: int,
+        reload_interval: int,
+    ) -> None:
+        self.store = store
+        self.rotation_interval = rotation_interval
+        self.publish_ahead = publish_ahead
+        self.retention = retention
+        self.reload_interval = reload_interval
+        self._keys: dict[str, RSAKeypair] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        # Lets a single coroutine of the event loop reload a stale ring.
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._refresh_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _is_published(key: RSAKeypair, now: float) -> bool:
+        return key.expires_at is None or key.expires_at > now
+
+    def _select_signing_key(
+        self, keys: list[RSAKeypair], now: float
+    ) -> Optional[RSAKeypair]:
+        active = [
+            key
+            for key in keys
+            if key.not_before <= now and self._is_published(key, now)
+        ]
+        if not active:
+            return None
+        return max(active, key=lambda key: key.not_before)
+
+    def _add_key(
+        self, keys: list[RSAKeypair], not_before: int
+    ) -> list[RSAKeypair]:
+        now = time.time()
+        new_key = CreateRSAKeypair().execute(not_before=not_before)
+        expires_at = new_key.not_before + self.retention
+        kept = []
+        for key in keys:
+            if not self._is_published(key, now):
+                continue
+            if key.expires_at is None or key.expires_at > expires_at:
+                key.expires_at = expires_at
+            kept.append(key)
+        logger.info(f"Signing key {new_key.kid} added to the key ring.")
+        return kept + [new_key]
+
+    def _ensure_signing_key(self, keys: list[RSAKeypair]) -> list[RSAKeypair]:
+        if self._select_signing_key(keys, time.time()) is not None:
+            return keys
+        return self._add_key(keys, not_before=int(time.time()))
+
+    def load(self) -> None:
+        """Reloads the keys, creating the first one if the store has none."""
+        with self._lock:
+            keys = self.store.load()
+            if self._select_signing_key(keys, time.time()) is None:
+                keys = self.store.update(self._ensure_signing_key)
+            self._keys = {key.kid: key for key in keys}
+            self._loaded_at = time.monotonic()
+
+    def rotate(self, force: bool = False) -> Optional[RSAKeypair]:
+        """
+        Adds a new key when the newest one is older than the rotation interval.
+
+        Returns the new key, or None if no rotation was due.
+        """
+        added: list[RSAKeypair] = []
+
+        def rotate_keys(keys: list[RSAKeypair]) -> list[RSAKeypair]:
+            now = int(time.time())
+            newest = max((key.not_before for key in keys), default=None)
+            if (
+                not force
+                and newest is not None
+                and newest + self.rotation_interval > now
+            ):
+                return keys
+            keys = self._add_key(
+                keys, not_before=now + self.publish_ahead if keys else now
+            )
+            added.append(keys[-1])
+            return keys
+
+        with self._lock:
+            keys = self.store.update(rotate_keys)
+            self._keys = {key.kid: key for key in keys}
+            self._loaded_at = time.monotonic()
+        return added[0] if added else None
+
+    def _is_stale(self, max_age: float) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= max_age
+        )
+
+    def _get_refresh_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._refresh_lock is None or self._refresh_loop is not loop:
+            self._refresh_lock = asyncio.Lock()
+            self._refresh_loop = loop
+        return self._refresh_lock
+
+    async def refresh(self, force: bool = False) -> None:
+        """
+        Reloads a stale ring, or any ring with `force`.
+
+        Concurrent callers wait for the reload in progress and use its
+        keys instead of reading the store again.
+        """
+        if not force and not self._is_stale(self.reload_interval):
+            return
+        loaded_at = self._loaded_at
+        async with self._get_refresh_lock():
+            if force:
+                if self._loaded_at != loaded_at:
+                    return
+            elif not self._is_stale(self.reload_interval):
+                return
+            await asyncio.to_thread(self.load)
+
+    @property
+    def signing_key(self) -> RSAKeypair:
+        """
+        The current signing key of the loaded ring.
+
+        Loading reads the key store, so it is never done here; the lifespan
+        loads the ring and async callers use `get_signing_key`.
+        """
+        key = self._select_signing_key(list(self._keys.values()), time.time())
+        if key is None:
+            raise KeyRingNotLoadedError(
+                "The key ring is not loaded, await get_signing_key() instead."
+            )
+        return key
+
+    def get_published_keys(self) -> list[RSAKeypair]:
+        now = time.time()
+        return sorted(
+            (
+                key
+                for key in self._keys.values()
+                if self._is_published(key, now)
+            ),
+            key=lambda key: key.not_before,
+            reverse=True,
+        )
+
+    async def get_signing_key(self) -> RSAKeypair:
+        await self.refresh()
+        if (
+            self._select_signing_key(list(self._keys.values()), time.time())
+            is None
+        ):
+            # load() guarantees that a signing key exists.
+            await self.refresh(force=True)
+        return self.signing_key
+
+    async def get_verification_key(self, kid: Optional[str]) -> RSAKeypair:
+        """
+        Returns the key to verify a token with the given "kid" header.
+
+        Tokens issued before the key ring existed carry no kid, they are
+        verified with the current signing key.
+        """
+        if kid is None:
+            return await self.get_signing_key()
+        await self.refresh()
+
+        key = self._keys.get(kid)
+        if key is None and self._is_stale(self.MIN_RELOAD_INTERVAL):
+            await self.refresh(force=True)
+            key = self._keys.get(kid)
+        if key is None or not self._is_published(key, time.time()):
+            raise UnknownKeyError(f"Unknown signing key: {kid}")
+        return key
+
+    async def get_token_key(self, token: str) -> RSAKeypair:
+        """Returns the key named by the "kid" header of the token."""
+        return await self.get_verification_key(
+            jwt.get_unverified_header(token).get("kid")
+        )
+
+    async def get_verification_keys(self) -> list[RSAKeypair]:
+        await self.refresh()
+        return self.get_published_keys()
+
+
+def create_key_store(backend: str) -> KeyStore:
+    if backend == "database":
+        return DatabaseKeyStore()
+    if backend == "file":
+        return FileKeyStore(path=KEY_RING_PATH)
+    if backend == "memory":
+        return MemoryKeyStore()
+    raise ValueError(f"Unknown key ring backend: {backend}")
+
+
+key_ring = RSAKeyRing(
+    store=create_key_store(KEY_RING_BACKEND),
+    rotation_interval=KEY_RING_ROTATION_INTERVAL,
+    publish_ahead=KEY_RING_PUBLISH_AHEAD,
+    retention=KEY_RING_RETENTION,
+    reload_interval=KEY_RING_RELOAD_INTERVAL,
+)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import sessionmaker
+
+from src.config.rsa_keys import RSAKeypair, rsa_key_cache
+from src.data_access.postgresql import get_database
+from src.data_access.postgresql.tables import SigningKey
+
+KeysUpdate = Callable[[list[RSAKeypair]], list[RSAKeypair]]
+
+
+class KeyStore:
+    """
+    Storage of the RSA signing keys shared by the workers using it.
+
+    `update` applies the function to the stored keys and saves its result
+    while holding a lock, so concurrent workers never create or rotate keys
+    at the same time.
+    """
+
+    def load(self) -> list[RSAKeypair]:
+        raise NotImplementedError
+
+    def update(self, func: KeysUpdate) -> list[RSAKeypair]:
+        raise NotImplementedError
+
+
+class MemoryKeyStore(KeyStore):
+    """Keys kept by the current process only, suitable for tests."""
+
+    def __init__(self) -> None:
+        self._keys: list[RSAKeypair] = []
+        self._lock = threading.Lock()
+
+    def load(self) -> list[RSAKeypair]:
+        return list(self._keys)
+
+    def update(self, func: KeysUpdate) -> list[RSAKeypair]:
+        with self._lock:
+            self._keys = func(list(self._keys))
+            return list(self._keys)
+
+
+class FileKeyStore(KeyStore):
+    """
+    Keys kept in a JSON file readable by the owner only.
+
+    Every worker of the host shares the file; updates are serialized by an
+    exclusive lock on a sibling ".lock" file and written atomically.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock_path = f"{path}.lock"
+
+    def load(self) -> list[RSAKeypair]:
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path) as file:
+            return [RSAKeypair.parse_obj(item) for item in json.load(file)]
+
+    def update(self, func: KeysUpdate) -> list[RSAKeypair]:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                keys = func(self.load())
+                self._save(keys)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return keys
+
+    def _save(self, keys: list[RSAKeypair]) -> None:
+        temp_path = f"{self.path}.tmp"
+        descriptor = os.open(
+            temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(descriptor, "w") as file:
+            json.dump([json.loads(key.json()) for key in keys], file)
+        os.replace(temp_path, self.path)
+
+
+class DatabaseKeyStore(KeyStore):
+    """
+    Keys kept in the signing_keys table, shared by every node.
+
+    Updates run in one transaction holding a PostgreSQL advisory lock.
+    """
+
+    LOCK_ID = 7638
+
+    def __init__(self, session_factory: Optional[sessionmaker] = None) -> None:
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> sessionmaker:
+        # Resolved on first use, the process Database may not exist yet.
+        if self._session_factory is None:
+            self._session_factory = get_database().sync_session_factory
+        return self._session_factory
+
+    @staticmethod
+    def _to_keypair(row: SigningKey) -> RSAKeypair:
+        public_key = row.public_key.encode()
+        numbers = rsa_key_cache.get_public_key(public_key).public_numbers()
+        return RSAKeypair(
+            private_key=row.private_key.encode(),
+            public_key=public_key,
+            n=numbers.n,
+            e=numbers.e,
+            kid=row.kid,
+            not_before=row.not_before,
+            expires_at=row.expires_at,
+        )
+
+    def load(self) -> list[RSAKeypair]:
+        with self.session_factory() as session:
+            rows = session.scalars(select(SigningKey)).all()
+            return [self._to_keypair(row) for row in rows]
+
+    def update(self, func: KeysUpdate) -> list[RSAKeypair]:
+        with self.session_factory() as session, session.begin():
+            session.execute(
+                text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                {"lock_id": self.LOCK_ID},
+            )
+            rows = {row.kid: row for row in session.scalars(select(SigningKey))}
+            keys = func([self._to_keypair(row) for row in rows.values()])
+
+            kept = {key.kid for key in keys}
+            for kid, row in rows.items():
+                if kid not in kept:
+                    session.delete(row)
+            for key in keys:
+                row = rows.get(key.kid)
+                if row is None:
+                    session.add(
+                        SigningKey(
+                            kid=key.kid,
+                            private_key=key.private_key.decode(),
+                            public_key=key.public_key.decode(),
+                            not_before=key.not_before,
+                            expires_at=key.expires_at,
+                        )
+                    )
+                else:
+                    row.expires_at = key.expires_at
+        return keys
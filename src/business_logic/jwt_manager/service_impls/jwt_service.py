@@ -1,8 +1,19 @@
 from __future__ import annotations
+import asyncio
 import logging
 import jwt
-from src.config.rsa_keys import RSAKeypair
-from src.di import Container
+from cryptography.hazmat.primitives.asymmetric.rsa import (
+    RSAPrivateKey,
+    RSAPublicKey,
+)
+from src.business_logic.jwt_manager.crypto_executor import (
+    crypto_executor,
+    sign_token,
+    sign_tokens,
+    verify_token,
+)
+from src.business_logic.jwt_manager.key_ring import key_ring
+from src.config.rsa_keys import RSAKeypair, rsa_key_cache
 from src.business_logic.jwt_manager.dto import (
     AccessTokenPayload,
     RefreshTokenPayload,
@@ -18,37 +29,94 @@ Payload = Union[AccessTokenPayload, RefreshTokenPayload, IdTokenPayload]
 
 
 class JWTManager:
-    def __init__(self, keys: RSAKeypair = Container().config().keys) -> None:
-        self.keys = keys
+    def __init__(self, keys: Optional[RSAKeypair] = None) -> None:
+        # Signs and verifies with this keypair instead of the key ring.
+        self._keys = keys
+        self.algorithms = ["RS256"]
+
+    @property
+    def keys(self) -> RSAKeypair:
+        # Never loads the key ring, raises KeyRingNotLoadedError before it
+        # is loaded.
+        return self._keys or key_ring.signing_key
+
+    @property
+    def private_key(self) -> RSAPrivateKey:
+        return rsa_key_cache.get_private_key(self.keys.private_key)
+
+    @property
+    def public_key(self) -> RSAPublicKey:
+        return rsa_key_cache.get_public_key(self.keys.public_key)
+
+    async def _get_signing_key(self) -> RSAKeypair:
+        return self._keys or await key_ring.get_signing_key()
 
-    def encode(self, payload: Payload, algorithm: str, secret: Optional[str] = None) -> str:
+    async def _get_public_key(self, token: str) -> bytes:
+        keys = self._keys or await key_ring.get_token_key(token)
+        return keys.public_key
+
+    async def encode(self, payload: Payload, algorithm: str, secret: Optional[str] = None) -> str:
         if secret:
-            key = secret
-        else:
-            key = self.keys.private_key
+            # HMAC signing is cheap, there is no point in leaving the loop.
+            return jwt.encode(
+                payload=payload.dict(exclude_none=True), key=secret, algorithm=algorithm
+            )
 
-        token = jwt.encode(
-            payload=payload.dict(exclude_none=True), key=key, algorithm=algorithm
+        keys = await self._get_signing_key()
+        token = await crypto_executor.run(
+            sign_token, payload.dict(exclude_none=True), keys.private_key, algorithm,
+            {"kid": keys.kid} if keys.kid else None,
         )
         return token
 
-    def decode(self, token: str, audience: Optional[str] = None, **kwargs: Any) -> dict[str, Any]:
+    async def encode_many(
+            self, payloads: list[Payload], algorithm: str, parallel: bool = False
+    ) -> list[str]:
+        """
+        Signs several payloads at once, the tokens are returned in the same order.
+
+        By default all tokens are signed by a single executor job, sharing the
+        header segment and the signing key. With `parallel` every token becomes
+        a job of its own, so they are signed concurrently by the pool workers.
+        """
+        keys = await self._get_signing_key()
+        kid = keys.kid or None
+        claims = [payload.dict(exclude_none=True) for payload in payloads]
+        if not parallel:
+            return await crypto_executor.run(
+                sign_tokens, claims, keys.private_key, algorithm, kid
+            )
+
+        signed = await asyncio.gather(
+            *(
+                crypto_executor.run(sign_tokens, [item], keys.private_key, algorithm, kid)
+                for item in claims
+            )
+        )
+        return [tokens[0] for tokens in signed]
+
+    async def decode(self, token: str, audience: Optional[str] = None, **kwargs: Any) -> dict[str, Any]:
         token = token.replace("Bearer ", "")
+        public_key = await self._get_public_key(token)
         if audience:
-            decoded_info = jwt.decode(token, key=self.keys.public_key, algorithms=self.algorithms,
-                                      audience=audience, **kwargs,)
+            decoded_info = await crypto_executor.run(
+                verify_token, token, public_key, self.algorithms,
+                audience=audience, **kwargs,
+            )
         else:
-            decoded_info = jwt.decode(token, key=self.keys.public_key, algorithms=self.algorithms,
-                                      **kwargs,)
+            decoded_info = await crypto_executor.run(
+                verify_token, token, public_key, self.algorithms, **kwargs,
+            )
 
         return decoded_info
     
     async def decode_token_no_aud_iss_check(self, token: str, **kwargs: Any) -> dict[str, Any]:
         token = token.replace("Bearer ", "")
-        decoded = jwt.decode(
+        decoded = await crypto_executor.run(
+            verify_token,
             token,
-            key=self.keys.public_key,
-            algorithms=["RS256"],
+            await self._get_public_key(token),
+            self.algorithms,
             options={"verify_aud":False, 'verify_iss':False},
             **kwargs,
         )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Union
+
+from jwt.exceptions import InvalidAudienceError, MissingRequiredClaimError
+
+from src.dyna_config import TOKEN_CACHE_ENABLED, TOKEN_CACHE_MAX_SIZE
+from src.metrics import VERIFIED_TOKEN_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+def validate_audience(
+    claims: dict[str, Any], audience: Optional[Union[str, Iterable[str]]]
+) -> None:
+    """Checks the "aud" claim the same way `jwt.decode` does."""
+    if audience is None:
+        if "aud" not in claims or not claims["aud"]:
+            return
+        raise InvalidAudienceError("Invalid audience")
+
+    if "aud" not in claims or not claims["aud"]:
+        raise MissingRequiredClaimError("aud")
+
+    audience_claims = claims["aud"]
+    if isinstance(audience_claims, str):
+        audience_claims = [audience_claims]
+    if not isinstance(audience_claims, list) or any(
+        not isinstance(claim, str) for claim in audience_claims
+    ):
+        raise InvalidAudienceError("Invalid claim format in token")
+
+    if isinstance(audience, str):
+        audience = [audience]
+    if all(aud not in audience_claims for aud in audience):
+        raise InvalidAudienceError("Audience doesn't match")
+
+
+class VerifiedTokenCache:
+    """
+    Size bounded LRU store of claims of tokens whose signature was verified.
+
+    Entries are keyed by the SHA-256 digest of the token and live until the
+    token's "exp", so a token presented again skips RSA verification. The
+    claims are stored without any audience check, callers validate the
+    audience themselves (see `validate_audience`). Tokens without "exp"
+    are never cached.
+    """
+
+    def __init__(self, max_size: int, enabled: bool = True) -> None:
+        self.max_size = max_size
+        self.enabled = enabled
+        self._entries: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        key = self._key(token)
+        claims = self._entries.get(key)
+        if claims is None:
+            VERIFIED_TOKEN_CACHE_REQUESTS.labels("miss").inc()
+            return None
+        if claims["exp"] <= time.time():
+            del self._entries[key]
+            VERIFIED_TOKEN_CACHE_REQUESTS.labels("miss").inc()
+            return None
+
+        self._entries.move_to_end(key)
+        VERIFIED_TOKEN_CACHE_REQUESTS.labels("hit").inc()
+        return dict(claims)
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        if not self.enabled or not isinstance(claims.get("exp"), int):
+            return
+
+        key = self._key(token)
+        self._entries[key] = dict(claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        self._entries.pop(self._key(token.replace("Bearer ", "")), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_token_cache = VerifiedTokenCache(
+    max_size=TOKEN_CACHE_MAX_SIZE, enabled=TOKEN_CACHE_ENABLED
+)
@@ -0,0 +1 @@
+from .hashers import HASHERS, BcryptHasher, PasswordHasher, PBKDF2Hasher
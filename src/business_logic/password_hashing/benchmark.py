@@ -0,0 +1,79 @@
+"""
+Measures the password verification latency of every cost on this host.
+
+    python -m src.business_logic.password_hashing.benchmark --target 0.25
+
+Pick the highest cost whose median stays under the login latency budget
+and set it in the [password_hashing] settings.
+"""
+import argparse
+import statistics
+import time
+
+from src.business_logic.password_hashing.hashers import (
+    HASHERS,
+    BcryptHasher,
+    PasswordHasher,
+    PBKDF2Hasher,
+)
+
+DEFAULT_COSTS = {
+    BcryptHasher.algorithm: [10, 11, 12, 13, 14],
+    PBKDF2Hasher.algorithm: [200_000, 400_000, 600_000, 1_000_000],
+}
+PASSWORD = b"benchmark-password"
+
+
+def measure(hasher: PasswordHasher, samples: int) -> list[float]:
+    hash_password = hasher.hash(PASSWORD)
+    durations = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        hasher.verify(PASSWORD, hash_password)
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+def run(algorithm: str, costs: list[int], samples: int, target: float) -> None:
+    hasher_class = type(HASHERS[algorithm])
+    best = None
+    print(f"{'algorithm':<15}{'cost':>10}{'median ms':>12}{'max ms':>10}")
+    for cost in costs:
+        durations = measure(hasher_class(cost=cost), samples)
+        median = statistics.median(durations)
+        print(
+            f"{algorithm:<15}{cost:>10}"
+            f"{median * 1000:>12.1f}{max(durations) * 1000:>10.1f}"
+        )
+        if median <= target:
+            best = cost
+    if best is None:
+        print(f"No cost verifies within {target * 1000:.0f} ms.")
+    else:
+        print(f"Highest cost within {target * 1000:.0f} ms: {best}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--algorithm", choices=sorted(HASHERS), default=BcryptHasher.algorithm
+    )
+    parser.add_argument("--costs", type=int, nargs="+")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument(
+        "--target",
+        type=float,
+        default=0.25,
+        help="Verification latency budget in seconds.",
+    )
+    args = parser.parse_args()
+    run(
+        algorithm=args.algorithm,
+        costs=args.costs or DEFAULT_COSTS[args.algorithm],
+        samples=args.samples,
+        target=args.target,
+    )
+
+
+if __name__ == "__main__":
+    main()
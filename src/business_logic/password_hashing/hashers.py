@@ -0,0 +1,109 @@
+import base64
+import hashlib
+import hmac
+import os
+
+import bcrypt
+
+from src.dyna_config import (
+    PASSWORD_HASH_PBKDF2_ITERATIONS,
+    PASSWORD_HASH_ROUNDS,
+)
+
+
+class PasswordHasher:
+    """
+    One password hashing algorithm at a given cost.
+
+    Hashes are stored in the modular crypt format "$<scheme>$<cost>$...",
+    so the algorithm and the cost of a stored hash can always be told from
+    the hash itself.
+    """
+
+    algorithm: str
+
+    def __init__(self, cost: int) -> None:
+        self.cost = cost
+
+    def identify(self, hash_password: str) -> bool:
+        raise NotImplementedError
+
+    def get_cost(self, hash_password: str) -> int:
+        raise NotImplementedError
+
+    def needs_update(self, hash_password: str) -> bool:
+        return self.get_cost(hash_password) != self.cost
+
+    def hash(self, password: bytes) -> str:
+        raise NotImplementedError
+
+    def verify(self, password: bytes, hash_password: str) -> bool:
+        """Raises ValueError if the hash is malformed."""
+        raise NotImplementedError
+
+
+class BcryptHasher(PasswordHasher):
+    algorithm = "bcrypt"
+    PREFIXES = ("$2a$", "$2b$", "$2y$")
+    HASH_LENGTH = 60
+
+    def identify(self, hash_password: str) -> bool:
+        return hash_password.startswith(self.PREFIXES)
+
+    def get_cost(self, hash_password: str) -> int:
+        return int(hash_password[4:6])
+
+    def hash(self, password: bytes) -> str:
+        return bcrypt.hashpw(
+            password, bcrypt.gensalt(rounds=self.cost)
+        ).decode()
+
+    def verify(self, password: bytes, hash_password: str) -> bool:
+        # Some bcrypt builds panic instead of raising on a truncated hash.
+        if len(hash_password) != self.HASH_LENGTH:
+            raise ValueError("Invalid bcrypt hash length")
+        return bcrypt.checkpw(password, hash_password.encode())
+
+
+class PBKDF2Hasher(PasswordHasher):
+    """PBKDF2-HMAC-SHA256, "$pbkdf2-sha256$<iterations>$<salt>$<digest>"."""
+
+    algorithm = "pbkdf2_sha256"
+    PREFIX = "$pbkdf2-sha256$"
+    SALT_SIZE = 16
+
+    @staticmethod
+    def _encode(value: bytes) -> str:
+        return base64.urlsafe_b64encode(value).rstrip(b"=").decode()
+
+    @staticmethod
+    def _decode(value: str) -> bytes:
+        return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+    def identify(self, hash_password: str) -> bool:
+        return hash_password.startswith(self.PREFIX)
+
+    def get_cost(self, hash_password: str) -> int:
+        return int(hash_password.split("$")[2])
+
+    def hash(self, password: bytes) -> str:
+        salt = os.urandom(self.SALT_SIZE)
+        digest = hashlib.pbkdf2_hmac("sha256", password, salt, self.cost)
+        return (
+            f"{self.PREFIX}{self.cost}"
+            f"${self._encode(salt)}${self._encode(digest)}"
+        )
+
+    def verify(self, password: bytes, hash_password: str) -> bool:
+        _, _, iterations, salt, digest = hash_password.split("$")
+        expected = self._decode(digest)
+        actual = hashlib.pbkdf2_hmac(
+            "sha256", password, self._decode(salt), int(iterations)
+        )
+        return hmac.compare_digest(actual, expected)
+
+
+HASHERS = {
+    BcryptHasher.algorithm: BcryptHasher(cost=PASSWORD_HASH_ROUNDS),
+    PBKDF2Hasher.algorithm: PBKDF2Hasher(cost=PASSWORD_HASH_PBKDF2_ITERATIONS),
+}
@@ -137,7 +137,7 @@ class AdminUserService():
         await self.user_repo.create(**kwargs)
         
     async def change_password(self, user_id:int, new_password:str) -> None:
-        new_password = PasswordHash.hash_password(password=new_password)
+        new_password = await PasswordHash.hash_password(password=new_password)
         await self.user_repo.change_password(user_id=user_id, password = new_password)
     
 
@@ -169,7 +169,7 @@ class AdminUserService():
             )
         
         user_id = (await self.user_repo.get_user_by_email(email=email)).id
-        password_hashed = PasswordHash.hash_password(password=password)
+        password_hashed = await PasswordHash.hash_password(password=password)
         await self.user_repo.change_password(user_id=user_id, password=password_hashed)
         #if len([v for v in kwargs.values() if v is not None])>6:
         kwargs["birthdate"] = str(kwargs['birthdate'])
@@ -183,7 +183,7 @@ class AdminUserService():
 
     async def validate_password(self, email:str, password:str):
         user:User = await self.user_repo.get_user_by_email(email=email)
-        return PasswordHash.validate_password(str_password=password,hash_password=user.password_hash.value), user
+        return await PasswordHash.validate_password(str_password=password,hash_password=user.password_hash.value), user
     
     def user_to_dict(self, user:User)->dict[str, str]:
         user_data = user.__dict__
@@ -191,7 +191,7 @@ class AdminUserService():
             user_data[claim.claim_type.type_of_claim] = claim.claim_value
         return user_data
 
-    async def add_user_info(self, username:str, data:dict):
+    async def add_user_info(self, username:str, data:dict) -> int:
         user_id = (await self.user_repo.get_user_by_username(username=username)).id
         types = await self.user_repo.get_all_claim_types()
         claims = []
@@ -200,3 +200,4 @@ class AdminUserService():
                 claims.append({"user_id":user_id,"claim_type_id":types[key], "claim_value":data[key]})
         
         await self.user_repo.add_claims(claims=claims)
+        return user_id
@@ -30,7 +30,7 @@ class AdminAuthService:
         user_hash_password, user_id = await self.user_repo.get_hash_password(
             credentials.username
         )
-        self.password_service.validate_password(
+        await self.password_service.validate_password(
             credentials.password, 
             user_hash_password
         )
@@ -63,7 +63,7 @@ class AuthorizationService:
                 user_hash_password,
                 user_id,
             ) = await self.user_repo.get_hash_password(username)
-            validated = self.password_service.validate_password(
+            validated = await self.password_service.validate_password(
                 password, user_hash_password
             )
 
@@ -97,11 +97,14 @@ class AuthorizationService:
             return None
 
         secret_code = secrets.token_urlsafe(32)
-        await self.persistent_grant_repo.create(
+        await self.persistent_grant_repo.create_authorization_code(
             client_id=self.request_model.client_id,
-            grant_data=secret_code,
+            code=secret_code,
             user_id=user_id,
             scope=self.request_model.scope,
+            lifetime=await self.client_repo.get_auth_code_lifetime_by_client(
+                self.request_model.client_id
+            ),
         )
         return await self._update_redirect_url_with_params(
             secret_code=secret_code
@@ -195,7 +198,7 @@ class AuthorizationService:
         if self.request_model is None:
             return None
 
-        client = await self.client_repo.get_client_by_client_id(
+        client = await self.client_repo.get_client_metadata(
             client_id=client_id
         )
         return client
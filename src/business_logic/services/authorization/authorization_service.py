@@ -72,7 +72,7 @@ class AuthorizationService:
         hashed_password, user_id = await self.user_repo.get_hash_password(
             self.request_model.username
         )
-        self.password_service.validate_password(
+        await self.password_service.validate_password(
             self.request_model.password, hashed_password
         )
         return user_id
@@ -7,7 +7,7 @@ from src.data_access.postgresql.repositories.client import ClientRepository
 from src.data_access.postgresql.repositories.persistent_grant import (
     PersistentGrantRepository,
 )
-from src.data_access.postgresql.repositories import ClientRepository
+from src.data_access.postgresql.repositories import ClientRepository, LoadingProfile
 import secrets
 from src.presentation.api.models.registration import ClientRequestModel, ClientUpdateRequestModel
 from typing import Union
@@ -52,7 +52,11 @@ class ClientService:
         client_id, client_secret = await  self.generate_credentials()
         params = await self.get_params(client_id=client_id)
         await self.client_repo.create(params)
-        client_id_int = (await self.client_repo.get_client_by_client_id(client_id=client_id)).id
+        client_id_int = (
+            await self.client_repo.get_client_by_client_id(
+                client_id=client_id, profile=LoadingProfile.IDENTITY
+            )
+        ).id
         await self.client_repo.add_secret(client_id_int=client_id_int, value=client_secret)
         if not hasattr(self.request_model, 'scope') or self.request_model.scope == '':
             requested_scope = 'openid'
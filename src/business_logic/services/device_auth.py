@@ -10,6 +10,7 @@ from src.data_access.postgresql.repositories import (
     DeviceRepository,
 )
 from src.data_access.postgresql.errors.client import ClientNotFoundError
+from src.data_access.redis import device_polling
 from src.dyna_config import DOMAIN_NAME
 from src.presentation.api.models import (
     DeviceCancelModel,
@@ -58,11 +59,18 @@ class DeviceService:
                     "expires_in": device_code_lifetime,
                     "interval": 5,
                 }
+                expires_at = device_code_lifetime + int(time.time())
                 await self.device_repo.create(
                     client_id=self.request_model.client_id,
-                    **device_data
-                    | {"expires_in": device_code_lifetime + int(time.time())},
+                    **device_data | {"expires_in": expires_at},
                 )
+                if device_polling is not None:
+                    await device_polling.start(
+                        device_code=device_code,
+                        client_id=self.request_model.client_id,
+                        interval=device_data["interval"],
+                        expires_at=expires_at,
+                    )
 
                 return device_data
             else:
@@ -89,6 +97,12 @@ class DeviceService:
             raise ValueError
         if await self._validate_client(client_id=self.request_model.client_id):
             if await self._validate_user_code(user_code=user_code):
+                if device_polling is not None:
+                    await device_polling.deny(
+                        await self.device_repo.get_device_code_by_user_code(
+                            user_code=user_code
+                        )
+                    )
                 await self.device_repo.delete_by_user_code(user_code=user_code)
         else:
                 raise ClientNotFoundError
@@ -3,6 +3,7 @@ from src.data_access.postgresql.repositories.client import ClientRepository
 from src.data_access.postgresql.repositories.persistent_grant import (
     PersistentGrantRepository,
 )
+from src.business_logic.cache.introspection import introspection_cache
 from src.business_logic.services.jwt_token import JWTService
 from typing import Union, Optional, Any
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -60,6 +61,8 @@ class EndSessionService:
         await self.persistent_grant_repo.delete_persistent_grant_by_client_and_user_id(
             client_id=client_id, user_id=user_id
         )
+        # The deleted grants are not known by token, drop every response.
+        await introspection_cache.flush()
 
     async def _validate_logout_redirect_uri(
         self, client_id: str, logout_redirect_uri: str
@@ -1,6 +1,7 @@
 from typing import Any, Optional
 from fastapi import Request
 from jwt.exceptions import ExpiredSignatureError, PyJWTError
+from src.business_logic.cache.introspection import introspection_cache
 from src.data_access.postgresql.errors import TokenIncorrectError
 from src.business_logic.services.jwt_token import JWTService
 from src.data_access.postgresql.repositories.client import ClientRepository
@@ -11,9 +12,20 @@ from src.data_access.postgresql.repositories.user import UserRepository
 
 from src.presentation.api.models.introspection import (
     BodyRequestIntrospectionModel,
+    IntrospectionTokenModel,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Access tokens and authorization codes are active once their signature
+# is valid, other token types must have a persistent grant.
+ACCESS_TOKEN_TYPE_HINTS = (
+    "access-token",
+    "access_token",
+    "access",
+    "authorization_code",
+    "authorization-code",
+)
+
 
 class IntrospectionService:
     """A class that provides token introspection functionality. It allows authorized
@@ -110,8 +122,18 @@ class IntrospectionService:
         if self.request_body is None:
             raise TokenIncorrectError
 
-        decoded_token = {}
-        response: dict[str, Any] = {}
+        lookup = await introspection_cache.get(
+            self.request_body.token, self.request_body.token_type_hint
+        )
+        if lookup.response is not None:
+            return lookup.response
+        response = await self._analyze_token()
+        await introspection_cache.put(lookup, response)
+        return response
+
+    async def _analyze_token(self) -> dict[str, Any]:
+        if self.request_body is None:
+            raise TokenIncorrectError
 
         try:
             decoded_token = await self.jwt.decode_token_no_aud_iss_check(
@@ -121,71 +143,134 @@ class IntrospectionService:
             return {"active": False}
         except PyJWTError:
             raise TokenIncorrectError
-        else:
-            if self.request_body.token_type_hint in (
-                "access-token",
-                "access_token",
-                "access",
-                "authorization_code",
-                "authorization-code",
-            ):
-                response["active"] = True
-
-        if self.request_body.token_type_hint in (
-            "access-token",
-            "access_token",
-            "access",
-            "authorization_code",
-            "authorization-code",
-        ):
-            response["active"] = True
-
-        if not response:
-            if self.request_body.token_type_hint is None:
-                # If token type hint is not provided, check all grant types for the token
-                list_of_types = [
-                    token_type[0]
-                    for token_type in await self.persistent_grant_repo.get_all_types()
-                ]
 
-                for token_type in list_of_types:
-                    if await self.persistent_grant_repo.exists(
-                        grant_type=token_type,
-                        grant_data=self.request_body.token,
-                    ):
-                        # If the token exists for a grant type, update the token type hint and set the response as active
-                        self.request_body.token_type_hint = token_type
-                        response = {"active": True}
-                        break
-            else:
-                # Check if the token exists for the provided token type hint
-                exists = await self.persistent_grant_repo.exists(
-                    grant_type=self.request_body.token_type_hint,
-                    grant_data=self.request_body.token,
+        grant_types: list[str] = []
+        if self.request_body.token_type_hint not in ACCESS_TOKEN_TYPE_HINTS:
+            # Every grant type of the token is resolved by a single query.
+            grant_types = (
+                await self.persistent_grant_repo.get_grant_types_by_data(
+                    [self.request_body.token]
                 )
-                response = {"active": exists}
-
-        if response.get("active"):
-            # If response is "active", get other available parameters
-            response["iss"] = self.slice_url()
-            response["token_type"] = self.get_token_type()
-            response["username"] = await self.get_username(decoded_token)
-
-            for parameter in (
-                "sub",
-                "exp",
-                "iat",
-                "client_id",
-                "jti",
-                "aud",
-                "nbf",
-                "scope",
+            ).get(self.request_body.token, [])
+            if self.request_body.token_type_hint is None and grant_types:
+                self.request_body.token_type_hint = grant_types[0]
+
+        if not self.is_active(self.request_body.token_type_hint, grant_types):
+            return {"active": False}
+
+        response = self.get_active_response(decoded_token)
+        response["username"] = await self.get_username(decoded_token)
+        return response
+
+    async def analyze_tokens(
+        self, tokens: list[IntrospectionTokenModel]
+    ) -> list[dict[str, Any]]:
+        """Analyzes many tokens at once, see `analyze_token`.
+
+        The signatures are verified in bulk, the grants and the usernames of
+        all tokens are loaded by one query each. Tokens that are expired or
+        otherwise invalid are reported as inactive instead of failing the
+        whole batch.
+
+        Args:
+            tokens (list[IntrospectionTokenModel]): The tokens with their optional type hints.
+
+        Returns:
+            list[dict[str, Any]]: The introspection responses in the order of the tokens.
+        """
+        lookups = await introspection_cache.get_many(
+            [(item.token, item.token_type_hint) for item in tokens]
+        )
+        missing = [
+            (item, lookup)
+            for item, lookup in zip(tokens, lookups)
+            if lookup.response is None
+        ]
+        if missing:
+            computed = await self._analyze_tokens([item for item, _ in missing])
+            await introspection_cache.put_many(
+                [
+                    (lookup, response)
+                    for (_, lookup), response in zip(missing, computed)
+                ]
+            )
+            for (_, lookup), response in zip(missing, computed):
+                lookup.response = response
+        return [lookup.response for lookup in lookups]  # type: ignore
+
+    async def _analyze_tokens(
+        self, tokens: list[IntrospectionTokenModel]
+    ) -> list[dict[str, Any]]:
+        decoded_tokens = await self.jwt.decode_tokens_no_aud_iss_check(
+            [item.token for item in tokens]
+        )
+        grant_types = await self.persistent_grant_repo.get_grant_types_by_data(
+            item.token
+            for item, decoded_token in zip(tokens, decoded_tokens)
+            if decoded_token is not None
+            and item.token_type_hint not in ACCESS_TOKEN_TYPE_HINTS
+        )
+
+        responses: list[dict[str, Any]] = []
+        for item, decoded_token in zip(tokens, decoded_tokens):
+            if decoded_token is None or not self.is_active(
+                item.token_type_hint, grant_types.get(item.token, [])
             ):
-                try:
-                    response[parameter] = decoded_token.get(parameter)
-                except:
-                    pass
+                responses.append({"active": False})
+            else:
+                responses.append(self.get_active_response(decoded_token))
+
+        user_ids = [self.get_user_id(response) for response in responses]
+        usernames = await self.user_repo.get_usernames_by_ids(
+            user_id for user_id in user_ids if user_id is not None
+        )
+        for response, user_id in zip(responses, user_ids):
+            if response["active"] and user_id is not None:
+                response["username"] = usernames.get(user_id)
+        return responses
+
+    @staticmethod
+    def is_active(token_type_hint: Optional[str], grant_types: list[str]) -> bool:
+        """Checks the grants of a token with a valid signature against its type hint.
+
+        Args:
+            token_type_hint (Optional[str]): The type hint sent with the token.
+            grant_types (list[str]): The types of the grants issued with the token.
+
+        Returns:
+            bool: True if the token is active.
+        """
+        if token_type_hint in ACCESS_TOKEN_TYPE_HINTS:
+            return True
+        if token_type_hint is None:
+            return bool(grant_types)
+        return token_type_hint in grant_types
+
+    def get_active_response(self, decoded_token: dict[str, Any]) -> dict[str, Any]:
+        """Builds the response for an active token, without the username.
+
+        Args:
+            decoded_token (dict[str, Any]): The claims of the token.
 
+        Returns:
+            dict[str, Any]: The introspection response.
+        """
+        response: dict[str, Any] = {
+            "active": True,
+            "iss": self.slice_url(),
+            "token_type": self.get_token_type(),
+        }
+        for parameter in (
+            "sub",
+            "exp",
+            "iat",
+            "client_id",
+            "jti",
+            "aud",
+            "nbf",
+            "scope",
+        ):
+            response[parameter] = decoded_token.get(parameter)
         return response
 
     async def get_client_id(self) -> str:
@@ -227,6 +312,18 @@ class IntrospectionService:
         result = str(self.request.url).rsplit("/", 2)
         return result[0]
 
+    @staticmethod
+    def get_user_id(decoded_token: dict[str, Any]) -> Optional[int]:
+        """The user id held in the "sub" claim, None if there is none.
+
+        Returns:
+            Optional[int]: The user id.
+        """
+        try:
+            return int(decoded_token["sub"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
     async def get_username(self, decoded_token: dict) -> Optional[str]:
         """A helper method that retrieves the username from the token.
 
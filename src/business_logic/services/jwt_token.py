@@ -1,23 +1,62 @@
+import asyncio
 import logging
 
-import jwt
 from typing import Any, no_type_check, Optional
-from src.config.rsa_keys import RSAKeypair
-from src.di import Container
+from jwt.exceptions import PyJWTError
+from cryptography.hazmat.primitives.asymmetric.rsa import (
+    RSAPrivateKey,
+    RSAPublicKey,
+)
+from src.business_logic.jwt_manager.crypto_executor import (
+    crypto_executor,
+    sign_token,
+    verify_token,
+    verify_tokens,
+)
+from src.business_logic.jwt_manager.token_cache import (
+    validate_audience,
+    verified_token_cache,
+)
+from src.business_logic.jwt_manager.key_ring import key_ring
+from src.config.rsa_keys import RSAKeypair, rsa_key_cache
 
 logger = logging.getLogger(__name__)
 
 
 class JWTService:
-    def __init__(self, keys: RSAKeypair = Container().config().keys) -> None:
+    # Tokens verified by one executor job in `decode_tokens_no_aud_iss_check`.
+    VERIFY_CHUNK_SIZE = 100
+
+    def __init__(self, keys: Optional[RSAKeypair] = None) -> None:
         self.algorithm = "RS256"
         self.algorithms = ["RS256"]
-        self.keys = keys
+        # Signs and verifies with this keypair instead of the key ring.
+        self._keys = keys
+
+    @property
+    def keys(self) -> RSAKeypair:
+        # Never loads the key ring, raises KeyRingNotLoadedError before it
+        # is loaded.
+        return self._keys or key_ring.signing_key
+
+    async def _get_public_key(self, token: str) -> bytes:
+        keys = self._keys or await key_ring.get_token_key(token)
+        return keys.public_key
+
+    @property
+    def private_key(self) -> RSAPrivateKey:
+        return rsa_key_cache.get_private_key(self.keys.private_key)
+
+    @property
+    def public_key(self) -> RSAPublicKey:
+        return rsa_key_cache.get_public_key(self.keys.public_key)
 
     @no_type_check
     async def encode_jwt(self, payload: dict[str, Any] = {}, secret: None = None) -> str:
-        token = jwt.encode(
-            payload=payload, key=self.keys.private_key, algorithm=self.algorithm
+        keys = self._keys or await key_ring.get_signing_key()
+        token = await crypto_executor.run(
+            sign_token, payload, keys.private_key, self.algorithm,
+            {"kid": keys.kid} if keys.kid else None,
         )
 
         logger.info(f"Created token.")
@@ -28,21 +67,32 @@ class JWTService:
     async def decode_token(self, token: str, audience: str =None ,**kwargs: Any) -> dict[str, Any]:
 
         token = token.replace("Bearer ", "")
-        if audience:
-            decoded = jwt.decode(
+        if kwargs:
+            # Custom decode options can not be served from the cache.
+            return await crypto_executor.run(
+                verify_token,
                 token,
-                key=self.keys.public_key,
-                algorithms=self.algorithms,
+                await self._get_public_key(token),
+                self.algorithms,
                 audience=audience,
                 **kwargs,
             )
-            return decoded
-        decoded = jwt.decode(
-            token,
-            key=self.keys.public_key,
-            algorithms=self.algorithms,
-            **kwargs,
-        )
+
+        decoded = await self._get_verified_claims(token)
+        validate_audience(decoded, audience)
+        return decoded
+
+    async def _get_verified_claims(self, token: str) -> dict[str, Any]:
+        decoded = verified_token_cache.get(token)
+        if decoded is None:
+            decoded = await crypto_executor.run(
+                verify_token,
+                token,
+                await self._get_public_key(token),
+                self.algorithms,
+                options={"verify_aud": False},
+            )
+            verified_token_cache.put(token, decoded)
         return decoded
 
     async def verify_token(self, token: str, aud:str=None) -> bool:
@@ -56,20 +106,73 @@ class JWTService:
             return False
         
     async def get_module(self) -> int:
-        return self.keys.n
+        return (self._keys or await key_ring.get_signing_key()).n
 
     async def get_pub_key_expanent(self) -> int:
-        return self.keys.e
+        return (self._keys or await key_ring.get_signing_key()).e
 
     @no_type_check
     async def decode_token_no_aud_iss_check(self, token: str, **kwargs: Any) -> dict[str, Any]:
 
         token = token.replace("Bearer ", "")
-        decoded = jwt.decode(
+        if not kwargs:
+            # Issuer is never checked without kwargs, so cached claims fit.
+            return await self._get_verified_claims(token)
+
+        decoded = await crypto_executor.run(
+            verify_token,
             token,
-            key=self.keys.public_key,
-            algorithms=self.algorithms,
+            await self._get_public_key(token),
+            self.algorithms,
             options={"verify_aud":False, 'verify_iss':False},
             **kwargs,
         )
-        return decoded
\ No newline at end of file
+        return decoded
+
+    async def decode_tokens_no_aud_iss_check(
+        self, tokens: list[str]
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Verifies many tokens at once, without audience and issuer checks.
+
+        Tokens found in the verified token cache are not verified again, the
+        others are verified in chunks of VERIFY_CHUNK_SIZE, one executor job
+        per chunk. Returns the claims in the order of the tokens, None for a
+        token that is expired or otherwise invalid.
+        """
+        tokens = [token.replace("Bearer ", "") for token in tokens]
+        results: list[Optional[dict[str, Any]]] = [None] * len(tokens)
+        # Index and public key of every token missing from the cache.
+        pending: list[tuple[int, bytes]] = []
+        for index, token in enumerate(tokens):
+            decoded = verified_token_cache.get(token)
+            if decoded is not None:
+                results[index] = decoded
+                continue
+            try:
+                pending.append((index, await self._get_public_key(token)))
+            except PyJWTError:
+                pass
+
+        chunks = [
+            pending[start:start + self.VERIFY_CHUNK_SIZE]
+            for start in range(0, len(pending), self.VERIFY_CHUNK_SIZE)
+        ]
+        verified = await asyncio.gather(
+            *(
+                crypto_executor.run(
+                    verify_tokens,
+                    [tokens[index] for index, _ in chunk],
+                    [public_key for _, public_key in chunk],
+                    self.algorithms,
+                    options={"verify_aud": False},
+                )
+                for chunk in chunks
+            )
+        )
+        for chunk, chunk_results in zip(chunks, verified):
+            for (index, _), decoded in zip(chunk, chunk_results):
+                results[index] = decoded
+                if decoded is not None:
+                    verified_token_cache.put(tokens[index], decoded)
+        return results
@@ -1,30 +1,72 @@
-import bcrypt
+import logging
+import time
+from typing import Optional
 
+from src.business_logic.jwt_manager.crypto_executor import CryptoExecutor
+from src.business_logic.password_hashing import HASHERS, PasswordHasher
 from src.data_access.postgresql.errors import (
     WrongPasswordError,
     WrongPasswordFormatError,
 )
+from src.dyna_config import (
+    PASSWORD_HASH_ALGORITHM,
+    PASSWORD_HASH_MAX_CONCURRENCY,
+    PASSWORD_HASH_MAX_WORKERS,
+)
+from src.metrics import PASSWORD_HASH_SECONDS
 from pydantic import SecretStr
 
+logger = logging.getLogger(__name__)
+
+
+# bcrypt releases the GIL, so a thread pool runs hashes in parallel while
+# the event loop keeps serving other requests.
+password_executor = CryptoExecutor(
+    mode="thread",
+    max_workers=PASSWORD_HASH_MAX_WORKERS,
+    max_queue_size=PASSWORD_HASH_MAX_CONCURRENCY,
+    name="password",
+)
+
 
 class PasswordHash:
+    hasher: PasswordHasher = HASHERS[PASSWORD_HASH_ALGORITHM]
+
+    @classmethod
+    def identify_hasher(cls, hash_password: str) -> Optional[PasswordHasher]:
+        for hasher in HASHERS.values():
+            if hasher.identify(hash_password):
+                return hasher
+        return None
+
+    @classmethod
+    def needs_rehash(cls, hash_password: str) -> bool:
+        """
+        Tells whether the hash was made with another algorithm or cost than
+        the configured ones, so it should be replaced on the next login.
+        """
+        if not cls.hasher.identify(hash_password):
+            return True
+        return cls.hasher.needs_update(hash_password)
+
     @classmethod
-    def hash_password(cls, password: str) -> str:
+    async def hash_password(cls, password: str) -> str:
         if not isinstance(password, str):
             raise WrongPasswordFormatError("The password should be a string")
-        bts = password.encode("utf-8")
-        salt = bcrypt.gensalt()
-        hash_password = bcrypt.hashpw(bts, salt)
-
-        return str(hash_password).strip("b'")
+        started_at = time.perf_counter()
+        hash_password = await password_executor.run(
+            cls.hasher.hash, password.encode("utf-8")
+        )
+        PASSWORD_HASH_SECONDS.labels("hash").observe(
+            time.perf_counter() - started_at
+        )
+        return hash_password
 
     @classmethod
-    def validate_password(
+    async def validate_password(
         cls, str_password: SecretStr, hash_password: str
     ) -> bool:
-        str_password_bytes = str_password.get_secret_value().encode("utf-8")
-        hash_password_bytes = bytes(hash_password.encode())
-        is_valid = bcrypt.checkpw(str_password_bytes, hash_password_bytes)
+        is_valid = await cls.is_password_valid(str_password, hash_password)
         if not is_valid:
             raise WrongPasswordError(
                 "You are trying to pass the wrong password to the scope"
@@ -32,9 +74,24 @@ class PasswordHash:
         return is_valid
 
     @classmethod
-    def is_password_valid(
+    async def is_password_valid(
         cls, str_password: SecretStr, hash_password: str
     ) -> bool:
+        hasher = cls.identify_hasher(hash_password)
+        if hasher is None:
+            logger.warning("Password hash of an unknown format.")
+            return False
         str_password_bytes = str_password.get_secret_value().encode("utf-8")
-        hash_password_bytes = bytes(hash_password.encode())
-        return bcrypt.checkpw(str_password_bytes, hash_password_bytes)
+        started_at = time.perf_counter()
+        try:
+            is_valid = await password_executor.run(
+                hasher.verify, str_password_bytes, hash_password
+            )
+        except ValueError as exc:
+            # A malformed hash is a mismatch, not a server error.
+            logger.warning(f"Malformed {hasher.algorithm} password hash: {exc}")
+            return False
+        PASSWORD_HASH_SECONDS.labels("verify").observe(
+            time.perf_counter() - started_at
+        )
+        return is_valid
@@ -4,8 +4,6 @@ from fastapi import Request
 from typing import Any, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.data_access.postgresql.repositories.resources_related import ResourcesRepository
-from src.data_access.postgresql.tables.resources_related import ApiResource, ApiScope, ApiScopeClaim, ApiScopeClaim
-from src.data_access.postgresql.errors import ResourceNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +19,12 @@ class ScopeService:
 
     async def get_resource_api_description(self, scope:str) -> dict[str:str]:
         scope = scope.split('.')
-        resource = await self.resource_repo.get_by_name(name=scope[0])
-        result ={}
-        for api_scope in resource.api_scope:
-            if api_scope.name == scope[1]:
-                for scope_claim in api_scope.api_scope_claims:
-                    if scope[2]  == scope_claim.scope_claim_type.scope_claim_type:
-                        result[resource.display_name] = f'{api_scope.description} : {scope_claim.scope_claim_type.scope_claim_type}'
-                        return result
-        
+        catalog = await self.resource_repo.get_catalog()
+        resource = catalog.get_resource(scope[0])
+        api_scope = resource.scopes.get(scope[1])
+        if api_scope is not None and scope[2] in api_scope.claims:
+            return {resource.display_name: f'{api_scope.description} : {scope[2]}'}
+
         return {'Impossible':'Error'}
 
     async def get_scope_description(
@@ -125,64 +120,41 @@ class ScopeService:
         return aud_result
 
     async def get_all_scopes_of_resource_by_name(self, name:str) -> dict[str:str]:
-        if not await self.resource_repo.exists_by_name(name):
-            raise ResourceNotFoundError
-        resource = await self.resource_repo.get_by_name(name=name)
+        catalog = await self.resource_repo.get_catalog()
+        resource = catalog.get_resource(name)
         result ={}
-        for api_scope in resource.api_scope:
-            for scope_claim in api_scope.api_scope_claims:
-                result[f'{resource.name}:{api_scope.name}:{scope_claim.scope_claim_type.scope_claim_type}'] = api_scope.description
+        for api_scope in resource.scopes.values():
+            for full_name in api_scope.full_names:
+                result[full_name] = api_scope.description
         return result
     
     async def get_revoke_introspection_aud(self, name:str) -> dict[str:str]:
-        if not await self.resource_repo.exists_by_name(name):
-            raise ResourceNotFoundError
-        resource = await self.resource_repo.get_by_name(name=name)
+        catalog = await self.resource_repo.get_catalog()
+        resource = catalog.get_resource(name)
         result = []
-        for api_scope in resource.api_scope:
-            if api_scope.name == 'revoke':
-                result.append(f'{resource.name}:{api_scope.name}:{str(api_scope.api_scope_claims[0].scope_claim_type)}')
-            if api_scope.name == 'introspection':
-                result.append(f'{resource.name}:{api_scope.name}:{str(api_scope.api_scope_claims[0].scope_claim_type)}')
+        for api_scope in resource.scopes.values():
+            if api_scope.name in ('revoke', 'introspection'):
+                result.append(api_scope.full_names[0])
         return result
 
     async def get_ids(self, scopes:list[str]) -> dict[str:str]:
+        catalog = await self.resource_repo.get_catalog()
         result = []
         for scope in scopes:
             if ':' not in scope:
-                resource = await self.resource_repo.get_by_name(name='oidc')
-                sub_result ={'resource_id':resource.id}
-                for api_scope in resource.api_scope:
-                    api_scope:ApiScope
-                    if api_scope.name == 'userinfo':
-                        sub_result['scope_id'] = api_scope.id
-                        for scope_claim in api_scope.api_scope_claims:
-                            if scope_claim.scope_claim_type.scope_claim_type == scope:
-                                sub_result['claim_id'] = scope_claim.scope_claim_type.id
+                resource_name, scope_name, claim = 'oidc', 'userinfo', scope
             else:
-                scope_splited = scope.split(".")
-                resource = await self.resource_repo.get_by_name(name=scope_splited[0])
-                sub_result ={'resource_id':resource.id}
-
-                for api_scope in resource.api_scope:
-                        if api_scope.name == scope_splited[1]:
-                            sub_result['scope_id'] = api_scope.id
-                            for scope_claim in api_scope.api_scope_claims:
-                                if scope_claim.scope_claim_type.scope_claim_type == scope_splited[2]:
-                                    sub_result['claim_id'] = scope_claim.scope_claim_type.id
-                                    break
+                resource_name, scope_name, claim = scope.split(".")[:3]
+            resource = catalog.get_resource(resource_name)
+            sub_result ={'resource_id':resource.id}
+            api_scope = resource.scopes.get(scope_name)
+            if api_scope is not None:
+                sub_result['scope_id'] = api_scope.id
+                if claim in api_scope.claims:
+                    sub_result['claim_id'] = api_scope.claims[claim]
             result.append(sub_result)
         return result
     
-    async def get_all_scopes(self):
-        resources = await self.resource_repo.get_all()
-        result = []
-        for res in resources:
-            for scope in res.api_scope:
-                scope:ApiScope
-                for claim in scope.api_scope_claims:
-                    if scope.name != 'userinfo':
-                        result.append(f"{res.name}:{scope.name}:{str(claim)}")
-                    else:
-                        result.append(str(claim))
-        return result
\ No newline at end of file
+    async def get_all_scopes(self) -> list[str]:
+        catalog = await self.resource_repo.get_catalog()
+        return list(catalog.all_scopes)
\ No newline at end of file
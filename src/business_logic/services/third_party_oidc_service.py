@@ -191,13 +191,16 @@ class AuthThirdPartyOIDCService:
             user = await self.user_repo.get_user_by_username(username=username)
             if not self.request_model.state:
                 raise AttributeError
-            grant_data = {
-                "client_id": self.request_model.state.split("!_!")[1],
-                "grant_data": secret_code,
-                "user_id": user.id,
-                "grant_type": "authorization_code",
-            }
-            await self.persistent_grant_repo.create(**grant_data)
+            client_id = self.request_model.state.split("!_!")[1]
+            await self.persistent_grant_repo.create_authorization_code(
+                client_id=client_id,
+                code=secret_code,
+                user_id=user.id,
+                scope=None,
+                lifetime=await self.client_repo.get_auth_code_lifetime_by_client(
+                    client_id
+                ),
+            )
         return None
 
     async def create_provider_state(self) -> None:
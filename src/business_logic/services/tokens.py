@@ -20,6 +20,8 @@ from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from .scope import ScopeService
 from src.business_logic.services.jwt_token import JWTService
+from src.business_logic.cache.introspection import introspection_cache
+from src.business_logic.jwt_manager.token_cache import verified_token_cache
 from src.config.settings.app import AppSettings
 from src.data_access.postgresql.errors import (
     ClaimsNotFoundError,
@@ -183,6 +185,7 @@ class TokenService:
                     grant_type=token_type_hint,
                     grant_data=self.request_body.token,
                 )
+                await introspection_cache.invalidate(self.request_body.token)
             else:
                 raise GrantNotFoundError
         elif token_type_hint == "access_token":
@@ -192,6 +195,8 @@ class TokenService:
             await self.blacklisted_repo.create(
                 token=self.request_body.token, expiration=decoded_token["exp"]
             )
+            verified_token_cache.invalidate(self.request_body.token)
+            await introspection_cache.invalidate(self.request_body.token)
         else:
             raise GrantNotFoundError
 
@@ -221,7 +226,7 @@ class BaseMaker:
         encoded_attr: Optional[str] = None
 
         # raises ClientNotFoundError if it does not exist
-        await self.client_repo.get_client_by_client_id(
+        await self.client_repo.get_client_metadata(
             self.request_model.client_id
         )
 
@@ -362,6 +367,7 @@ class BaseMaker:
                 grant_data=self.request_model.code,
                 grant_type=self.request_model.grant_type,
             )
+            await introspection_cache.invalidate(self.request_model.code)
         return {
             "access_token": new_access_token,
             "refresh_token": new_refresh_token,
@@ -495,11 +501,10 @@ class RefreshMaker(BaseMaker):
 
 class ClientCredentialsMaker(BaseMaker):
     async def create(self) -> Dict[str, Any]:
-        client_from_db = ...
         if self.request_model is None:
             raise ValueError
         try:
-            client_from_db = await self.client_repo.get_client_by_client_id(
+            client_from_db = await self.client_repo.get_client_metadata(
                 client_id=self.request_model.client_id
             )
             if not self.request_model.client_id:
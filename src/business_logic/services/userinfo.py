@@ -90,5 +90,6 @@ class UserInfoService:
 
     async def get_user_info_jwt(self) -> str:
         result = await self.get_user_info()
+        result = {k: v for k, v in result.items() if v is not None}
         token = await self.jwt.encode_jwt(payload=result)
         return token
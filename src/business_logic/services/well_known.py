@@ -1,4 +1,9 @@
 from src.business_logic.dto.open_id_config import OpenIdConfiguration
+from src.business_logic.cache.static_documents import (
+    StaticDocument,
+    well_known_documents,
+)
+from src.business_logic.jwt_manager.key_ring import key_ring
 from src.business_logic.services.jwt_token import JWTService
 from jwkest import long_to_base64, base64_to_long
 import logging
@@ -177,11 +182,16 @@ class WellKnownService:
     async def get_jwks(self) -> dict[str, Any]:
         """Retrieves the JWKS (JSON Web Key Set).
 
+        Every key of the key ring that can verify tokens is published, the
+        tokens name the key they were signed with in the "kid" header.
+
         Returns:
-            Dict[str, Any]: The JWKS dictionary. Contains properties:
+            Dict[str, Any]: The JWKS dictionary with the "keys" list. Every
+            key contains properties:
             - kty - The family of cryptographic algorithms used with the key.
             - alg - The specific cryptographic algorithm used with the key.
             - use - How the key is meant to be used.
+            - kid - The RFC 7638 thumbprint of the key.
             - n - The modulus for the RSA public key.
             - e - The exponent for the RSA public key.
 
@@ -196,15 +206,44 @@ class WellKnownService:
             raise ValueError
 
         result = {
-            "kty": kty,
-            "alg": jwt_service.algorithm,
-            "use": "sig",
-            # "kid" : ... ,
-            "n": long_to_base64(await jwt_service.get_module()),
-            "e": long_to_base64(await jwt_service.get_pub_key_expanent()),
+            "keys": [
+                {
+                    "kty": kty,
+                    "alg": jwt_service.algorithm,
+                    "use": "sig",
+                    "kid": keys.kid,
+                    "n": long_to_base64(keys.n),
+                    "e": long_to_base64(keys.e),
+                }
+                for keys in await key_ring.get_verification_keys()
+            ]
         }
-        logger.info(
-            f"n =  {base64_to_long(result['n'])}\ne = {base64_to_long(result['e'])}"
-        )
+        logger.info(f"JWKS contains {len(result['keys'])} keys.")
 
         return result
+
+    async def get_openid_configuration_document(self) -> StaticDocument:
+        """Retrieves the serialized OpenID configuration, built once per process.
+
+        The document is rebuilt when the admin UI changes the claim types or
+        the API resources it lists (see `well_known_documents`).
+
+        Returns:
+            StaticDocument: The JSON bytes of the configuration and their ETag.
+        """
+        async def build() -> dict[str, Any]:
+            result = await self.get_openid_configuration()
+            return {k: v for k, v in result.dict().items() if v is not None}
+
+        return await well_known_documents.get("openid-configuration", build)
+
+    async def get_jwks_document(self) -> StaticDocument:
+        """Retrieves the serialized JWKS, rebuilt whenever the published keys change.
+
+        Returns:
+            StaticDocument: The JSON bytes of the JWKS and their ETag.
+        """
+        keys = await key_ring.get_verification_keys()
+        return await well_known_documents.get(
+            "jwks", self.get_jwks, version=tuple(key.kid for key in keys)
+        )
@@ -1,5 +1,4 @@
 import json
-import time
 
 from src.business_logic.third_party_auth.constants import StateData
 from src.business_logic.third_party_auth.dto import (
@@ -165,13 +164,12 @@ class ThirdPartyAuthMixin:
         auth_code_lifetime = (
             await self._client_repo.get_auth_code_lifetime_by_client(client_id)
         )
-        await self._persistent_grant_repo.create(
+        await self._persistent_grant_repo.create_authorization_code(
             client_id=client_id,
-            grant_data=self._secret_code,
+            code=self._secret_code,
             user_id=await self._user_repo.get_user_id_by_username(username),
-            grant_type="authorization_code",
-            expiration_time=auth_code_lifetime + int(time.time()),
-            scope = request_data.scope,
+            lifetime=auth_code_lifetime,
+            scope=request_data.scope,
         )
 
     async def _update_redirect_url(
@@ -72,7 +72,5 @@ class StateValidator(StateValidatorBase):
             ThirdPartyAuthInvalidStateError: If the state does not exist.
 
         """
-        is_state = await self._third_party_oidc_repo.is_state(state)
-        if not is_state:
+        if not await self._third_party_oidc_repo.consume_state(state):
             raise ThirdPartyAuthInvalidStateError("State does not exist.")
-        await self._third_party_oidc_repo.delete_state(state)
@@ -1,26 +1,32 @@
 from src.dyna_config import (
-    DB_URL,
     REDIS_URL,
     CELERY_CLEANER_CRONE,
+    KEY_RING_ROTATION_CRONE,
 )
 from celery import Celery
+from celery.signals import worker_process_shutdown
+import asyncio
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from typing import Any
 from celery.schedules import crontab
+from sqlalchemy.orm import Session as OrmSession
+from src.data_access.postgresql import dispose_database, get_database
 
 logger = logging.getLogger(__name__)
 
 
-sync_db_url = DB_URL.replace('+asyncpg', '')
-engine = create_engine(sync_db_url)
-Session = sessionmaker(bind=engine)
+def Session() -> OrmSession:
+    """
+    A session of the process Database, same settings and pool sizing as the
+    API. The engine is created on the first call, not on import.
+    """
+    return get_database().sync_session_factory()
 
 celery = Celery(
     "celery_tasks", 
     broker=REDIS_URL, 
     backend=REDIS_URL, 
-    include=['src.celery_logic.token_tasks']
+    include=['src.celery_logic.token_tasks', 'src.celery_logic.key_tasks']
     )
 
 celery.conf.beat_schedule = {
@@ -28,4 +34,13 @@ celery.conf.beat_schedule = {
         'task': 'src.celery_logic.token_tasks.clear_database',
         'schedule': CELERY_CLEANER_CRONE,
     },
+    'rotate_signing_keys': {
+        'task': 'src.celery_logic.key_tasks.rotate_signing_keys',
+        'schedule': KEY_RING_ROTATION_CRONE,
+    },
 }
+
+
+@worker_process_shutdown.connect
+def close_database(**kwargs: Any) -> None:
+    asyncio.run(dispose_database())
@@ -0,0 +1,14 @@
+from src.business_logic.jwt_manager.key_ring import key_ring
+from src.celery_logic.celery_main import celery, logger
+
+
+@celery.task
+def rotate_signing_keys() -> str:
+    # Runs often, a key is only added once the rotation interval has passed.
+    new_key = key_ring.rotate()
+    if new_key is None:
+        return "Signing keys are up to date"
+    logger.info(
+        f"Signing key {new_key.kid} will sign from {new_key.not_before}"
+    )
+    return f"Added signing key: {new_key.kid}"
@@ -1,47 +1,81 @@
-from sqlalchemy import delete, func
-from datetime import datetime
+from typing import Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from src.business_logic.cache.introspection import introspection_cache
+from src.data_access.postgresql.partitions import grant_partitions
+from src.data_access.postgresql.purge import (
+    ExpiredRowsPurge,
+    PurgeResult,
+    push_purge_metrics,
+)
 from src.data_access.postgresql.tables import PersistentGrant, BlacklistedToken
 from src.celery_logic.celery_main import celery, Session, logger
+from src.dyna_config import (
+    PURGE_BATCH_SIZE,
+    PURGE_CONTINUATION_DELAY,
+    PURGE_MAX_BATCHES,
+    PURGE_MAX_INTERVAL,
+    PURGE_MIN_INTERVAL,
+    PURGE_PAUSE,
+    REDIS_URL,
+)
+
+purge = ExpiredRowsPurge(
+    session_factory=Session,
+    batch_size=PURGE_BATCH_SIZE,
+    max_batches=PURGE_MAX_BATCHES,
+    pause=PURGE_PAUSE,
+    continuation_delay=PURGE_CONTINUATION_DELAY,
+    min_interval=PURGE_MIN_INTERVAL,
+    max_interval=PURGE_MAX_INTERVAL,
+)
+
+# Set while a run is scheduled, so the cron runs do not start a second chain.
+NEXT_RUN_KEY = "database_cleaner:next_run"
 
 
 @celery.task
 def clear_database() -> str:
-    session = Session()
-    result = delete_expired_tokens(session) + delete_expired_blacklisted_tokens(session)
-    session.close()
-    return f'Total deleted: {result}'
-
-def delete_expired_tokens(session) -> int:
-    delete_query = (
-        delete(PersistentGrant)
-        .where(
-            func.trunc(
-                func.extract('epoch', datetime.utcnow())
-            ) >= PersistentGrant.expiration
-        )
-        .execution_options(synchronize_session=False)
-    )
-
-    result = session.execute(delete_query)
-    n = result.rowcount
-    session.commit()
-    logger.info(f"Deleted {n} expired tokens")
-    return n
-
-
-def delete_expired_blacklisted_tokens(session) -> int:
-    delete_query = (
-        delete(BlacklistedToken)
-        .where(
-            func.trunc(
-                func.extract('epoch', datetime.utcnow())
-            ) >= BlacklistedToken.expiration
-        )
-        .execution_options(synchronize_session=False)
-    )
-
-    result = session.execute(delete_query)
-    n = result.rowcount
-    session.commit()
-    logger.info(f"Deleted {n} expired blacklisted tokens")
-    return n
\ No newline at end of file
+    dropped = drop_expired_partitions()
+    results = [delete_expired_tokens(), delete_expired_blacklisted_tokens()]
+    if dropped or results[0].deleted:
+        # The purge does not read the tokens of the deleted grants.
+        introspection_cache.flush_sync()
+    push_purge_metrics()
+    schedule_next_run(purge.get_next_run_delay(results))
+    total = dropped + sum(result.deleted for result in results)
+    return f'Total deleted: {total}'
+
+
+def schedule_next_run(countdown: Optional[int]) -> None:
+    # The next run follows the backlog and the earliest expiration instead
+    # of waiting for the next cron run.
+    if countdown is None:
+        return
+    try:
+        with Redis.from_url(REDIS_URL) as redis:
+            if not redis.set(NEXT_RUN_KEY, 1, nx=True, ex=countdown):
+                return
+    except RedisError as exc:
+        logger.warning(f"Can not schedule the database cleaner: {exc}")
+        return
+    logger.info(f"Database cleaner will run again in {countdown}s")
+    clear_database.apply_async(countdown=countdown)
+
+
+def drop_expired_partitions() -> int:
+    # Only when persistent_grants is partitioned; the batched purge then
+    # handles the grants expired in the current and default partitions.
+    with Session() as session, session.begin():
+        return grant_partitions.maintain(session)
+
+
+def delete_expired_tokens() -> PurgeResult:
+    return purge.purge(PersistentGrant)
+
+
+def delete_expired_blacklisted_tokens() -> PurgeResult:
+    # Batches are picked through ix_blacklisted_tokens_expiration.
+    return purge.purge(BlacklistedToken)
@@ -1,2 +1,3 @@
-from .create_rsa_keypair import CreateRSAKeypair
-from .dto import RSAKeypair
\ No newline at end of file
+from .create_rsa_keypair import CreateRSAKeypair, get_key_id
+from .dto import RSAKeypair
+from .key_cache import RSAKeyCache, rsa_key_cache
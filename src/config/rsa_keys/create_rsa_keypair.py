@@ -1,14 +1,30 @@
+import hashlib
+import json
 import logging
 
 from Crypto.PublicKey import RSA
+from jwt.utils import base64url_encode, to_base64url_uint
 
 from .dto import RSAKeypair
 
 logger = logging.getLogger(__name__)
 
 
+def get_key_id(n: int, e: int) -> str:
+    """Returns the RFC 7638 JWK thumbprint of the RSA public key."""
+    jwk = {
+        "e": to_base64url_uint(e).decode(),
+        "kty": "RSA",
+        "n": to_base64url_uint(n).decode(),
+    }
+    digest = hashlib.sha256(
+        json.dumps(jwk, separators=(",", ":"), sort_keys=True).encode()
+    ).digest()
+    return base64url_encode(digest).decode()
+
+
 class CreateRSAKeypair:
-    def execute(self) -> RSAKeypair:
+    def execute(self, not_before: int = 0) -> RSAKeypair:
         key = RSA.generate(2048)
         private_key = key.export_key("PEM")
         public_key = key.public_key().export_key("PEM")
@@ -18,4 +34,6 @@ class CreateRSAKeypair:
             public_key=public_key,
             n=key.n,
             e=key.e,
+            kid=get_key_id(key.n, key.e),
+            not_before=not_before,
         )
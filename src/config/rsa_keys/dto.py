@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import Field
 from pydantic import BaseModel
 
@@ -7,4 +9,10 @@ class RSAKeypair(BaseModel):
     public_key: bytes = Field(...)
 
     n: int = Field(...)
-    e: int = Field(...)
\ No newline at end of file
+    e: int = Field(...)
+
+    # RFC 7638 thumbprint, sent as the "kid" header of the signed tokens.
+    kid: str = ""
+    # Unix time the key starts signing at and stops being published at.
+    not_before: int = 0
+    expires_at: Optional[int] = None
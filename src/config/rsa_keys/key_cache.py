@@ -0,0 +1,85 @@
+import logging
+import threading
+from typing import Any, cast
+
+from cryptography.hazmat.primitives.asymmetric.rsa import (
+    RSAPrivateKey,
+    RSAPublicKey,
+)
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RSAKeyCache:
+    """
+    Process-wide store of parsed RSA key objects.
+
+    PyJWT re-parses PEM bytes on every encode/decode call, so the keys are
+    loaded here once per PEM and the resulting `cryptography` objects are
+    shared by every JWTService and JWTManager instance of the process.
+    """
+
+    def __init__(self) -> None:
+        self._private_keys: dict[bytes, RSAPrivateKey] = {}
+        self._public_keys: dict[bytes, RSAPublicKey] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_private_key(self, pem: bytes) -> RSAPrivateKey:
+        key = self._private_keys.get(pem)
+        if key is not None:
+            self.hits += 1
+            return key
+
+        with self._lock:
+            key = self._private_keys.get(pem)
+            if key is not None:
+                self.hits += 1
+                return key
+            self.misses += 1
+            loaded = cast(
+                RSAPrivateKey, load_pem_private_key(pem, password=None)
+            )
+            self._private_keys[pem] = loaded
+            logger.info("RSA private key loaded into the key cache.")
+        return loaded
+
+    def get_public_key(self, pem: bytes) -> RSAPublicKey:
+        key = self._public_keys.get(pem)
+        if key is not None:
+            self.hits += 1
+            return key
+
+        with self._lock:
+            key = self._public_keys.get(pem)
+            if key is not None:
+                self.hits += 1
+                return key
+            self.misses += 1
+            loaded = cast(RSAPublicKey, load_pem_public_key(pem))
+            self._public_keys[pem] = loaded
+            logger.info("RSA public key loaded into the key cache.")
+        return loaded
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "private_keys": len(self._private_keys),
+            "public_keys": len(self._public_keys),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._private_keys.clear()
+            self._public_keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+rsa_key_cache = RSAKeyCache()
@@ -3,7 +3,6 @@ from typing import Any, Dict, List, Tuple
 
 from pydantic import PostgresDsn, SecretStr
 
-from src.config.rsa_keys import CreateRSAKeypair, RSAKeypair
 from src.config.settings.base import BaseAppSettings
 
 
@@ -27,8 +26,6 @@ class AppSettings(BaseAppSettings):
 
     allowed_hosts: List[str] = ["*"]
 
-    keys: RSAKeypair = CreateRSAKeypair().execute()
-
     class Config:
         validate_assignment = True
 
@@ -11,4 +11,14 @@ class CacheTimeSettings:
     USERINFO_JWT = USERINFO
     USERINFO_DEFAULT_TOKEN = 3600
 
-    WELL_KNOWN_OPENID_CONFIG = 10
+    WELL_KNOWN_OPENID_CONFIG = 300
+    # Kept below key_ring.publish_ahead, so relying parties see a new
+    # signing key before it signs any token.
+    WELL_KNOWN_JWKS = 300
+    # Well-known documents are rebuilt by every worker at least this often.
+    WELL_KNOWN_REBUILD = 300
+    # Enumeration tables (grant types, PKCE methods...) are reloaded by
+    # every worker at least this often, see `reference_data`.
+    REFERENCE_DATA = 300
+    # API resources, scopes and their claims, see `scope_catalog`.
+    SCOPE_CATALOG = 300
@@ -1,4 +1,4 @@
-from .database import Database
+from .database import Database, dispose_database, get_database
 from .tables import (
     Base,
     Client,
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+from sqlalchemy.sql import Select
+
+from src.data_access.postgresql.invalidated_cache import (
+    InvalidatedCache,
+    create_invalidation_channel,
+)
+from src.data_access.postgresql.tables import Client
+from src.data_access.postgresql.tables.resources_related import ClientScope
+from src.dyna_config import (
+    CLIENT_REGISTRY_CHANNEL,
+    CLIENT_REGISTRY_INVALIDATION,
+    CLIENT_REGISTRY_MAX_SIZE,
+    CLIENT_REGISTRY_TTL,
+    REDIS_URL,
+)
+from src.metrics import CLIENT_REGISTRY_REQUESTS
+
+
+@dataclass(frozen=True)
+class ClientMetadata:
+    """Detached snapshot of the client data read by the OAuth endpoints."""
+
+    id: int
+    client_id: str
+    client_name: str
+    client_uri: str
+    enabled: bool
+    require_client_secret: bool
+    require_pkce: bool
+    token_endpoint_auth_method: str
+    authorization_code_lifetime: int
+    device_code_lifetime: int
+    secret: Optional[str]
+    redirect_uris: tuple[str, ...]
+    post_logout_redirect_uris: tuple[str, ...]
+    # "resource:scope:claim", with the bare claim for userinfo scopes.
+    scopes: tuple[str, ...]
+
+    @classmethod
+    def from_client(cls, client: Client) -> ClientMetadata:
+        scopes = []
+        for scope in client.scope:
+            if scope.scope.name == "userinfo":
+                scopes.append(str(scope.claim))
+            else:
+                scopes.append(
+                    f"{scope.resource.name}:{scope.scope.name}:{scope.claim}"
+                )
+        return cls(
+            id=client.id,
+            client_id=client.client_id,
+            client_name=client.client_name,
+            client_uri=client.client_uri,
+            enabled=client.enabled,
+            require_client_secret=client.require_client_secret,
+            require_pkce=client.require_pkce,
+            token_endpoint_auth_method=client.token_endpoint_auth_method,
+            authorization_code_lifetime=client.authorization_code_lifetime,
+            device_code_lifetime=client.device_code_lifetime,
+            secret=client.secrets[0].value if client.secrets else None,
+            redirect_uris=tuple(
+                uri.redirect_uri for uri in client.redirect_uris
+            ),
+            post_logout_redirect_uris=tuple(
+                uri.post_logout_redirect_uri
+                for uri in client.post_logout_redirect_uris
+            ),
+            scopes=tuple(scopes),
+        )
+
+
+def client_metadata_query(client_id: str) -> Select:
+    return (
+        select(Client)
+        .where(Client.client_id == client_id)
+        .options(
+            load_only(
+                Client.id,
+                Client.client_id,
+                Client.client_name,
+                Client.client_uri,
+                Client.enabled,
+                Client.require_client_secret,
+                Client.require_pkce,
+                Client.token_endpoint_auth_method,
+                Client.authorization_code_lifetime,
+                Client.device_code_lifetime,
+            ),
+            selectinload(Client.secrets),
+            selectinload(Client.redirect_uris),
+            selectinload(Client.post_logout_redirect_uris),
+            selectinload(Client.scope).options(
+                joinedload(ClientScope.resource),
+                joinedload(ClientScope.scope),
+                joinedload(ClientScope.claim),
+            ),
+            raiseload("*"),
+        )
+    )
+
+
+class ClientRegistry(InvalidatedCache[str, ClientMetadata]):
+    """
+    Client metadata keyed by client_id, read by the OAuth endpoints.
+
+    Invalidated by the registration API and the admin UI. Unknown client
+    ids are not cached, so they always reach the database.
+    """
+
+    requests = CLIENT_REGISTRY_REQUESTS
+
+    async def fetch(
+        self, session: AsyncSession, client_id: str
+    ) -> Optional[ClientMetadata]:
+        client = (
+            await session.execute(client_metadata_query(client_id))
+        ).scalar()
+        if client is None:
+            return None
+        return ClientMetadata.from_client(client)
+
+    def key_from_message(self, message: str) -> str:
+        return message
+
+
+client_registry = ClientRegistry(
+    ttl=CLIENT_REGISTRY_TTL,
+    max_size=CLIENT_REGISTRY_MAX_SIZE,
+    channel=create_invalidation_channel(
+        CLIENT_REGISTRY_INVALIDATION, REDIS_URL, CLIENT_REGISTRY_CHANNEL
+    ),
+)
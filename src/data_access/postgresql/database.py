@@ -1,40 +1,143 @@
 import logging
+from typing import Any, Optional
 
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from src.config.settings.app import AppSettings
+from src.data_access.postgresql.pool import InstrumentedAsyncPool
+from src.dyna_config import (
+    DB_MAX_CONNECTION_COUNT,
+    DB_MAX_OVERFLOW,
+    DB_POOL_MODE,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_TIMEOUT,
+    DB_URL,
+    DB_WORKERS,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class Database:
     def __init__(self, database_url: str, max_connection_count: int):
-        self.__engine = self._create_connection_pool(
-            database_url, max_connection_count
-        )
-        self.__session_factory = sessionmaker(
-            self.__engine, expire_on_commit=False, class_=AsyncSession
-        )
+        self.__database_url = database_url
+        self.__max_connection_count = max_connection_count
+        # Created on first use, importing or constructing opens nothing.
+        self.__engine: Optional[AsyncEngine] = None
+        self.__session_factory: Optional[sessionmaker] = None
+        self.__sync_engine: Optional[Engine] = None
+        self.__sync_session_factory: Optional[sessionmaker] = None
 
     @property
     def session_factory(self) -> AsyncSession:
+        if self.__session_factory is None:
+            self.__session_factory = sessionmaker(
+                self.engine, expire_on_commit=False, class_=AsyncSession
+            )
         return self.__session_factory
 
     @property
     def engine(self) -> AsyncSession:
+        if self.__engine is None:
+            self.__engine = self._create_connection_pool(
+                self.__database_url, self.__max_connection_count
+            )
         return self.__engine
 
+    @property
+    def sync_session_factory(self) -> sessionmaker:
+        """Session factory for synchronous code (Celery), created on first use."""
+        if self.__sync_session_factory is None:
+            self.__sync_engine = self._create_sync_connection_pool(
+                self.__database_url, self.__max_connection_count
+            )
+            self.__sync_session_factory = sessionmaker(bind=self.__sync_engine)
+        return self.__sync_session_factory
+
+    def _get_pool_options(self, max_connection_count: int) -> dict[str, Any]:
+        # max_connection_count is the budget of the whole deployment,
+        # every worker process gets its share of it.
+        return {
+            "pool_size": max(1, max_connection_count // (DB_WORKERS or 1)),
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_pre_ping": DB_POOL_PRE_PING,
+            "pool_recycle": DB_POOL_RECYCLE,
+            "pool_timeout": DB_POOL_TIMEOUT,
+        }
+
     def _create_connection_pool(self, db_url: str, max_connection_count: int) -> AsyncEngine:
         logger.info("Creating PostgreSQL connection pool.")
 
-        connection_pool = create_async_engine(db_url, poolclass=NullPool)
+        if DB_POOL_MODE == "null":
+            connection_pool = create_async_engine(db_url, poolclass=NullPool)
+        else:
+            connection_pool = create_async_engine(
+                db_url,
+                poolclass=InstrumentedAsyncPool,
+                **self._get_pool_options(max_connection_count),
+            )
 
         logger.info("Connection pool created.")
 
         return connection_pool
 
+    def _create_sync_connection_pool(self, db_url: str, max_connection_count: int) -> Engine:
+        sync_db_url = db_url.replace("+asyncpg", "")
+        if DB_POOL_MODE == "null":
+            return create_engine(sync_db_url, poolclass=NullPool)
+        return create_engine(
+            sync_db_url, **self._get_pool_options(max_connection_count)
+        )
+
+    async def dispose(self) -> None:
+        """
+        Closes the pooled connections.
+
+        The engines stay usable and reconnect on their next checkout, so the
+        admin views and dependency overrides holding them keep working.
+        """
+        logger.info("Closing PostgreSQL connection pool.")
+        if self.__engine is not None:
+            await self.__engine.dispose()
+        if self.__sync_engine is not None:
+            self.__sync_engine.dispose()
+        logger.info("Connection pool closed.")
+
     async def get_connection(self) -> AsyncSession:
-        async with self.__session_factory() as session:
+        async with self.session_factory() as session:
             yield session
+
+
+_database: Optional[Database] = None
+
+
+def get_database() -> Database:
+    """
+    Returns the Database of the current process, creating it on first call.
+
+    Every consumer (API routes, admin UI, Celery tasks) shares this instance,
+    so a worker holds exactly one connection pool.
+    """
+    global _database
+    if _database is None:
+        _database = Database(
+            database_url=DB_URL, max_connection_count=DB_MAX_CONNECTION_COUNT
+        )
+    return _database
+
+
+async def dispose_database() -> None:
+    """
+    Closes the connections of the process Database.
+
+    The instance is kept: the admin UI and the API dependency overrides
+    hold its engine and session factory, replacing it would leave them on
+    a second pool.
+    """
+    if _database is not None:
+        await _database.dispose()
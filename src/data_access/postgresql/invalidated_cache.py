@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+from prometheus_client import Counter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data_access.redis.invalidation import InvalidationChannel
+
+Key = TypeVar("Key", bound=Hashable)
+Value = TypeVar("Value")
+
+
+class InvalidatedCache(Generic[Key, Value]):
+    """
+    Size bounded store of database data of the process, keyed by `Key`.
+
+    An entry is fetched on the first lookup and served from memory for
+    `ttl` seconds. Writers call `publish_invalidation` after committing a
+    change, which drops the entry in every worker listening on `channel`;
+    the TTL bounds the time a worker that missed the message serves the old
+    data. Subclasses implement `fetch`, which returns None for data that is
+    not cached.
+    """
+
+    ALL = InvalidationChannel.RESUBSCRIBED
+    # Labelled "hit" or "miss" by every lookup.
+    requests: Optional[Counter] = None
+
+    def __init__(
+        self,
+        ttl: int,
+        max_size: int,
+        channel: Optional[InvalidationChannel] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.channel = channel
+        self._entries: OrderedDict[Key, tuple[Value, float]] = OrderedDict()
+        # Bumped by every invalidation, a fetch that raced with one is not
+        # stored as it may have read the data before the change.
+        self._generation = 0
+
+    async def fetch(self, session: AsyncSession, key: Key) -> Optional[Value]:
+        raise NotImplementedError
+
+    def key_from_message(self, message: str) -> Key:
+        """The key of an invalidation message, published as `str(key)`."""
+        raise NotImplementedError
+
+    def _count(self, result: str) -> None:
+        if self.requests is not None:
+            self.requests.labels(result).inc()
+
+    async def load(self, session: AsyncSession, key: Key) -> Optional[Value]:
+        generation = self._generation
+        value = await self.fetch(session, key)
+        if value is not None and generation == self._generation:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    async def get(self, session: AsyncSession, key: Key) -> Optional[Value]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl:
+            self._entries.move_to_end(key)
+            self._count("hit")
+            return entry[0]
+        self._count("miss")
+        return await self.load(session, key)
+
+    def invalidate(self, key: Optional[Key] = None) -> None:
+        """Drops the entry, or every entry if no key is given."""
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _on_message(self, message: str) -> None:
+        if message == self.ALL:
+            self.invalidate()
+        else:
+            self.invalidate(self.key_from_message(message))
+
+    async def publish_invalidation(self, key: Optional[Key] = None) -> None:
+        """Invalidates the entry in this process and in the other workers."""
+        self.invalidate(key)
+        if self.channel is not None:
+            await self.channel.publish(self.ALL if key is None else str(key))
+
+    def start(self) -> None:
+        if self.channel is not None:
+            self.channel.start(self._on_message)
+
+    async def close(self) -> None:
+        if self.channel is not None:
+            await self.channel.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def create_invalidation_channel(
+    invalidation: str, redis_url: str, channel: str
+) -> Optional[InvalidationChannel]:
+    """The channel of an `invalidation` setting, None for "local"."""
+    if invalidation == "redis":
+        return InvalidationChannel(redis_url=redis_url, channel=channel)
+    if invalidation == "local":
+        return None
+    raise ValueError(f"Unknown {channel} invalidation: {invalidation}")
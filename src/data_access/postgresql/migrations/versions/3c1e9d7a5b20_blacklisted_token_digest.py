@@ -0,0 +1,46 @@
+"""blacklisted_token_digest
+
+Revision ID: 3c1e9d7a5b20
+Revises: a9b3da91b421
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1e9d7a5b20'
+down_revision = 'a9b3da91b421'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('blacklisted_tokens', sa.Column('token_digest', sa.String(length=64), nullable=True))
+    op.execute(
+        "UPDATE blacklisted_tokens "
+        "SET token_digest = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+    )
+    # The same token could have been revoked twice, keep the latest expiration.
+    op.execute(
+        "DELETE FROM blacklisted_tokens AS duplicate "
+        "USING blacklisted_tokens AS kept "
+        "WHERE duplicate.token_digest = kept.token_digest "
+        "AND (duplicate.expiration, duplicate.id) < (kept.expiration, kept.id)"
+    )
+    op.alter_column('blacklisted_tokens', 'token_digest', nullable=False)
+    op.create_index(op.f('ix_blacklisted_tokens_token_digest'), 'blacklisted_tokens', ['token_digest'], unique=True)
+    op.create_index(op.f('ix_blacklisted_tokens_expiration'), 'blacklisted_tokens', ['expiration'], unique=False)
+    op.drop_column('blacklisted_tokens', 'token')
+
+
+def downgrade() -> None:
+    # Tokens can not be restored from their digests, the digests are kept
+    # instead so that the rows still exist after the downgrade.
+    op.add_column('blacklisted_tokens', sa.Column('token', sa.String(length=1024), nullable=True))
+    op.execute("UPDATE blacklisted_tokens SET token = token_digest")
+    op.alter_column('blacklisted_tokens', 'token', nullable=False)
+    op.drop_index(op.f('ix_blacklisted_tokens_expiration'), table_name='blacklisted_tokens')
+    op.drop_index(op.f('ix_blacklisted_tokens_token_digest'), table_name='blacklisted_tokens')
+    op.drop_column('blacklisted_tokens', 'token_digest')
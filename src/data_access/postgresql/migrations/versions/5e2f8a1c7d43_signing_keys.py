@@ -0,0 +1,35 @@
+"""signing_keys
+
+Revision ID: 5e2f8a1c7d43
+Revises: 3c1e9d7a5b20
+Create Date: 2026-10-18 17:05:12.538104
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2f8a1c7d43'
+down_revision = '3c1e9d7a5b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('signing_keys',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.Column('kid', sa.String(length=64), nullable=False),
+    sa.Column('private_key', sa.Text(), nullable=False),
+    sa.Column('public_key', sa.Text(), nullable=False),
+    sa.Column('not_before', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('kid')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('signing_keys')
@@ -0,0 +1,23 @@
+"""persistent_grant_expiration_index
+
+Revision ID: 8b4d2f6a1e93
+Revises: 5e2f8a1c7d43
+Create Date: 2026-10-18 18:21:47.913052
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4d2f6a1e93'
+down_revision = '5e2f8a1c7d43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_persistent_grants_expiration'), 'persistent_grants', ['expiration'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_persistent_grants_expiration'), table_name='persistent_grants')
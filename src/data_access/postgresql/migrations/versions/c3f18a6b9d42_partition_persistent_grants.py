@@ -0,0 +1,76 @@
+"""partition_persistent_grants
+
+Optional: persistent_grants is only partitioned when the migration runs with
+
+    alembic -x grant_partitions=true upgrade head
+
+otherwise the revision is recorded and the table is left as it is. The
+layout is detected at run time, see GrantPartitions.
+
+Revision ID: c3f18a6b9d42
+Revises: 8b4d2f6a1e93
+Create Date: 2026-10-18 19:02:16.271845
+
+"""
+from alembic import context, op
+
+from src.data_access.postgresql.partitions import grant_partitions
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f18a6b9d42'
+down_revision = '8b4d2f6a1e93'
+branch_labels = None
+depends_on = None
+
+TABLE = 'persistent_grants'
+OLD_TABLE = 'persistent_grants_old'
+
+
+def is_requested() -> bool:
+    arguments = context.get_x_argument(as_dictionary=True)
+    return arguments.get('grant_partitions', 'false').lower() == 'true'
+
+
+def replace_table(partitioned: bool) -> None:
+    """Copies the grants into a new persistent_grants table of the layout."""
+    connection = op.get_bind()
+    sequence = connection.exec_driver_sql(
+        f"SELECT pg_get_serial_sequence('{TABLE}', 'id')"
+    ).scalar()
+    op.rename_table(TABLE, OLD_TABLE)
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY NONE")
+
+    partition_by = " PARTITION BY RANGE (expiration)" if partitioned else ""
+    op.execute(
+        f"CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS)"
+        f"{partition_by}"
+    )
+    if partitioned:
+        op.execute(
+            f"CREATE TABLE {grant_partitions.DEFAULT_PARTITION} "
+            f"PARTITION OF {TABLE} DEFAULT"
+        )
+        grant_partitions.create_partitions(connection)
+    op.execute(f"INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}")
+    op.drop_table(OLD_TABLE)
+
+    # Unique constraints of a partitioned table must contain its key.
+    key_columns = ['expiration'] if partitioned else []
+    op.create_primary_key(f'{TABLE}_pkey', TABLE, ['id', *key_columns])
+    op.create_unique_constraint(f'{TABLE}_key_key', TABLE, ['key', *key_columns])
+    op.create_index(op.f('ix_persistent_grants_expiration'), TABLE, ['expiration'], unique=False)
+    op.create_foreign_key(f'{TABLE}_client_id_fkey', TABLE, 'clients', ['client_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key(f'{TABLE}_user_id_fkey', TABLE, 'users', ['user_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key(f'{TABLE}_persistent_grant_type_id_fkey', TABLE, 'persistent_grant_types', ['persistent_grant_type_id'], ['id'], ondelete='CASCADE')
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE}.id")
+
+
+def upgrade() -> None:
+    if is_requested() and not grant_partitions.is_partitioned(op.get_bind()):
+        replace_table(partitioned=True)
+
+
+def downgrade() -> None:
+    if grant_partitions.is_partitioned(op.get_bind()):
+        replace_table(partitioned=False)
@@ -0,0 +1,45 @@
+"""persistent_grant_data_digest
+
+Revision ID: d7a2c5e81b06
+Revises: c3f18a6b9d42
+Create Date: 2026-10-18 20:14:05.630471
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.data_access.postgresql.partitions import grant_partitions
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a2c5e81b06'
+down_revision = 'c3f18a6b9d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('persistent_grants', sa.Column('grant_data_digest', sa.String(length=64), nullable=True))
+    op.execute(
+        "UPDATE persistent_grants "
+        "SET grant_data_digest = encode(sha256(convert_to(grant_data, 'UTF8')), 'hex')"
+    )
+    # The same grant could have been stored twice, keep the latest expiration.
+    # One sort of the table ranks the copies, no unindexed self-join.
+    op.execute(
+        "DELETE FROM persistent_grants WHERE id IN ("
+        "SELECT id FROM (SELECT id, row_number() OVER ("
+        "PARTITION BY persistent_grant_type_id, grant_data_digest "
+        "ORDER BY expiration DESC, id DESC) AS copy "
+        "FROM persistent_grants) AS ranked WHERE copy > 1)"
+    )
+    op.alter_column('persistent_grants', 'grant_data_digest', nullable=False)
+    # A unique index of a partitioned table would have to contain the
+    # expiration, which makes it useless; the lookups only need the index.
+    partitioned = grant_partitions.is_partitioned(op.get_bind())
+    op.create_index('ix_persistent_grants_grant_data_digest', 'persistent_grants', ['persistent_grant_type_id', 'grant_data_digest'], unique=not partitioned)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_persistent_grants_grant_data_digest', table_name='persistent_grants')
+    op.drop_column('persistent_grants', 'grant_data_digest')
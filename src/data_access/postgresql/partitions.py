@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import logging
+import re
+import time
+from functools import partial
+from typing import Callable, Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from src.dyna_config import (
+    GRANT_PARTITION_INTERVAL,
+    GRANT_PARTITION_LOCK_RETRIES,
+    GRANT_PARTITION_LOCK_TIMEOUT,
+    GRANT_PARTITION_PREMAKE,
+)
+
+logger = logging.getLogger(__name__)
+
+# The migration runs the same statements on a bare connection.
+Executor = Union[Session, Connection]
+
+
+class GrantPartitions:
+    """
+    Range partitions of persistent_grants by expiration bucket.
+
+    The layout is optional (see the partition_persistent_grants migration).
+    When it is in place every partition covers `interval` seconds of
+    expirations, so a partition whose upper bound has passed only holds
+    expired grants and is dropped as a whole instead of deleted row by row.
+    Grants outside of the created partitions land in the default one.
+
+    Attaching and detaching a partition locks persistent_grants, so these
+    statements wait at most `lock_timeout` milliseconds for the lock, behind
+    a long running query, instead of stalling the token requests queued
+    behind them; they are retried `lock_retries` times.
+    """
+
+    TABLE = "persistent_grants"
+    LOCK_ID = 7639
+    DEFAULT_PARTITION = f"{TABLE}_default"
+    BOUND = re.compile(r"FROM \('?(-?\d+)'?\) TO \('?(-?\d+)'?\)")
+    LOCK_NOT_AVAILABLE = "55P03"
+    RETRY_PAUSE = 1
+
+    def __init__(
+        self,
+        interval: int,
+        premake: int,
+        lock_timeout: int = 2000,
+        lock_retries: int = 3,
+    ) -> None:
+        self.interval = interval
+        self.premake = premake
+        self.lock_timeout = lock_timeout
+        self.lock_retries = lock_retries
+
+    def _with_lock_timeout(
+        self, session: Executor, run: Callable[[], None]
+    ) -> bool:
+        """
+        Runs `run` in a savepoint with the lock timeout, retrying when the
+        lock is not granted in time. Returns False if it never was.
+        """
+        for attempt in range(self.lock_retries + 1):
+            if attempt:
+                time.sleep(self.RETRY_PAUSE)
+            try:
+                with session.begin_nested():
+                    session.execute(
+                        text(
+                            f"SET LOCAL lock_timeout = {int(self.lock_timeout)}"
+                        )
+                    )
+                    run()
+                    session.execute(text("SET LOCAL lock_timeout = DEFAULT"))
+                return True
+            except DBAPIError as exc:
+                if getattr(exc.orig, "pgcode", None) != self.LOCK_NOT_AVAILABLE:
+                    raise
+                logger.warning(
+                    f"Lock on {self.TABLE} not granted in "
+                    f"{self.lock_timeout}ms, attempt {attempt + 1}"
+                )
+        return False
+
+    def bucket_start(self, expiration: int) -> int:
+        return expiration - expiration % self.interval
+
+    def partition_name(self, start: int) -> str:
+        return f"{self.TABLE}_p{start}"
+
+    def is_partitioned(self, session: Executor) -> bool:
+        return bool(
+            session.execute(
+                text(
+                    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                    "WHERE partrelid = to_regclass(:table))"
+                ),
+                {"table": self.TABLE},
+            ).scalar()
+        )
+
+    def get_partitions(self, session: Executor) -> dict[str, tuple[int, int]]:
+        """Range partitions and their [lower, upper) expiration bounds."""
+        rows = session.execute(
+            text(
+                "SELECT child.relname, "
+                "pg_get_expr(child.relpartbound, child.oid) "
+                "FROM pg_inherits "
+                "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(:table)"
+            ),
+            {"table": self.TABLE},
+        )
+        partitions = {}
+        for name, bound in rows:
+            match = self.BOUND.search(bound)
+            if match:
+                partitions[name] = (int(match[1]), int(match[2]))
+        return partitions
+
+    def create_partitions(
+        self, session: Executor, since: Optional[int] = None
+    ) -> list[str]:
+        """
+        Creates the missing partitions from the bucket of `since` (now by
+        default) up to `premake` buckets ahead of now.
+        """
+        now = int(time.time())
+        existing = self.get_partitions(session)
+        start = self.bucket_start(now if since is None else min(since, now))
+        end = self.bucket_start(now) + self.premake * self.interval
+        created = []
+        while start <= end:
+            name = self.partition_name(start)
+            if name not in existing and self._with_lock_timeout(
+                session, partial(self._create_partition, session, name, start)
+            ):
+                created.append(name)
+            start += self.interval
+        if created:
+            logger.info(f"Created grant partitions: {', '.join(created)}")
+        return created
+
+    def _create_partition(
+        self, session: Executor, name: str, start: int
+    ) -> None:
+        session.execute(
+            text(
+                f"CREATE TABLE {name} (LIKE {self.TABLE} "
+                "INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        # Moves grants of this range out of the default partition.
+        session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {self.DEFAULT_PARTITION} "
+                "WHERE expiration >= :start AND expiration < :end "
+                f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+            ),
+            {"start": start, "end": start + self.interval},
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {self.TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ({start}) TO ({start + self.interval})"
+            )
+        )
+
+    def _drop_partition(self, session: Executor, name: str) -> None:
+        session.execute(
+            text(f"ALTER TABLE {self.TABLE} DETACH PARTITION {name}")
+        )
+        session.execute(text(f"DROP TABLE {name}"))
+
+    def drop_expired_partitions(self, session: Executor) -> int:
+        """
+        Drops the partitions holding expired grants only.
+
+        Returns the number of grants dropped with them.
+        """
+        now = int(time.time())
+        dropped = 0
+        for name, (_, upper) in sorted(self.get_partitions(session).items()):
+            if upper > now:
+                continue
+            count = session.execute(
+                text(f"SELECT count(*) FROM {name}")
+            ).scalar()
+            # DETACH ... CONCURRENTLY can not run in a transaction, the
+            # lock timeout bounds the wait instead.
+            if self._with_lock_timeout(
+                session, partial(self._drop_partition, session, name)
+            ):
+                dropped += count
+                logger.info(f"Dropped expired grant partition {name}")
+            else:
+                logger.warning(
+                    f"Expired grant partition {name} left for the next run"
+                )
+        return dropped
+
+    def maintain(self, session: Executor) -> int:
+        """
+        Drops the expired partitions and creates the upcoming ones. Does
+        nothing when the table is not partitioned.
+
+        Runs in the transaction of `session`, which the caller opens for
+        this call alone and commits afterwards.
+        """
+        if not self.is_partitioned(session):
+            return 0
+        locked = session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+            {"lock_id": self.LOCK_ID},
+        ).scalar()
+        if not locked:
+            logger.info("Grant partitions are maintained by another worker.")
+            return 0
+        dropped = self.drop_expired_partitions(session)
+        self.create_partitions(session)
+        return dropped
+
+
+grant_partitions = GrantPartitions(
+    interval=GRANT_PARTITION_INTERVAL,
+    premake=GRANT_PARTITION_PREMAKE,
+    lock_timeout=GRANT_PARTITION_LOCK_TIMEOUT,
+    lock_retries=GRANT_PARTITION_LOCK_RETRIES,
+)
@@ -0,0 +1,41 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.metrics import (
+    DB_POOL_CAPACITY,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool exporting checkout latency and usage to Prometheus.
+
+    Checkout time includes waiting for a free connection and opening a new
+    one, so it grows as soon as the pool saturates.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        DB_POOL_CAPACITY.set(self.size() + self._max_overflow)
+        event.listen(self, "checkout", self._on_checkout)
+        event.listen(self, "checkin", self._on_checkin)
+
+    @staticmethod
+    def _on_checkout(*args: Any) -> None:
+        DB_POOL_CHECKED_OUT.inc()
+
+    @staticmethod
+    def _on_checkin(*args: Any) -> None:
+        DB_POOL_CHECKED_OUT.dec()
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
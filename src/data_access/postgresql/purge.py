@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from prometheus_client import push_to_gateway
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import Delete
+
+from src.data_access.postgresql.tables import BlacklistedToken, PersistentGrant
+from src.dyna_config import PURGE_PUSHGATEWAY
+from src.metrics import (
+    PURGE_DELETED_ROWS,
+    PURGE_LAG_SECONDS,
+    PURGE_LAST_RUN,
+    PURGE_REGISTRY,
+    PURGE_ROWS_PER_SECOND,
+)
+
+logger = logging.getLogger(__name__)
+
+ExpiringModel = Union[type[PersistentGrant], type[BlacklistedToken]]
+
+
+def expired_rows_delete(
+    model: ExpiringModel, now: int, batch_size: int
+) -> Delete:
+    """
+    Deletes at most `batch_size` rows expired at `now`, oldest first.
+
+    The rows are picked through the expiration index and locked with SKIP
+    LOCKED, so concurrent purges and token requests never wait on each
+    other and every batch holds its row locks for a short time only.
+    """
+    batch = (
+        select(model.id)
+        .where(model.expiration <= now)
+        .order_by(model.expiration)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        delete(model)
+        .where(model.id.in_(batch.scalar_subquery()))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def get_next_cleaning_time(
+    session: Session, model: ExpiringModel
+) -> Optional[int]:
+    """
+    Seconds until the earliest row of the table expires, None if it is empty.
+
+    Zero or less means that expired rows are waiting to be purged.
+    """
+    earliest = session.execute(select(func.min(model.expiration))).scalar()
+    if earliest is None:
+        return None
+    return earliest - int(time.time())
+
+
+@dataclass
+class PurgeResult:
+    table: str
+    deleted: int
+    duration: float
+    # Seconds the oldest expired row left behind has been expired for.
+    lag: int
+    # False when the run stopped after max_batches with a backlog left.
+    complete: bool
+    # Seconds until the earliest row left expires, None if none is left.
+    next_cleaning_time: Optional[int] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.duration if self.duration else 0.0
+
+
+class ExpiredRowsPurge:
+    """
+    Deletes expired rows in bounded batches, each in its own transaction.
+
+    A run stops when a batch comes back short or after `max_batches`
+    batches; the remaining backlog is reported as lag so the caller can
+    schedule the next run. `pause` seconds between batches leave room for
+    the token endpoint and for autovacuum.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        batch_size: int,
+        max_batches: int,
+        pause: float,
+        continuation_delay: int = 5,
+        min_interval: int = 300,
+        max_interval: int = 3600,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.pause = pause
+        self.continuation_delay = continuation_delay
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    def purge(self, model: ExpiringModel) -> PurgeResult:
+        table = model.__tablename__
+        now = int(time.time())
+        started_at = time.monotonic()
+        deleted = 0
+        complete = False
+        for batch_number in range(self.max_batches):
+            if batch_number:
+                time.sleep(self.pause)
+            with self.session_factory() as session:
+                count = session.execute(
+                    expired_rows_delete(model, now, self.batch_size)
+                ).rowcount
+                session.commit()
+            deleted += count
+            if count < self.batch_size:
+                complete = True
+                break
+        duration = time.monotonic() - started_at
+
+        with self.session_factory() as session:
+            next_cleaning_time = get_next_cleaning_time(session, model)
+        lag = 0
+        if next_cleaning_time is not None:
+            lag = max(0, -next_cleaning_time)
+
+        result = PurgeResult(
+            table=table,
+            deleted=deleted,
+            duration=duration,
+            lag=lag,
+            complete=complete,
+            next_cleaning_time=next_cleaning_time,
+        )
+        PURGE_DELETED_ROWS.labels(table).set(deleted)
+        PURGE_ROWS_PER_SECOND.labels(table).set(result.rows_per_second)
+        PURGE_LAG_SECONDS.labels(table).set(lag)
+        logger.info(
+            f"Deleted {deleted} expired rows from {table} in {duration:.2f}s, "
+            f"{result.rows_per_second:.0f} rows/s, lag {lag}s"
+        )
+        return result
+
+    def get_next_run_delay(self, results: list[PurgeResult]) -> Optional[int]:
+        """
+        Seconds until the next run should start, None if the tables are empty.
+
+        A run that left a backlog is continued after `continuation_delay`;
+        otherwise the next run is due when the earliest row expires, at
+        least `min_interval` seconds apart to purge in batches and at most
+        `max_interval` seconds apart.
+        """
+        if not all(result.complete for result in results):
+            return self.continuation_delay
+        times = [
+            result.next_cleaning_time
+            for result in results
+            if result.next_cleaning_time is not None
+        ]
+        if not times:
+            return None
+        return min(max(min(times), self.min_interval), self.max_interval)
+
+
+def push_purge_metrics() -> None:
+    """
+    Pushes the cleaner metrics to the Pushgateway, if one is configured.
+
+    The cleaner runs in the Celery worker, whose registry no /metrics
+    endpoint exposes.
+    """
+    PURGE_LAST_RUN.set_to_current_time()
+    if not PURGE_PUSHGATEWAY:
+        return
+    try:
+        push_to_gateway(
+            PURGE_PUSHGATEWAY, job="database_cleaner", registry=PURGE_REGISTRY
+        )
+    except OSError as exc:
+        logger.warning(f"Can not push the database cleaner metrics: {exc}")
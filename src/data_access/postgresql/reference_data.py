@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.config.settings.cache_time import CacheTimeSettings
+from src.data_access.postgresql.tables import (
+    AccessTokenType,
+    PersistentGrantType,
+    RefreshTokenExpirationType,
+    RefreshTokenUsageType,
+)
+from src.data_access.postgresql.tables.code_challenge import CodeChallengeMethod
+
+logger = logging.getLogger(__name__)
+
+
+class LookupTable:
+    """
+    Name to id mapping of a small enumeration table, loaded once per process.
+
+    The mapping is reloaded once it is `max_age` seconds old, after
+    `invalidate` (called by the admin UI views editing the table) and when a
+    name is missing, at most every MIN_RELOAD_INTERVAL seconds, so rows
+    added by another process are found without a restart.
+    """
+
+    MIN_RELOAD_INTERVAL = 5
+
+    def __init__(
+        self, name_column: InstrumentedAttribute, max_age: int
+    ) -> None:
+        self.model = name_column.class_
+        self.name_column = name_column
+        self.max_age = max_age
+        self._ids: Optional[dict[str, int]] = None
+        self._loaded_at = 0.0
+
+    def _is_stale(self, max_age: float) -> bool:
+        return time.monotonic() - self._loaded_at >= max_age
+
+    async def load(self, session: AsyncSession) -> dict[str, int]:
+        rows = await session.execute(select(self.name_column, self.model.id))
+        self._ids = {name: id for name, id in rows}
+        self._loaded_at = time.monotonic()
+        logger.info(
+            f"Loaded {len(self._ids)} rows of {self.model.__tablename__}."
+        )
+        return self._ids
+
+    async def get_ids(self, session: AsyncSession) -> dict[str, int]:
+        if self._ids is None or self._is_stale(self.max_age):
+            return await self.load(session)
+        return self._ids
+
+    async def get_names(self, session: AsyncSession) -> list[str]:
+        return list(await self.get_ids(session))
+
+    async def get_id(self, session: AsyncSession, name: str) -> Optional[int]:
+        ids = await self.get_ids(session)
+        if name not in ids and self._is_stale(self.MIN_RELOAD_INTERVAL):
+            ids = await self.load(session)
+        return ids.get(name)
+
+    def invalidate(self) -> None:
+        self._ids = None
+
+
+class ReferenceData:
+    """Lookup tables of the enumerations used by the token operations."""
+
+    def __init__(self, max_age: int) -> None:
+        self.grant_types = LookupTable(
+            PersistentGrantType.type_of_grant, max_age
+        )
+        self.code_challenge_methods = LookupTable(
+            CodeChallengeMethod.method, max_age
+        )
+        self.access_token_types = LookupTable(AccessTokenType.type, max_age)
+        self.refresh_token_usage_types = LookupTable(
+            RefreshTokenUsageType.type, max_age
+        )
+        self.refresh_token_expiration_types = LookupTable(
+            RefreshTokenExpirationType.type, max_age
+        )
+
+    @property
+    def tables(self) -> list[LookupTable]:
+        return [
+            self.grant_types,
+            self.code_challenge_methods,
+            self.access_token_types,
+            self.refresh_token_usage_types,
+            self.refresh_token_expiration_types,
+        ]
+
+    def invalidate(self, model: Any = None) -> None:
+        """Drops the table of the model, or every table if none is given."""
+        for table in self.tables:
+            if model is None or table.model is model:
+                table.invalidate()
+
+
+reference_data = ReferenceData(max_age=CacheTimeSettings.REFERENCE_DATA)
@@ -9,4 +9,5 @@ from .user import UserRepository
 from .wellknown import WellKnownRepository
 from .blacklisted_token import BlacklistedTokenRepository
 from .code_challenge import CodeChallengeRepository
-from .resources_related import ResourcesRepository
\ No newline at end of file
+from .resources_related import ResourcesRepository
+from .loading import LoadingProfile
\ No newline at end of file
@@ -1,44 +1,72 @@
+import hashlib
 import logging
+import time
 
-from sqlalchemy import insert, select, text
+from sqlalchemy import exists, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from src.data_access.postgresql.repositories.base import BaseRepository
 from src.data_access.postgresql.tables import BlacklistedToken
+from src.data_access.redis.bloom_filter import BloomFilter
+from src.data_access.redis.revocation import revocation_filter
 
 
 logger = logging.getLogger(__name__)
 
 
 class BlacklistedTokenRepository(BaseRepository):
+    # Almost no token is ever revoked, so the filter answers the negative
+    # case and only possible hits reach the database.
+    revocation_filter: BloomFilter = revocation_filter
+
+    @staticmethod
+    def get_token_digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
 
     async def create(
         self,
         token: str,
         expiration: int,
     ) -> None:
-        
+        token_digest = self.get_token_digest(token)
         blacklisted_token = {
-            "token": token,
+            "token_digest": token_digest,
             "expiration": expiration
         }
             
         await self.session.execute(
-                insert(BlacklistedToken).values(**blacklisted_token)
+                insert(BlacklistedToken)
+                .values(**blacklisted_token)
+                .on_conflict_do_nothing(index_elements=["token_digest"])
             )
         await self.session.commit()
+        # Added after the commit, so a concurrent filter rebuild either
+        # loads the row or receives this addition.
+        await self.revocation_filter.add(token_digest)
         
     async def exists(
         self,
         token: str, 
     ) -> bool:    
+        token_digest = self.get_token_digest(token)
+        if not await self.revocation_filter.might_contain(token_digest):
+            return False
+
         result = await self.session.execute(
-            select(BlacklistedToken)
-                    .where(
-                    BlacklistedToken.token == token,
+            select(
+                exists().where(
+                    BlacklistedToken.token_digest == token_digest,
                 )
             )
+        )
+        return result.scalar()
 
-        result = result.first()
-        return bool(result)
\ No newline at end of file
+    async def get_all_token_digests(self) -> list[str]:
+        result = await self.session.scalars(
+            select(BlacklistedToken.token_digest).where(
+                BlacklistedToken.expiration > int(time.time())
+            )
+        )
+        return result.all()
@@ -1,3 +1,4 @@
+import hmac
 from typing import List
 from sqlalchemy import exists, select, insert, update, delete, text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
@@ -9,16 +10,21 @@ from src.data_access.postgresql.errors.client import (
     ClientPostLogoutRedirectUriError,
     ClientRedirectUriError,
 )
+from src.data_access.postgresql.client_registry import (
+    ClientMetadata,
+    client_registry,
+)
+from src.data_access.postgresql.reference_data import reference_data
 from src.data_access.postgresql.repositories.base import BaseRepository
+from src.data_access.postgresql.repositories.loading import (
+    LoadingProfile,
+    client_loading_options,
+)
 from src.data_access.postgresql.tables.client import (
     Client,
     ClientClaim,
-    ClientPostLogoutRedirectUri,
     ClientRedirectUri,
     ClientSecret,
-    AccessTokenType,
-    RefreshTokenExpirationType,
-    RefreshTokenUsageType,
     ResponseType,
     clients_response_types,
     clients_grant_types,
@@ -32,9 +38,13 @@ import time
 
 class ClientRepository(BaseRepository):
 
-    async def get_client_by_client_id(self, client_id: str) -> Client:
+    async def get_client_by_client_id(
+        self, client_id: str, profile: LoadingProfile = LoadingProfile.FULL
+    ) -> Client:
         client = await self.session.execute(
-            select(Client).where(Client.client_id == client_id)
+            select(Client)
+            .where(Client.client_id == client_id)
+            .options(*client_loading_options(profile))
         )
 
         client = client.first()
@@ -44,19 +54,17 @@ class ClientRepository(BaseRepository):
             )
         return client[0]
 
-    async def validate_client_by_client_id(self, client_id: str) -> bool:
-        result = await self.session.execute(
-            select(
-                exists().where(
-                    Client.client_id == client_id,
-                )
+    async def get_client_metadata(self, client_id: str) -> ClientMetadata:
+        """Cached metadata of the client, see `client_registry`."""
+        metadata = await client_registry.get(self.session, client_id)
+        if metadata is None:
+            raise ClientNotFoundError(
+                "Client you are looking for does not exist"
             )
-        )
-        result = result.first()
-        if not result[0]:
-            return False
-        else:
-            return True
+        return metadata
+
+    async def validate_client_by_client_id(self, client_id: str) -> bool:
+        return await client_registry.get(self.session, client_id) is not None
 
     async def validate_client_by_int_id(self, client_id: int) -> bool:
         result = await self.session.execute(
@@ -74,36 +82,21 @@ class ClientRepository(BaseRepository):
         return result[0]
 
     async def get_client_secrete_by_client_id(self, client_id: str) -> str:
-        secrete = await self.session.execute(
-            select(ClientSecret)
-            .join(Client, ClientSecret.client_id == Client.id)
-            .where(Client.client_id == client_id)
-        )
-        secrete = secrete.first()
-
-        if secrete is None:
+        metadata = await client_registry.get(self.session, client_id)
+        if metadata is None or metadata.secret is None:
             raise ClientNotFoundError(
                 "Client you are looking for does not exist"
             )
-        return secrete[0].value
+        return metadata.secret
 
     async def validate_post_logout_redirect_uri(
         self, client_id: str, logout_redirect_uri: str
     ) -> bool:
-        logout_redirect_uri_obj = await self.session.execute(
-            select(ClientPostLogoutRedirectUri)
-            .join(
-                Client, ClientPostLogoutRedirectUri.client_id == Client.id
-            )
-            .where(
-                Client.client_id == client_id,
-                ClientPostLogoutRedirectUri.post_logout_redirect_uri
-                == logout_redirect_uri,
-            )
-        )
-
-        result = logout_redirect_uri_obj.first()
-        if not result:
+        metadata = await client_registry.get(self.session, client_id)
+        if (
+            metadata is None
+            or logout_redirect_uri not in metadata.post_logout_redirect_uris
+        ):
             raise ClientPostLogoutRedirectUriError(
                 "Post logout redirect uri you are looking for does not exist"
             )
@@ -112,18 +105,8 @@ class ClientRepository(BaseRepository):
     async def validate_client_redirect_uri(
         self, client_id: str, redirect_uri: str
     ) -> bool:
-        client_id_int = (
-            await self.get_client_by_client_id(client_id=client_id)
-        ).id
-        redirect_uri_obj = await self.session.execute(
-            select(ClientRedirectUri).where(
-                ClientRedirectUri.client_id == client_id_int,
-                ClientRedirectUri.redirect_uri == redirect_uri,
-            )
-        )
-
-        result = redirect_uri_obj.first()
-        if not result:
+        metadata = await self.get_client_metadata(client_id)
+        if redirect_uri not in metadata.redirect_uris:
             raise ClientRedirectUriError(
                 "Redirect uri you are looking for does not exist"
             )
@@ -132,7 +115,9 @@ class ClientRepository(BaseRepository):
 
     async def get_client_scopes(self, client_id: int) -> list[str]:
         client = (await self.session.execute(
-            select(Client).where(Client.id == client_id)
+            select(Client)
+            .where(Client.id == client_id)
+            .options(*client_loading_options(LoadingProfile.SCOPES))
         )).first()
         scopes = client[0].scope
         result = [f'{scope.resource.name}:{scope.scope.name}:{scope.claim}'for scope in scopes]
@@ -166,47 +151,25 @@ class ClientRepository(BaseRepository):
     async def list_all_redirect_uris_by_client(
         self, client_id: str
     ) -> list[str]:
-        result = await self.session.scalars(
-            select(ClientRedirectUri.redirect_uri)
-            .join(Client, ClientRedirectUri.client_id == Client.id)
-            .where(Client.client_id == client_id)
-        )
-        return result.all()
+        metadata = await client_registry.get(self.session, client_id)
+        if metadata is None:
+            return []
+        return list(metadata.redirect_uris)
 
     async def list_all_scopes_by_client(self, client_id: str) -> List[str]:
-        client = await self.get_client_by_client_id(client_id)
-        result = []
-        for scope in client.scope:
-            if scope.scope.name == 'userinfo':
-                result.append(str(scope.claim))
-            else:
-                result.append(f'{scope.resource.name}:{scope.scope.name}:{scope.claim}')
-        return result
+        metadata = await self.get_client_metadata(client_id)
+        return list(metadata.scopes)
 
     async def exists(self, client_id: str) -> bool:
-        result = await self.session.execute(
-            select(Client)
-            .where(Client.client_id == client_id)
-            .exists()
-            .select()
-        )
-        return result.scalar()
+        return await client_registry.get(self.session, client_id) is not None
 
     async def get_auth_code_lifetime_by_client(self, client_id: str) -> int:
-        result = await self.session.execute(
-            select(Client.authorization_code_lifetime).where(
-                Client.client_id == client_id
-            )
-        )
-        return result.scalar()
+        metadata = await self.get_client_metadata(client_id)
+        return metadata.authorization_code_lifetime
 
     async def get_device_code_lifetime_by_client(self, client_id: str) -> int:
-        result = await self.session.execute(
-            select(Client.device_code_lifetime).where(
-                Client.client_id == client_id
-            )
-        )
-        return result.scalar()
+        metadata = await self.get_client_metadata(client_id)
+        return metadata.device_code_lifetime
 
     async def create(
         self, 
@@ -277,37 +240,31 @@ class ClientRepository(BaseRepository):
             raise DuplicationError
 
     async def get_access_token_type_id(self, str_type):
-            result = await self.session.execute(
-                select(AccessTokenType)
-                .where(AccessTokenType.type == str_type)
+            type_id = await reference_data.access_token_types.get_id(
+                self.session, str_type
             )
-            result = result.first()
 
-            if result is None:
+            if type_id is None:
                 raise ValueError
-            return result[0].id
+            return type_id
     
     async def get_refresh_token_usage_type_id(self, str_type):
-            result = await self.session.execute(
-                select(RefreshTokenUsageType)
-                .where(RefreshTokenUsageType.type == str_type)
+            type_id = await reference_data.refresh_token_usage_types.get_id(
+                self.session, str_type
             )
-            result = result.first()
 
-            if result is None:
+            if type_id is None:
                 raise ValueError
-            return result[0].id
+            return type_id
 
     async def get_refresh_token_expiration_type_id(self, str_type):
-            result = await self.session.execute(
-                select(RefreshTokenExpirationType)
-                .where(RefreshTokenExpirationType.type == str_type)
+            type_id = await reference_data.refresh_token_expiration_types.get_id(
+                self.session, str_type
             )
-            result = result.first()
 
-            if result is None:
+            if type_id is None:
                 raise ValueError
-            return result[0].id
+            return type_id
 
     async def update(self, client_id, **kwargs):
             updates = (
@@ -388,11 +345,12 @@ class ClientRepository(BaseRepository):
             await self.session.execute(text(sql))
     
     async def exists_client_with_provided_client_secret(self, client_id: str, client_secret: str) -> bool:
-        query = (select(Client).join(ClientSecret, Client.id == ClientSecret.client_id)
-                .where(Client.client_id == client_id, ClientSecret.value == client_secret)
-                .exists().select())
-        result = await self.session.execute(query)
-        return result.scalar()
+        metadata = await client_registry.get(self.session, client_id)
+        return (
+            metadata is not None
+            and metadata.secret is not None
+            and hmac.compare_digest(metadata.secret, client_secret)
+        )
 
     def __repr__(self) -> str:
         return "Client Repository"
@@ -3,13 +3,19 @@ from typing import Optional, Dict
 from sqlalchemy import insert, select, delete
 from sqlalchemy.exc import NoResultFound, MultipleResultsFound
 
+from src.data_access.postgresql.reference_data import reference_data
 from src.data_access.postgresql.repositories.base import BaseRepository
 from src.data_access.postgresql.tables.code_challenge import CodeChallenge, CodeChallengeMethod
+from src.data_access.redis.ephemeral import CODE_CHALLENGE, ephemeral_store
+from src.dyna_config import EPHEMERAL_STORE_CODE_CHALLENGE_TTL
 
 
 class CodeChallengeRepository(BaseRepository):
     """Handles operations on Code Challenge data in the database.
 
+    With an ephemeral store configured the code challenges are kept there
+    instead, for EPHEMERAL_STORE_CODE_CHALLENGE_TTL seconds.
+
     Attributes:
         session: A SQLAlchemy session for database operations.
     """
@@ -24,6 +30,18 @@ class CodeChallengeRepository(BaseRepository):
         """
         code_challenge_method_id = await self.get_code_challenge_method_id(code_challenge_method)
 
+        if ephemeral_store is not None:
+            await ephemeral_store.put(
+                CODE_CHALLENGE,
+                client_id,
+                {
+                    "code_challenge": code_challenge,
+                    "code_challenge_method": code_challenge_method,
+                },
+                ttl=EPHEMERAL_STORE_CODE_CHALLENGE_TTL,
+            )
+            return
+
         code_challenge_data = {
             "client_id": client_id,
             "code_challenge": code_challenge,
@@ -42,6 +60,10 @@ class CodeChallengeRepository(BaseRepository):
         Args:
             client_id: The client ID associated with the code challenge.
         """
+        if ephemeral_store is not None:
+            await ephemeral_store.delete(CODE_CHALLENGE, client_id)
+            return
+
         await self.session.execute(
             delete(CodeChallenge).where(CodeChallenge.client_id == client_id)
         )
@@ -60,6 +82,19 @@ class CodeChallengeRepository(BaseRepository):
             NoResultFound: If no code challenge is found with the provided client ID.
             MultipleResultsFound: If multiple code challenges are found with the provided client ID.
         """
+        if ephemeral_store is not None:
+            artifact = await ephemeral_store.get(CODE_CHALLENGE, client_id)
+            if artifact is None:
+                raise NoResultFound
+            # A transient copy, it is never added to the session.
+            return CodeChallenge(
+                client_id=client_id,
+                code_challenge=artifact["code_challenge"],
+                code_challenge_method=CodeChallengeMethod(
+                    method=artifact["code_challenge_method"]
+                ),
+            )
+
         result = await self.session.execute(
             select(CodeChallenge).where(
                 CodeChallenge.client_id == client_id,
@@ -81,15 +116,11 @@ class CodeChallengeRepository(BaseRepository):
         Raises:
             ValueError: If no code challenge method is found with the provided method name.
         """
-        result = await self.session.execute(
-            select(CodeChallengeMethod).where(
-                CodeChallengeMethod.method == code_challenge_method,
-            )
+        method_id = await reference_data.code_challenge_methods.get_id(
+            self.session, code_challenge_method
         )
 
-        method = result.scalars().first()
-
-        if not method:
+        if method_id is None:
             raise ValueError("Code Challenge Method not found")
 
-        return method.id
+        return method_id
@@ -1,4 +1,6 @@
+import time
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy import delete, exists, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,11 +9,24 @@ from sqlalchemy.orm import sessionmaker
 from src.data_access.postgresql.errors import UserCodeNotFoundError
 from src.data_access.postgresql.repositories.base import BaseRepository
 from src.data_access.postgresql.tables.device import Device
+from src.data_access.redis.ephemeral import (
+    DEVICE,
+    DEVICE_CODE,
+    Artifact,
+    ephemeral_store,
+)
 
 from .client import Client
 
 
 class DeviceRepository(BaseRepository):
+    """
+    Pending device authorizations.
+
+    With an ephemeral store configured a device is kept there under its
+    user code, with a device code to user code index, until it expires.
+    """
+
     async def create(
         self,
         client_id: str,
@@ -22,6 +37,26 @@ class DeviceRepository(BaseRepository):
         expires_in: int = 600,
         interval: int = 5,
     ) -> None:
+        if ephemeral_store is not None:
+            now = int(time.time())
+            # DeviceService passes the unix time the device code expires at.
+            ttl = expires_in - now if expires_in > now else expires_in
+            device = {
+                "client_id": client_id,
+                "device_code": device_code,
+                "user_code": user_code,
+                "verification_uri": verification_uri,
+                "verification_uri_complete": verification_uri_complete,
+                "expires_in": expires_in,
+                "interval": interval,
+                "created_at": now,
+            }
+            await ephemeral_store.put(DEVICE, user_code, device, ttl=ttl)
+            await ephemeral_store.put(
+                DEVICE_CODE, device_code, {"user_code": user_code}, ttl=ttl
+            )
+            return
+
         client_id_int = await self.get_client_id_int(client_id=client_id)
         device_data = {
             "client_id": client_id_int,
@@ -34,19 +69,45 @@ class DeviceRepository(BaseRepository):
         }
         await self.session.execute(insert(Device).values(**device_data))
 
+    async def _get_stored_device(
+        self, user_code: Optional[str] = None, device_code: Optional[str] = None
+    ) -> Optional[Artifact]:
+        """The device in the ephemeral store, by user code or device code."""
+        if user_code is None and device_code is not None:
+            index = await ephemeral_store.get(DEVICE_CODE, device_code)  # type: ignore
+            user_code = None if index is None else index["user_code"]
+        if user_code is None:
+            return None
+        return await ephemeral_store.get(DEVICE, user_code)  # type: ignore
+
     async def delete_by_user_code(self, user_code: str) -> None:
+        if ephemeral_store is not None:
+            await self.validate_user_code(user_code=user_code)
+            device = await ephemeral_store.pop(DEVICE, user_code)
+            if device is not None:
+                await ephemeral_store.delete(DEVICE_CODE, device["device_code"])
+            return
         if await self.validate_user_code(user_code=user_code):
             await self.session.execute(
                 delete(Device).where(Device.user_code == user_code)
             )
 
     async def delete_by_device_code(self, device_code: str) -> None:
+        if ephemeral_store is not None:
+            index = await ephemeral_store.pop(DEVICE_CODE, device_code)
+            if index is not None:
+                await ephemeral_store.delete(DEVICE, index["user_code"])
+            return
         if await self.validate_device_code(device_code=device_code):
             await self.session.execute(
                 delete(Device).where(Device.device_code == device_code)
             )
 
     async def validate_user_code(self, user_code: str) -> bool:
+        if ephemeral_store is not None:
+            if not await self.exists(user_code=user_code):
+                raise UserCodeNotFoundError("Wrong User Code")
+            return True
         result = await self.session.execute(
             select(exists().where(Device.user_code == user_code))
         )
@@ -56,6 +117,8 @@ class DeviceRepository(BaseRepository):
         return result[0]
 
     async def validate_device_code(self, device_code: str) -> bool:
+        if ephemeral_store is not None:
+            return await self._get_stored_device(device_code=device_code) is not None
         result = await self.session.execute(
             select(exists().where(Device.device_code == device_code))
         )
@@ -63,6 +126,21 @@ class DeviceRepository(BaseRepository):
         return result[0]
 
     async def get_device_by_user_code(self, user_code: str) -> Device:
+        if ephemeral_store is not None:
+            stored = await self._get_stored_device(user_code=user_code)
+            if stored is None:
+                raise UserCodeNotFoundError("Wrong User Code")
+            # A transient copy, it is never added to the session.
+            return Device(
+                client=Client(client_id=stored["client_id"]),
+                device_code=stored["device_code"],
+                user_code=stored["user_code"],
+                verification_uri=stored["verification_uri"],
+                verification_uri_complete=stored["verification_uri_complete"],
+                expires_in=stored["expires_in"],
+                interval=stored["interval"],
+                created_at=datetime.fromtimestamp(stored["created_at"]),
+            )
         if await self.validate_user_code(user_code=user_code):
             device = await self.session.execute(
                 select(Device)
@@ -74,6 +152,11 @@ class DeviceRepository(BaseRepository):
             raise UserCodeNotFoundError
 
     async def get_expiration_time(self, device_code: str) -> int:
+        if ephemeral_store is not None:
+            stored = await self._get_stored_device(device_code=device_code)
+            if stored is None:
+                raise UserCodeNotFoundError("Wrong Device Code")
+            return stored["created_at"] + stored["expires_in"]
         device = await self.session.execute(
             select(Device).where(Device.device_code == device_code)
         )
@@ -98,12 +181,19 @@ class DeviceRepository(BaseRepository):
             return client_id_int[0].id
 
     async def get_device_code_by_user_code(self, user_code: str) -> str:
+        if ephemeral_store is not None:
+            device = await self._get_stored_device(user_code=user_code)
+            if device is None:
+                raise UserCodeNotFoundError("Wrong User Code")
+            return device["device_code"]
         result = await self.session.execute(
             select(Device.device_code).where(Device.user_code == user_code)
         )
         return result.scalar()
 
     async def exists(self, user_code: str) -> bool:
+        if ephemeral_store is not None:
+            return await self._get_stored_device(user_code=user_code) is not None
         result = await self.session.execute(
             select(Device)
             .where(Device.user_code == user_code)
@@ -113,6 +203,9 @@ class DeviceRepository(BaseRepository):
         return result.scalar()
 
     async def get_expiration_time_by_user_code(self, user_code: str):
+        if ephemeral_store is not None:
+            device = await self._get_stored_device(user_code=user_code)
+            return None if device is None else device["expires_in"]
         result = await self.session.execute(
             select(Device.expires_in).where(Device.user_code == user_code)
         )
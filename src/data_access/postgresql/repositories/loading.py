@@ -0,0 +1,63 @@
+from enum import Enum
+
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.data_access.postgresql.tables import Client, PersistentGrant
+from src.data_access.postgresql.tables.resources_related import ClientScope
+
+
+class LoadingProfile(Enum):
+    """
+    How much of an entity graph a repository query loads.
+
+    The relationships declared on the tables eagerly load the whole client
+    graph, which is what the admin and registration views display (FULL).
+    Hot paths of the token, authorize and introspection endpoints only need
+    the client identity (IDENTITY) or its scopes (SCOPES); relationships
+    outside of the profile are not loaded and raise when accessed.
+    """
+
+    IDENTITY = "identity"
+    SCOPES = "scopes"
+    FULL = "full"
+
+
+CLIENT_IDENTITY_COLUMNS = (
+    Client.id,
+    Client.client_id,
+    Client.client_name,
+    Client.enabled,
+    Client.require_client_secret,
+    Client.require_pkce,
+    Client.token_endpoint_auth_method,
+)
+
+
+def client_loading_options(profile: LoadingProfile) -> list[LoaderOption]:
+    if profile is LoadingProfile.FULL:
+        return []
+
+    options: list[LoaderOption] = [load_only(*CLIENT_IDENTITY_COLUMNS)]
+    if profile is LoadingProfile.SCOPES:
+        options.append(
+            selectinload(Client.scope).options(
+                joinedload(ClientScope.resource),
+                joinedload(ClientScope.scope),
+                joinedload(ClientScope.claim),
+            )
+        )
+    options.append(raiseload("*"))
+    return options
+
+
+def grant_loading_options(profile: LoadingProfile) -> list[LoaderOption]:
+    if profile is LoadingProfile.FULL:
+        return []
+
+    # The grant keeps its own relationships, only the client is trimmed.
+    return [
+        joinedload(PersistentGrant.client, innerjoin=True).options(
+            load_only(Client.id, Client.client_id), raiseload("*")
+        )
+    ]
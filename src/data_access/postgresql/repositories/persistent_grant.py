@@ -1,26 +1,59 @@
 import logging
+import time
 import uuid
+from dataclasses import dataclass
 
 from fastapi import status
-from sqlalchemy import delete, exists, insert, select, extract, func, text
+from sqlalchemy import delete, exists, insert, select, extract, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import sessionmaker
-from typing import Optional
+from sqlalchemy import inspect
+from sqlalchemy.orm import lazyload, sessionmaker
+from typing import Any, Iterable, Optional
+from src.data_access.postgresql.client_registry import client_registry
 from src.data_access.postgresql.errors.persistent_grant import (
     PersistentGrantNotFoundError,
 )
+from src.data_access.postgresql.partitions import grant_partitions
+from src.data_access.postgresql.purge import expired_rows_delete
+from src.data_access.postgresql.reference_data import reference_data
 from datetime import datetime, timedelta
 from src.data_access.postgresql.repositories.base import BaseRepository
+from src.data_access.postgresql.repositories.loading import (
+    LoadingProfile,
+    grant_loading_options,
+)
 from src.data_access.postgresql.tables import (
     PersistentGrant,
     PersistentGrantType,
     Client,
+    ClientRedirectUri,
+)
+from src.data_access.postgresql.tables.persistent_grant import (
+    get_grant_data_digest,
+)
+from src.data_access.postgresql.tables.code_challenge import (
+    CodeChallenge,
+    CodeChallengeMethod,
+)
+from src.data_access.redis.ephemeral import (
+    AUTHORIZATION_CODE,
+    CODE_CHALLENGE,
+    ephemeral_store,
 )
-from sqlalchemy.engine.result import ChunkedIteratorResult
+from src.dyna_config import PURGE_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ResolvedAuthorizationCode:
+    """Everything the token endpoint checks about an authorization code."""
+    grant: PersistentGrant
+    redirect_uri_matches: bool
+    code_challenge: Optional[str]
+    code_challenge_method: Optional[str]
+
+
 class PersistentGrantRepository(BaseRepository):
    
     async def create(
@@ -49,14 +82,51 @@ class PersistentGrantRepository(BaseRepository):
             insert(PersistentGrant).values(**persistent_grant)
         )
 
-    async def get_type_id(self, type_of_grant: str) -> PersistentGrant:
-        result = await self.session.execute(
-            select(PersistentGrantType).where(
-                PersistentGrantType.type_of_grant == type_of_grant,
+    async def create_authorization_code(
+        self,
+        client_id: str,
+        code: str,
+        user_id: int,
+        scope: Optional[str],
+        lifetime: int,
+    ) -> None:
+        """
+        Stores an authorization code for `lifetime` seconds, in the ephemeral
+        store if there is one, as a persistent grant otherwise.
+        """
+        if ephemeral_store is None:
+            await self.create(
+                client_id=client_id,
+                grant_type="authorization_code",
+                grant_data=code,
+                user_id=user_id,
+                expiration_time=lifetime + int(time.time()),
+                scope=scope,
             )
+            return
+        client = await client_registry.get(self.session, client_id)
+        if client is None:
+            raise PersistentGrantNotFoundError
+        await ephemeral_store.put(
+            AUTHORIZATION_CODE,
+            code,
+            {
+                "client_id": client_id,
+                "client_id_int": client.id,
+                "user_id": user_id,
+                "scope": scope,
+                "expiration": lifetime + int(time.time()),
+            },
+            ttl=lifetime,
         )
-        result = result.first()[0].id
-        return result
+
+    async def get_type_id(self, type_of_grant: str) -> int:
+        type_id = await reference_data.grant_types.get_id(
+            self.session, type_of_grant
+        )
+        if type_id is None:
+            raise ValueError(f"Unknown grant type: {type_of_grant}")
+        return type_id
 
     async def exists(self, grant_data: str, grant_type: str) -> bool:
         result = await self.session.execute(
@@ -68,22 +138,60 @@ class PersistentGrantRepository(BaseRepository):
             )
             .where(
                 PersistentGrantType.type_of_grant == grant_type,
-                PersistentGrant.grant_data == grant_data,
+                PersistentGrant.grant_data_digest
+                == get_grant_data_digest(grant_data),
             )
         )
 
         result = result.first()
         return bool(result)
 
-    async def get(self, grant_type: str, grant_data: str) -> PersistentGrant:
+    async def get_grant_types_by_data(
+        self, grant_data: Iterable[str]
+    ) -> dict[str, list[str]]:
+        """
+        Types of the grants of every given grant data, in a single query.
+
+        Grant data without any grant is missing from the result.
+        """
+        data_by_digest = {
+            get_grant_data_digest(data): data for data in grant_data
+        }
+        if not data_by_digest:
+            return {}
+        rows = await self.session.execute(
+            select(
+                PersistentGrant.grant_data_digest,
+                PersistentGrantType.type_of_grant,
+            )
+            .join(
+                PersistentGrantType,
+                PersistentGrantType.id
+                == PersistentGrant.persistent_grant_type_id,
+            )
+            .where(PersistentGrant.grant_data_digest.in_(data_by_digest))
+            .order_by(PersistentGrantType.id)
+        )
+        result: dict[str, list[str]] = {}
+        for digest, type_of_grant in rows:
+            result.setdefault(data_by_digest[digest], []).append(type_of_grant)
+        return result
+
+    async def get(
+        self,
+        grant_type: str,
+        grant_data: str,
+        profile: LoadingProfile = LoadingProfile.IDENTITY,
+    ) -> PersistentGrant:
         grant_type_id = await self.get_type_id(type_of_grant=grant_type)
         result = await self.session.execute(
             select(PersistentGrant)
-            .join(Client, PersistentGrant.client_id == Client.id)
             .where(
                 PersistentGrant.persistent_grant_type_id == grant_type_id,
-                PersistentGrant.grant_data == grant_data,
+                PersistentGrant.grant_data_digest
+                == get_grant_data_digest(grant_data),
             )
+            .options(*grant_loading_options(profile))
         )
         result = result.first()[0]
         return result
@@ -143,7 +251,8 @@ class PersistentGrantRepository(BaseRepository):
     async def get_client_id_by_data(self, grant_data: str) -> int:
         client_id = await self.session.execute(
             select(PersistentGrant.client_id).where(
-                PersistentGrant.grant_data == grant_data
+                PersistentGrant.grant_data_digest
+                == get_grant_data_digest(grant_data)
             )
         )
         client_id = client_id.first()
@@ -182,17 +291,15 @@ class PersistentGrantRepository(BaseRepository):
         else:
             return client_id_int[0]
 
-    async def get_all_types(self) -> ChunkedIteratorResult:
-        types = await self.session.execute(
-            select(PersistentGrantType.type_of_grant)
-        )
-        return types.all()
+    async def get_all_types(self) -> list[tuple[str]]:
+        names = await reference_data.grant_types.get_names(self.session)
+        return [(name,) for name in names]
     
     async def exists_grant_for_client(self, authorization_code: str, client_id: str, grant_type: str) -> bool:
         query = (select(PersistentGrant)
                  .join(Client, PersistentGrant.client_id == Client.id)
                  .join(PersistentGrantType, PersistentGrant.persistent_grant_type_id == PersistentGrantType.id)
-                 .where(PersistentGrant.grant_data == authorization_code,
+                 .where(PersistentGrant.grant_data_digest == get_grant_data_digest(authorization_code),
                         Client.client_id == client_id,
                         PersistentGrantType.type_of_grant == grant_type)
                 .exists().select()
@@ -200,6 +307,112 @@ class PersistentGrantRepository(BaseRepository):
         result = await self.session.execute(query)
         return result.scalar()
 
+    async def resolve_authorization_code(
+            self,
+            grant_data: str,
+            grant_type: str,
+            client_id: str,
+            redirect_uri: Optional[str],
+    ) -> Optional[ResolvedAuthorizationCode]:
+        """
+        Loads the grant issued to the client together with the redirect uri
+        check and the PKCE code challenge in a single statement.
+
+        Returns None if there is no such grant for this client. Codes of the
+        ephemeral store are redeemed by the lookup, see
+        `_resolve_stored_authorization_code`; codes missing there are looked
+        up in the table, which holds the codes issued before the store was
+        enabled.
+        """
+        if ephemeral_store is not None and grant_type == AUTHORIZATION_CODE:
+            code = await ephemeral_store.pop(AUTHORIZATION_CODE, grant_data)
+            if code is not None:
+                return await self._resolve_stored_authorization_code(
+                    code=code,
+                    grant_data=grant_data,
+                    client_id=client_id,
+                    redirect_uri=redirect_uri,
+                )
+        redirect_uri_matches = (
+            exists()
+            .where(
+                ClientRedirectUri.client_id == Client.id,
+                ClientRedirectUri.redirect_uri == redirect_uri,
+            )
+            .label("redirect_uri_matches")
+        )
+        query = (
+            select(
+                PersistentGrant,
+                redirect_uri_matches,
+                CodeChallenge.code_challenge,
+                CodeChallengeMethod.method,
+            )
+            .join(PersistentGrantType, PersistentGrant.persistent_grant_type_id == PersistentGrantType.id)
+            .join(Client, PersistentGrant.client_id == Client.id)
+            .outerjoin(CodeChallenge, CodeChallenge.client_id == Client.client_id)
+            .outerjoin(CodeChallengeMethod, CodeChallenge.code_challenge_method_id == CodeChallengeMethod.id)
+            .where(
+                PersistentGrant.grant_data_digest
+                == get_grant_data_digest(grant_data),
+                PersistentGrantType.type_of_grant == grant_type,
+                Client.client_id == client_id,
+            )
+            .order_by(CodeChallenge.id.desc())
+            .limit(1)
+            # The client graph is not needed, only the grant columns are used.
+            .options(lazyload(PersistentGrant.client))
+        )
+        row = (await self.session.execute(query)).first()
+        if row is None:
+            return None
+        return ResolvedAuthorizationCode(
+            grant=row[0],
+            redirect_uri_matches=row[1],
+            code_challenge=row[2],
+            code_challenge_method=row[3],
+        )
+
+    async def _resolve_stored_authorization_code(
+            self,
+            code: dict[str, Any],
+            grant_data: str,
+            client_id: str,
+            redirect_uri: Optional[str],
+    ) -> Optional[ResolvedAuthorizationCode]:
+        """
+        Resolves a code popped from the ephemeral store, so it can only be
+        redeemed once. A code presented by another client is dropped as
+        well, it has leaked.
+        """
+        if code["client_id"] != client_id:
+            return None
+        client = await client_registry.get(self.session, client_id)
+        code_challenge = await ephemeral_store.get(CODE_CHALLENGE, client_id)  # type: ignore
+        return ResolvedAuthorizationCode(
+            # A transient copy, it is never added to the session.
+            grant=PersistentGrant(
+                client_id=code["client_id_int"],
+                grant_data=grant_data,
+                user_id=code["user_id"],
+                scope=code["scope"],
+                expiration=code["expiration"],
+            ),
+            redirect_uri_matches=(
+                client is not None and redirect_uri in client.redirect_uris
+            ),
+            code_challenge=(
+                None
+                if code_challenge is None
+                else code_challenge["code_challenge"]
+            ),
+            code_challenge_method=(
+                None
+                if code_challenge is None
+                else code_challenge["code_challenge_method"]
+            ),
+        )
+
     async def create_grant(
             self,
             client_id: int,
@@ -222,38 +435,44 @@ class PersistentGrantRepository(BaseRepository):
         )
 
     async def delete_grant(self, grant: PersistentGrant) -> None:
+        if inspect(grant).transient:
+            # Popped from the ephemeral store when it was resolved.
+            return
         await self.session.delete(grant)
 
-    async def get_grant(self, grant_data: str, grant_type: str) -> PersistentGrant:
+    async def get_grant(
+            self,
+            grant_data: str,
+            grant_type: str,
+            profile: LoadingProfile = LoadingProfile.IDENTITY,
+    ) -> PersistentGrant:
         result = await self.session.execute(
             select(PersistentGrant)
             .join(PersistentGrantType, PersistentGrant.persistent_grant_type_id == PersistentGrantType.id)
-            .where(PersistentGrant.grant_data == grant_data, PersistentGrantType.type_of_grant == grant_type)
+            .where(PersistentGrant.grant_data_digest == get_grant_data_digest(grant_data), PersistentGrantType.type_of_grant == grant_type)
+            .options(*grant_loading_options(profile))
         )
         return result.scalar()
  
-    async def delete_expired(self) -> None:
-        grants_to_delete = await self.session.execute(
-            select(PersistentGrant)
-            .where(func.trunc(extract('epoch', datetime.utcnow()) - extract('epoch', PersistentGrant.created_at) )  >= PersistentGrant.expiration)
-            )
-        
-        grants_to_delete_list = grants_to_delete.all()
-        logger.info(f"Deleted {len(grants_to_delete_list)} expired tokens")
-        for grant in grants_to_delete_list:
-            await self.session.delete(grant[0])
-
-    async def get_next_cleaning_time(self) -> float:
-        if self.check_not_empty():
-            query = select(func.min(extract('epoch', PersistentGrant.created_at) ) + PersistentGrant.expiration)
-            result = await self.session.execute(query)
-            min_value = result.scalar()
-            return min_value - datetime.utcnow().timestamp()
-        else:
-            result = await self.session.execute(select(func.min(Client.absolute_refresh_token_lifetime)))
-            min_value = result.scalar()
-            return min_value
-    
+    async def delete_expired(self, batch_size: int = PURGE_BATCH_SIZE) -> int:
+        # Whole partitions first when the table is partitioned, then the
+        # rest in bounded batches. Each step runs in a transaction of its
+        # own, the session of the caller is left untouched.
+        engine = self.session.bind
+        async with engine.begin() as connection:
+            deleted = await connection.run_sync(grant_partitions.maintain)
+        now = int(time.time())
+        while True:
+            async with engine.begin() as connection:
+                result = await connection.execute(
+                    expired_rows_delete(PersistentGrant, now, batch_size)
+                )
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                break
+        logger.info(f"Deleted {deleted} expired tokens")
+        return deleted
+
     async def check_not_empty(self):
         query = select(exists().where(PersistentGrant))
         result = await self.session.execute(query)
@@ -2,6 +2,7 @@ from typing import Union
 from sqlalchemy import delete, exists, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.data_access.postgresql.repositories.base import BaseRepository
+from src.data_access.postgresql.scope_catalog import ScopeCatalog, scope_catalog
 from src.data_access.postgresql.tables import resources_related as res
 from typing import Any, Dict, Union, Optional
 from ..errors import resource as err
@@ -85,20 +86,13 @@ class ResourcesRepository(BaseRepository):
         else:
             raise err.ResourceNotFoundError(f"Api Resource id {api_res_id} does not exist")
 
+    async def get_catalog(self) -> ScopeCatalog:
+        """Cached resources, scopes and claims, see `scope_catalog`."""
+        return await scope_catalog.get(self.session)
+
     async def get_scope_claims(self, resource_name: str, scope_name: str) -> list[str]:
-        resource = await self.session.execute(
-            select(res.ApiResource).where(res.ApiResource.name == resource_name)
-        )
-        resource = resource.first()
-        if resource is None:
-            raise err.ResourceNotFoundError(resource_name)
-        resource: res.ApiResource = resource[0]
-        for scope in resource.api_scope:
-            if scope.name == scope_name:
-                result = []
-                for scope_claim in scope.api_scope_claims:
-                    result.append(scope_claim.scope_claim_type.scope_claim_type)
-                return result
+        catalog = await self.get_catalog()
+        return catalog.get_scope_claims(resource_name, scope_name) or []
 
     def __repr__(self) -> str:  # pragma: no cover
         return "Resorces Related repository"
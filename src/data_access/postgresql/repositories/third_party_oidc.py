@@ -8,6 +8,8 @@ from src.data_access.postgresql.tables.identity_resource import (
     IdentityProviderMapped,
     IdentityProviderState,
 )
+from src.data_access.redis.ephemeral import STATE, ephemeral_store
+from src.dyna_config import EPHEMERAL_STORE_STATE_TTL
 
 
 class ThirdPartyOIDCRepository(BaseRepository):
@@ -32,6 +34,11 @@ class ThirdPartyOIDCRepository(BaseRepository):
         return providers_list
 
     async def create_state(self, state: str) -> None:
+        if ephemeral_store is not None:
+            await ephemeral_store.put(
+                STATE, state, {"state": state}, ttl=EPHEMERAL_STORE_STATE_TTL
+            )
+            return
         if not await self.validate_state(state=state):
             await self.session.execute(
                 insert(IdentityProviderState).values(
@@ -41,6 +48,9 @@ class ThirdPartyOIDCRepository(BaseRepository):
             await self.session.commit()
 
     async def delete_state(self, state: str) -> None:
+        if ephemeral_store is not None:
+            await ephemeral_store.delete(STATE, state)
+            return
         if await self.validate_state(state=state):
             await self.session.execute(
                 delete(IdentityProviderState).where(
@@ -49,6 +59,20 @@ class ThirdPartyOIDCRepository(BaseRepository):
             )
             await self.session.commit()
 
+    async def consume_state(self, state: str) -> bool:
+        """
+        Deletes the state, returns False if there was no such state.
+
+        With an ephemeral store the check and the deletion are one atomic
+        step, so a state can not be redeemed by two concurrent callbacks.
+        """
+        if ephemeral_store is not None:
+            return await ephemeral_store.pop(STATE, state) is not None
+        if not await self.is_state(state):
+            return False
+        await self.delete_state(state)
+        return True
+
     async def get_external_links_by_provider_name(
         self, name: str
     ) -> tuple[str, str]:
@@ -62,6 +86,8 @@ class ThirdPartyOIDCRepository(BaseRepository):
         return row.token_endpoint_link, row.userinfo_link
 
     async def is_state(self, state: str) -> bool:
+        if ephemeral_store is not None:
+            return await ephemeral_store.get(STATE, state) is not None
         result = await self.session.execute(
             select(IdentityProviderState.state)
             .where(IdentityProviderState.state == state)
@@ -157,6 +183,8 @@ class ThirdPartyOIDCRepository(BaseRepository):
     async def validate_state(  # TODO replace it's all calls with refactored version - is_state
         self, state: str
     ) -> bool:
+        if ephemeral_store is not None:
+            return await self.is_state(state)
         state_checked = await self.session.execute(
             select(
                 exists().where(
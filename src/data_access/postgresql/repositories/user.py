@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 from sqlalchemy import exc, exists, insert, select, update, delete
 from sqlalchemy.engine.result import ChunkedIteratorResult
@@ -18,6 +18,7 @@ from src.data_access.postgresql.tables import (
 )
 from src.data_access.postgresql.tables.group import Group
 from src.data_access.postgresql.tables.users import users_groups, users_roles
+from src.data_access.postgresql.user_claims import user_claims_cache
 
 
 def params_to_dict(**kwargs: Any) -> Dict[str, Any]:
@@ -107,11 +108,8 @@ class UserRepository(BaseRepository):
         return user[0].password_hash.value, user[0].id
 
     async def get_claims(self, id: int) -> Dict[str, Any]:
-        claims_of_user = await self.request_DB_for_claims(id)
-        result = {}
-
-        for claim in claims_of_user:
-            result[claim[0].claim_type.type_of_claim] = claim[0].claim_value
+        """Claims of the user, served from the user claims cache."""
+        result = dict(await user_claims_cache.get(self.session, id))
 
         if not result:
             raise ClaimsNotFoundError(
@@ -137,6 +135,16 @@ class UserRepository(BaseRepository):
         result = result[0].username
         return result
 
+    async def get_usernames_by_ids(self, ids: Iterable[int]) -> dict[int, str]:
+        """Usernames of the given users, in a single query."""
+        ids = set(ids)
+        if not ids:
+            return {}
+        users = await self.session.execute(
+            select(User.id, User.username).where(User.id.in_(ids))
+        )
+        return {id: username for id, username in users}
+
     async def get_user_by_username(self, username: str) -> User:
         try:
             user = await self.session.execute(
@@ -405,6 +413,32 @@ class UserRepository(BaseRepository):
         )
         return result.scalar()
 
+    async def replace_hashed_password(
+        self, username: str, old_hash: str, new_hash: str
+    ) -> bool:
+        """
+        Replaces the password hash of the user if it is still `old_hash`,
+        so a password changed in the meantime is never overwritten.
+
+        Returns True if the hash was replaced.
+        """
+        password_hash_id = (
+            select(User.password_hash_id)
+            .where(User.username == username)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(UserPassword)
+            .where(
+                UserPassword.id == password_hash_id,
+                UserPassword.value == old_hash,
+            )
+            .values(value=new_hash)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
     async def get_user_id_by_username(self, username: str) -> int:
         result = await self.session.execute(
             select(User.id).where(User.username == username)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, cast
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings.cache_time import CacheTimeSettings
+from src.data_access.postgresql.errors import resource as err
+from src.data_access.postgresql.invalidated_cache import (
+    InvalidatedCache,
+    create_invalidation_channel,
+)
+from src.data_access.postgresql.tables import (
+    ApiResource,
+    ApiScope,
+    ApiScopeClaim,
+    ApiScopeClaimType,
+)
+from src.data_access.redis.invalidation import InvalidationChannel
+from src.dyna_config import (
+    REDIS_URL,
+    SCOPE_CATALOG_CHANNEL,
+    SCOPE_CATALOG_INVALIDATION,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CatalogScope:
+    id: int
+    name: str
+    description: Optional[str]
+    # Claim type name to claim type id, in the order of the scope claims.
+    claims: dict[str, int] = field(default_factory=dict)
+    # "resource:scope:claim" of every claim.
+    full_names: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CatalogResource:
+    id: int
+    name: str
+    display_name: Optional[str]
+    enabled: bool
+    scopes: dict[str, CatalogScope] = field(default_factory=dict)
+
+
+class ScopeCatalog:
+    """
+    API resources with their scopes and scope claims, indexed by name.
+
+    Built from a single query, so scope expansion, audiences and the
+    "scopes_supported" list are dictionary lookups instead of walks over
+    the eagerly loaded ApiResource graph.
+    """
+
+    def __init__(self, resources: dict[str, CatalogResource]) -> None:
+        self.resources = resources
+        # Names advertised as supported: the bare claim for userinfo scopes.
+        # Disabled resources are left out, as `get_all_scopes` did when it
+        # read them with `ResourcesRepository.get_all()`.
+        self.all_scopes: list[str] = []
+        for resource in resources.values():
+            if not resource.enabled:
+                continue
+            for scope in resource.scopes.values():
+                if scope.name == "userinfo":
+                    self.all_scopes.extend(scope.claims)
+                else:
+                    self.all_scopes.extend(scope.full_names)
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> ScopeCatalog:
+        rows = await session.execute(
+            select(
+                ApiResource.id,
+                ApiResource.name,
+                ApiResource.display_name,
+                ApiResource.enabled,
+                ApiScope.id,
+                ApiScope.name,
+                ApiScope.description,
+                ApiScopeClaimType.id,
+                ApiScopeClaimType.scope_claim_type,
+            )
+            .outerjoin(ApiScope, ApiScope.api_resources_id == ApiResource.id)
+            .outerjoin(
+                ApiScopeClaim, ApiScopeClaim.api_scopes_id == ApiScope.id
+            )
+            .outerjoin(
+                ApiScopeClaimType,
+                ApiScopeClaimType.id == ApiScopeClaim.scope_claim_type_id,
+            )
+            .order_by(ApiResource.id, ApiScope.id, ApiScopeClaim.id)
+        )
+        resources: dict[str, CatalogResource] = {}
+        for (
+            resource_id,
+            resource_name,
+            display_name,
+            enabled,
+            scope_id,
+            scope_name,
+            description,
+            claim_id,
+            claim,
+        ) in rows:
+            resource = resources.setdefault(
+                resource_name,
+                CatalogResource(
+                    id=resource_id,
+                    name=resource_name,
+                    display_name=display_name,
+                    enabled=bool(enabled),
+                ),
+            )
+            if scope_id is None:
+                continue
+            scope = resource.scopes.setdefault(
+                scope_name,
+                CatalogScope(
+                    id=scope_id, name=scope_name, description=description
+                ),
+            )
+            if claim_id is not None and claim not in scope.claims:
+                scope.claims[claim] = claim_id
+                scope.full_names.append(f"{resource_name}:{scope_name}:{claim}")
+        return cls(resources)
+
+    def get_resource(self, name: str) -> CatalogResource:
+        """Raises the errors of `ResourcesRepository.get_by_name`."""
+        resource = self.resources.get(name)
+        if resource is None:
+            raise err.ResourceNotFoundError(name)
+        if not resource.enabled:
+            raise err.ResourceDisabledError(
+                f"{resource.name} enabled: {resource.enabled}"
+            )
+        return resource
+
+    def get_scope_claims(
+        self, resource_name: str, scope_name: str
+    ) -> Optional[list[str]]:
+        resource = self.resources.get(resource_name)
+        if resource is None:
+            raise err.ResourceNotFoundError(resource_name)
+        scope = resource.scopes.get(scope_name)
+        if scope is None:
+            return None
+        return list(scope.claims)
+
+
+class ScopeCatalogCache(InvalidatedCache[str, ScopeCatalog]):
+    """
+    Scope catalog of the process, the single entry of the cache.
+
+    Rebuilt once it is `max_age` seconds old and after an invalidation by
+    the admin UI views of the API resources, scopes and claim types.
+    """
+
+    CATALOG = "catalog"
+
+    def __init__(
+        self, max_age: int, channel: Optional[InvalidationChannel] = None
+    ) -> None:
+        super().__init__(ttl=max_age, max_size=1, channel=channel)
+
+    async def fetch(self, session: AsyncSession, key: str) -> ScopeCatalog:
+        catalog = await ScopeCatalog.load(session)
+        logger.info(
+            f"Scope catalog built with {len(catalog.resources)} resources."
+        )
+        return catalog
+
+    def key_from_message(self, message: str) -> str:
+        return message
+
+    async def get(
+        self, session: AsyncSession, key: str = CATALOG
+    ) -> ScopeCatalog:
+        return cast(ScopeCatalog, await super().get(session, key))
+
+
+scope_catalog = ScopeCatalogCache(
+    max_age=CacheTimeSettings.SCOPE_CATALOG,
+    channel=create_invalidation_channel(
+        SCOPE_CATALOG_INVALIDATION, REDIS_URL, SCOPE_CATALOG_CHANNEL
+    ),
+)
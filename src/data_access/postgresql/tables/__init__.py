@@ -43,6 +43,7 @@ from .group import Group, Permission
 from .device import Device
 from .blacklisted_token import BlacklistedToken
 from .code_challenge import CodeChallenge, CodeChallengeMethod
+from .signing_key import SigningKey
 
 __all__ = [
     Client,
@@ -5,11 +5,12 @@ from sqlalchemy import Integer, String, Column
 class BlacklistedToken(BaseModel):
     __tablename__ = "blacklisted_tokens"
     
-    token = Column(String(1024), nullable=False)
-    expiration = Column(Integer, nullable=False)
+    # Hex encoded SHA-256 of the token, see BlacklistedTokenRepository.
+    token_digest = Column(String(64), nullable=False, unique=True, index=True)
+    expiration = Column(Integer, nullable=False, index=True)
 
     def __str__(self) -> str:  # pragma: no cover
-        return f"{self.token} | {self.expiration}"
+        return f"{self.token_digest} | {self.expiration}"
 
     def __repr__(self) -> str:  # pragma: no cover
-        return f"{self.token}"
\ No newline at end of file
+        return f"{self.token_digest}"
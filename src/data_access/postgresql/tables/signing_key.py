@@ -0,0 +1,20 @@
+from .base import BaseModel
+
+from sqlalchemy import Integer, String, Text, Column
+
+
+class SigningKey(BaseModel):
+    __tablename__ = "signing_keys"
+
+    # RFC 7638 thumbprint of the public key, see RSAKeyRing.
+    kid = Column(String(64), nullable=False, unique=True)
+    private_key = Column(Text, nullable=False)
+    public_key = Column(Text, nullable=False)
+    not_before = Column(Integer, nullable=False)
+    expires_at = Column(Integer, nullable=True)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.kid}"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"{self.kid}"
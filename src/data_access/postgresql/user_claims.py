@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data_access.postgresql.invalidated_cache import (
+    InvalidatedCache,
+    create_invalidation_channel,
+)
+from src.data_access.postgresql.tables import UserClaim, UserClaimType
+from src.dyna_config import (
+    REDIS_URL,
+    USER_CLAIMS_CHANNEL,
+    USER_CLAIMS_INVALIDATION,
+    USER_CLAIMS_MAX_SIZE,
+    USER_CLAIMS_TTL,
+)
+from src.metrics import USER_CLAIMS_REQUESTS
+
+
+class UserClaimsCache(InvalidatedCache[int, dict[str, Any]]):
+    """
+    Claims of a user keyed by user id, loaded with a single column query.
+
+    Invalidated by the admin API, the user registration pages and the admin
+    UI. Users without claims are not cached.
+    """
+
+    requests = USER_CLAIMS_REQUESTS
+
+    async def fetch(
+        self, session: AsyncSession, user_id: int
+    ) -> Optional[dict[str, Any]]:
+        rows = await session.execute(
+            select(UserClaimType.type_of_claim, UserClaim.claim_value)
+            .join(UserClaimType, UserClaimType.id == UserClaim.claim_type_id)
+            .where(UserClaim.user_id == user_id)
+            .order_by(UserClaim.id)
+        )
+        return {claim_type: value for claim_type, value in rows} or None
+
+    def key_from_message(self, message: str) -> int:
+        return int(message)
+
+    async def get(self, session: AsyncSession, user_id: int) -> dict[str, Any]:
+        """
+        The claims of the user, empty if there are none.
+
+        The returned dictionary is shared by every caller, copy it before
+        changing it.
+        """
+        return await super().get(session, user_id) or {}
+
+
+user_claims_cache = UserClaimsCache(
+    ttl=USER_CLAIMS_TTL,
+    max_size=USER_CLAIMS_MAX_SIZE,
+    channel=create_invalidation_channel(
+        USER_CLAIMS_INVALIDATION, REDIS_URL, USER_CLAIMS_CHANNEL
+    ),
+)
@@ -0,0 +1,17 @@
+from .bloom_filter import BloomFilter, MemoryBloomFilter, RedisBloomFilter
+from .device_polling import DevicePolling, device_polling
+from .ephemeral import (
+    EphemeralStore,
+    MemoryEphemeralStore,
+    RedisEphemeralStore,
+    create_ephemeral_store,
+    ephemeral_store,
+)
+from .errors import EphemeralStoreUnavailableError
+from .invalidation import InvalidationChannel
+from .revocation import (
+    create_revocation_filter,
+    keep_revocation_filter,
+    rebuild_revocation_filter,
+    revocation_filter,
+)
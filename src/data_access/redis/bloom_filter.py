@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+from typing import Awaitable, Callable, Iterable, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+ItemsLoader = Callable[[], Awaitable[Iterable[str]]]
+
+
+class BloomFilter:
+    """
+    Probabilistic set answering "definitely not present" or "maybe present".
+
+    The bit array is sized for `capacity` items at the given false positive
+    rate. Until the filter has been built (see `rebuild`) every lookup
+    answers "maybe present", so callers always fall back to the source of
+    truth while the filter is not ready.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+
+    def _positions(self, item: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over a single SHA-256 digest.
+        digest = hashlib.sha256(item.encode()).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return [
+            (first + i * second) % self.size for i in range(self.hash_count)
+        ]
+
+    async def add(self, item: str) -> None:
+        raise NotImplementedError
+
+    async def might_contain(self, item: str) -> bool:
+        raise NotImplementedError
+
+    async def is_ready(self) -> bool:
+        """False while lookups fall back to the source of truth."""
+        raise NotImplementedError
+
+    async def rebuild(self, load_items: ItemsLoader) -> None:
+        """
+        Replaces the filter content with the items returned by `load_items`.
+
+        Items added while the rebuild is running are written to the new bit
+        array as well, so nothing committed concurrently is lost.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryBloomFilter(BloomFilter):
+    """
+    Bloom filter kept in the memory of the current process.
+
+    Additions made by other processes are not seen, so this backend is only
+    suitable for single-process deployments and tests.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        super().__init__(capacity=capacity, error_rate=error_rate)
+        self._bits: Optional[bytearray] = None
+        self._rebuilding: Optional[bytearray] = None
+
+    def _new_bits(self) -> bytearray:
+        return bytearray(math.ceil(self.size / 8))
+
+    @staticmethod
+    def _set(bits: bytearray, positions: list[int]) -> None:
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+
+    async def add(self, item: str) -> None:
+        positions = self._positions(item)
+        for bits in (self._bits, self._rebuilding):
+            if bits is not None:
+                self._set(bits, positions)
+
+    async def might_contain(self, item: str) -> bool:
+        bits = self._bits
+        if bits is None:
+            return True
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    async def is_ready(self) -> bool:
+        return self._bits is not None
+
+    async def rebuild(self, load_items: ItemsLoader) -> None:
+        self._rebuilding = self._new_bits()
+        try:
+            items = await load_items()
+            count = 0
+            for item in items:
+                self._set(self._rebuilding, self._positions(item))
+                count += 1
+            self._bits = self._rebuilding
+        finally:
+            self._rebuilding = None
+        logger.info(f"Bloom filter rebuilt in memory with {count} items.")
+
+
+class RedisBloomFilter(BloomFilter):
+    """
+    Bloom filter stored as a Redis bitmap shared by every worker.
+
+    The filter is considered ready while its key exists, so a flushed or
+    never built Redis makes every lookup fall back to the database. Redis
+    errors are treated the same way.
+
+    An addition that fails leaves the shared bitmap without the item, so
+    the filter is marked broken in Redis and every worker falls back until
+    the next rebuild. When the mark can not be written either, this worker
+    retries it on its next lookup and readiness check.
+    """
+
+    # Sets the bits in the live filter and, during a rebuild, in the new one.
+    # Missing keys are not created, otherwise a partial filter would appear.
+    ADD_SCRIPT = """
+    for index = 1, #KEYS do
+        if redis.call('EXISTS', KEYS[index]) == 1 then
+            for _, position in ipairs(ARGV) do
+                redis.call('SETBIT', KEYS[index], position, 1)
+            end
+        end
+    end
+    """
+    REBUILD_TIMEOUT = 300
+
+    def __init__(
+        self, redis_url: str, key: str, capacity: int, error_rate: float
+    ) -> None:
+        super().__init__(capacity=capacity, error_rate=error_rate)
+        self.redis_url = redis_url
+        self.key = key
+        self.rebuild_key = f"{key}:rebuilding"
+        self.lock_key = f"{key}:lock"
+        self.broken_key = f"{key}:broken"
+        self._redis: Optional[aioredis.Redis[bytes]] = None
+        # Set by a failed addition until the next rebuild of this worker.
+        self._broken = False
+        # Set while the broken mark is not written to Redis.
+        self._mark_pending = False
+
+    @property
+    def redis(self) -> aioredis.Redis[bytes]:
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url)
+        return self._redis
+
+    async def add(self, item: str) -> None:
+        try:
+            await self.redis.eval(
+                self.ADD_SCRIPT,
+                2,
+                self.key,
+                self.rebuild_key,
+                *self._positions(item),
+            )
+        except RedisError as exc:
+            # The item is missing from the shared filter now, so nobody may
+            # trust it until the next rebuild.
+            logger.error(f"Can not add an item to the bloom filter: {exc}")
+            self._broken = True
+            self._mark_pending = True
+            await self._mark_broken()
+
+    async def _mark_broken(self) -> None:
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(self.broken_key, 1)
+                pipe.delete(self.key)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.error(f"Can not mark the bloom filter broken: {exc}")
+            return
+        self._mark_pending = False
+
+    async def might_contain(self, item: str) -> bool:
+        if self._broken:
+            if self._mark_pending:
+                await self._mark_broken()
+            return True
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.exists(self.key)
+                pipe.exists(self.broken_key)
+                for position in self._positions(item):
+                    pipe.getbit(self.key, position)
+                exists, broken, *bits = await pipe.execute()
+        except RedisError as exc:
+            logger.warning(f"Bloom filter lookup failed: {exc}")
+            return True
+        return not exists or bool(broken) or all(bits)
+
+    async def is_ready(self) -> bool:
+        if self._broken:
+            if self._mark_pending:
+                await self._mark_broken()
+            return False
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.exists(self.key)
+                pipe.exists(self.broken_key)
+                exists, broken = await pipe.execute()
+        except RedisError:
+            return False
+        return bool(exists) and not broken
+
+    async def rebuild(self, load_items: ItemsLoader) -> None:
+        if not await self.redis.set(
+            self.lock_key, 1, nx=True, ex=self.REBUILD_TIMEOUT
+        ):
+            logger.info("Bloom filter is being rebuilt by another worker.")
+            return
+
+        try:
+            await self.redis.delete(self.rebuild_key)
+            # The new bitmap has to exist before the items are loaded, so
+            # that additions committed after the load reach it.
+            await self.redis.setbit(self.rebuild_key, self.size - 1, 0)
+            await self.redis.expire(self.rebuild_key, self.REBUILD_TIMEOUT)
+
+            count = 0
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for item in await load_items():
+                    for position in self._positions(item):
+                        pipe.setbit(self.rebuild_key, position, 1)
+                    count += 1
+                await pipe.execute()
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.persist(self.rebuild_key)
+                pipe.rename(self.rebuild_key, self.key)
+                pipe.delete(self.broken_key)
+                await pipe.execute()
+            self._broken = False
+            self._mark_pending = False
+        finally:
+            await self.redis.delete(self.lock_key)
+        logger.info(f"Bloom filter rebuilt in Redis with {count} items.")
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
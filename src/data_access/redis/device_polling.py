@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from src.data_access.redis.ephemeral import (
+    DEVICE_POLL,
+    DEVICE_POLL_INTERVAL,
+    DEVICE_POLL_THROTTLE,
+    EphemeralStore,
+    ephemeral_store,
+)
+
+# Answers of `DevicePolling.poll`.
+PENDING = "pending"
+APPROVED = "approved"
+DENIED = "denied"
+SLOW_DOWN = "slow_down"
+EXPIRED = "expired"
+UNKNOWN = "unknown"
+
+
+class DevicePolling:
+    """
+    Authorization state of the device codes polled on the token endpoint.
+
+    A device code is `start`ed as pending when the device authorization
+    request is answered, then `approve`d or `deny`ed by the user. Polls of a
+    pending code are answered from the store alone; a poll that comes within
+    `interval` seconds of the previous one gets `slow_down` and the interval
+    grows by `SLOW_DOWN_STEP` seconds as RFC 8628 requires. Only a poll of an
+    approved code has to read the grant from the database.
+
+    The status is only written by `approve` and `deny`, the grown interval
+    is kept under its own key: a poll answered with `slow_down` while the
+    user approves can not write the pending status back.
+
+    Reference: https://www.rfc-editor.org/rfc/rfc8628#section-3.5
+    """
+
+    SLOW_DOWN_STEP = 5
+    # Expired codes are kept a while to answer `expired_token` rather than
+    # an unknown code.
+    EXPIRED_GRACE = 300
+
+    def __init__(self, store: EphemeralStore) -> None:
+        self.store = store
+
+    def _ttl(self, expires_at: int) -> int:
+        return max(expires_at - int(time.time()), 0) + self.EXPIRED_GRACE
+
+    async def start(
+        self, device_code: str, client_id: str, interval: int, expires_at: int
+    ) -> None:
+        ttl = self._ttl(expires_at)
+        await self.store.put(
+            DEVICE_POLL,
+            device_code,
+            {
+                "status": PENDING,
+                "client_id": client_id,
+                "interval": interval,
+                "expires_at": expires_at,
+            },
+            ttl=ttl,
+        )
+
+    async def _set_status(
+        self, device_code: str, status: str, ttl: Optional[int] = None
+    ) -> None:
+        state = await self.store.get(DEVICE_POLL, device_code)
+        if state is None:
+            return
+        if ttl is None:
+            ttl = self._ttl(state["expires_at"])
+        await self.store.put(
+            DEVICE_POLL, device_code, state | {"status": status}, ttl=ttl
+        )
+
+    async def approve(self, device_code: str, ttl: int) -> None:
+        """Marks the code approved for the `ttl` seconds of its grant."""
+        await self._set_status(device_code, APPROVED, ttl=ttl)
+
+    async def deny(self, device_code: str) -> None:
+        await self._set_status(device_code, DENIED)
+
+    async def poll(self, device_code: str, client_id: str) -> str:
+        """
+        The answer to a poll of the device code by the client.
+
+        UNKNOWN means the code is not tracked here, the caller falls back to
+        the database.
+        """
+        state = await self.store.get(DEVICE_POLL, device_code)
+        if state is None or state["client_id"] != client_id:
+            return UNKNOWN
+        if state["status"] in (APPROVED, DENIED):
+            return state["status"]
+        if state["expires_at"] <= time.time():
+            return EXPIRED
+        grown = await self.store.get(DEVICE_POLL_INTERVAL, device_code)
+        interval = state["interval"] if grown is None else grown["interval"]
+        if not await self.store.add(
+            DEVICE_POLL_THROTTLE, device_code, {}, ttl=interval
+        ):
+            await self.store.put(
+                DEVICE_POLL_INTERVAL,
+                device_code,
+                {"interval": interval + self.SLOW_DOWN_STEP},
+                ttl=self._ttl(state["expires_at"]),
+            )
+            return SLOW_DOWN
+        return PENDING
+
+    async def finish(self, device_code: str) -> None:
+        """Forgets the code once its tokens are issued."""
+        await self.store.delete(DEVICE_POLL, device_code)
+        await self.store.delete(DEVICE_POLL_INTERVAL, device_code)
+        await self.store.delete(DEVICE_POLL_THROTTLE, device_code)
+
+
+device_polling = (
+    DevicePolling(ephemeral_store) if ephemeral_store is not None else None
+)
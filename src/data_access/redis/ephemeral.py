@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.data_access.redis.errors import EphemeralStoreUnavailableError
+
+from src.dyna_config import (
+    EPHEMERAL_STORE_BACKEND,
+    EPHEMERAL_STORE_PREFIX,
+    REDIS_URL,
+)
+
+logger = logging.getLogger(__name__)
+
+Artifact = dict[str, Any]
+
+# Kinds of the artifacts kept in the store.
+AUTHORIZATION_CODE = "authorization_code"
+CODE_CHALLENGE = "code_challenge"
+DEVICE = "device"
+DEVICE_CODE = "device_code"
+DEVICE_POLL = "device_poll"
+DEVICE_POLL_INTERVAL = "device_poll_interval"
+DEVICE_POLL_THROTTLE = "device_poll_throttle"
+STATE = "state"
+
+
+class EphemeralStore:
+    """
+    Short-lived artifacts of the login flows: authorization codes, device
+    codes, third-party `state` values and PKCE challenges.
+
+    An artifact is a JSON serializable dictionary stored under its kind and
+    key; it is dropped by the store itself once `ttl` seconds have passed,
+    so nothing is left to clean up. `pop` reads and deletes an artifact in
+    one step, a single use artifact can not be redeemed twice.
+
+    Every method raises `EphemeralStoreUnavailableError` when the backend
+    can not be reached, the API answers it with 503.
+    """
+
+    async def put(self, kind: str, key: str, value: Artifact, ttl: int) -> None:
+        raise NotImplementedError
+
+    async def add(self, kind: str, key: str, value: Artifact, ttl: int) -> bool:
+        """Stores the artifact unless there is one, returns True if it did."""
+        raise NotImplementedError
+
+    async def get(self, kind: str, key: str) -> Optional[Artifact]:
+        raise NotImplementedError
+
+    async def pop(self, kind: str, key: str) -> Optional[Artifact]:
+        raise NotImplementedError
+
+    async def delete(self, kind: str, key: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryEphemeralStore(EphemeralStore):
+    """
+    Ephemeral store kept in the memory of the current process.
+
+    Artifacts written by other processes are not seen, so this backend is
+    only suitable for single-process deployments and tests.
+    """
+
+    def __init__(self) -> None:
+        self._artifacts: dict[tuple[str, str], tuple[Artifact, float]] = {}
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        expired = [
+            item
+            for item, (_, expires_at) in self._artifacts.items()
+            if expires_at <= now
+        ]
+        for item in expired:
+            del self._artifacts[item]
+
+    async def put(self, kind: str, key: str, value: Artifact, ttl: int) -> None:
+        self._purge()
+        self._artifacts[(kind, key)] = (
+            json.loads(json.dumps(value)),
+            time.monotonic() + ttl,
+        )
+
+    async def add(self, kind: str, key: str, value: Artifact, ttl: int) -> bool:
+        self._purge()
+        if (kind, key) in self._artifacts:
+            return False
+        await self.put(kind, key, value, ttl)
+        return True
+
+    async def get(self, kind: str, key: str) -> Optional[Artifact]:
+        self._purge()
+        artifact = self._artifacts.get((kind, key))
+        return None if artifact is None else artifact[0]
+
+    async def pop(self, kind: str, key: str) -> Optional[Artifact]:
+        self._purge()
+        artifact = self._artifacts.pop((kind, key), None)
+        return None if artifact is None else artifact[0]
+
+    async def delete(self, kind: str, key: str) -> None:
+        self._artifacts.pop((kind, key), None)
+
+
+class RedisEphemeralStore(EphemeralStore):
+    """
+    Ephemeral store shared by every worker through Redis.
+
+    Artifacts expire with the native key TTL and `pop` is a single GETDEL.
+    Keys hold the SHA-256 digest of the artifact key, so codes and states
+    do not show up in key listings.
+    """
+
+    def __init__(self, redis_url: str, prefix: str) -> None:
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self._redis: Optional[aioredis.Redis[str]] = None
+
+    @property
+    def redis(self) -> aioredis.Redis[str]:
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                self.redis_url, encoding="utf8", decode_responses=True
+            )
+        return self._redis
+
+    def _key(self, kind: str, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return f"{self.prefix}:{kind}:{digest}"
+
+    @contextmanager
+    def _unavailable_on_error(self) -> Iterator[None]:
+        try:
+            yield
+        except RedisError as exc:
+            logger.error(f"Ephemeral store is unavailable: {exc}")
+            raise EphemeralStoreUnavailableError from exc
+
+    async def put(self, kind: str, key: str, value: Artifact, ttl: int) -> None:
+        with self._unavailable_on_error():
+            await self.redis.set(
+                self._key(kind, key), json.dumps(value), ex=ttl
+            )
+
+    async def add(self, kind: str, key: str, value: Artifact, ttl: int) -> bool:
+        with self._unavailable_on_error():
+            return bool(
+                await self.redis.set(
+                    self._key(kind, key), json.dumps(value), ex=ttl, nx=True
+                )
+            )
+
+    async def get(self, kind: str, key: str) -> Optional[Artifact]:
+        with self._unavailable_on_error():
+            value = await self.redis.get(self._key(kind, key))
+        return None if value is None else json.loads(value)
+
+    async def pop(self, kind: str, key: str) -> Optional[Artifact]:
+        with self._unavailable_on_error():
+            value = await self.redis.getdel(self._key(kind, key))
+        return None if value is None else json.loads(value)
+
+    async def delete(self, kind: str, key: str) -> None:
+        with self._unavailable_on_error():
+            await self.redis.delete(self._key(kind, key))
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+def create_ephemeral_store(backend: str) -> Optional[EphemeralStore]:
+    """
+    The store of the backend, None for "postgresql": the repositories then
+    keep the artifacts in their tables.
+    """
+    if backend == "postgresql":
+        return None
+    if backend == "redis":
+        return RedisEphemeralStore(
+            redis_url=REDIS_URL, prefix=EPHEMERAL_STORE_PREFIX
+        )
+    if backend == "memory":
+        return MemoryEphemeralStore()
+    raise ValueError(f"Unknown ephemeral store backend: {backend}")
+
+
+ephemeral_store = create_ephemeral_store(EPHEMERAL_STORE_BACKEND)
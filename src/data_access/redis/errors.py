@@ -0,0 +1,2 @@
+class EphemeralStoreUnavailableError(Exception):
+    """Use this class when the ephemeral store can not be reached"""
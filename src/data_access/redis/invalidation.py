@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[str], None]
+
+
+class InvalidationChannel:
+    """
+    Broadcasts invalidated cache keys to every worker over Redis pub/sub.
+
+    Pub/sub keeps no history, so whenever the subscription is (re)opened the
+    handler receives `RESUBSCRIBED` and should drop everything it caches:
+    messages published while the worker was not listening are lost.
+    """
+
+    RESUBSCRIBED = "*"
+    RECONNECT_DELAY = 5
+
+    def __init__(self, redis_url: str, channel: str) -> None:
+        self.redis_url = redis_url
+        self.channel = channel
+        self._redis: Optional[aioredis.Redis[str]] = None
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    @property
+    def redis(self) -> aioredis.Redis[str]:
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                self.redis_url, encoding="utf8", decode_responses=True
+            )
+        return self._redis
+
+    async def publish(self, message: str) -> None:
+        try:
+            await self.redis.publish(self.channel, message)
+        except RedisError as exc:
+            logger.error(
+                f"Can not publish {message} to {self.channel}, other workers "
+                f"keep their caches until they expire: {exc}"
+            )
+
+    async def _listen(self, on_message: MessageHandler) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    on_message(self.RESUBSCRIBED)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            on_message(message["data"])
+            except RedisError as exc:
+                logger.warning(
+                    f"Subscription to {self.channel} lost, retrying in "
+                    f"{self.RECONNECT_DELAY}s: {exc}"
+                )
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    def start(self, on_message: MessageHandler) -> None:
+        """Calls `on_message` with every message until `close`."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(on_message))
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+
+from sqlalchemy.orm import sessionmaker
+
+from src.data_access.redis.bloom_filter import (
+    BloomFilter,
+    MemoryBloomFilter,
+    RedisBloomFilter,
+)
+from src.dyna_config import (
+    REDIS_URL,
+    REVOCATION_FILTER_BACKEND,
+    REVOCATION_FILTER_CAPACITY,
+    REVOCATION_FILTER_ERROR_RATE,
+    REVOCATION_FILTER_CHECK_INTERVAL,
+    REVOCATION_FILTER_KEY,
+    REVOCATION_FILTER_MAX_RETRY_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_revocation_filter(backend: str) -> BloomFilter:
+    if backend == "redis":
+        return RedisBloomFilter(
+            redis_url=REDIS_URL,
+            key=REVOCATION_FILTER_KEY,
+            capacity=REVOCATION_FILTER_CAPACITY,
+            error_rate=REVOCATION_FILTER_ERROR_RATE,
+        )
+    if backend == "memory":
+        return MemoryBloomFilter(
+            capacity=REVOCATION_FILTER_CAPACITY,
+            error_rate=REVOCATION_FILTER_ERROR_RATE,
+        )
+    raise ValueError(f"Unknown revocation filter backend: {backend}")
+
+
+async def rebuild_revocation_filter(session_factory: sessionmaker) -> bool:
+    """
+    Fills the revocation filter with the token digests of blacklisted_tokens.
+
+    A failed rebuild leaves the filter unusable, so every revocation check
+    falls back to the database until `keep_revocation_filter` retries it.
+    Returns False if the rebuild failed.
+    """
+    from src.data_access.postgresql.repositories import (
+        BlacklistedTokenRepository,
+    )
+
+    async def load_token_digests() -> list[str]:
+        async with session_factory() as session:
+            repository = BlacklistedTokenRepository(session)
+            return await repository.get_all_token_digests()
+
+    try:
+        await revocation_filter.rebuild(load_token_digests)
+    except Exception as exc:
+        logger.exception(f"Can not rebuild the revocation filter: {exc}")
+        return False
+    return True
+
+
+async def keep_revocation_filter(
+    session_factory: sessionmaker,
+    check_interval: int = REVOCATION_FILTER_CHECK_INTERVAL,
+    max_retry_delay: int = REVOCATION_FILTER_MAX_RETRY_DELAY,
+) -> None:
+    """
+    Rebuilds the revocation filter whenever it is not ready, until cancelled.
+
+    The filter is dropped after a failed addition or a Redis flush; it is
+    checked every `check_interval` seconds, failed rebuilds are retried
+    with a delay doubling up to `max_retry_delay` seconds.
+    """
+    delay = check_interval
+    while True:
+        await asyncio.sleep(delay)
+        if await revocation_filter.is_ready():
+            delay = check_interval
+            continue
+        logger.warning("Revocation filter is not ready, rebuilding it.")
+        if await rebuild_revocation_filter(session_factory):
+            delay = check_interval
+        else:
+            delay = min(delay * 2, max_retry_delay)
+
+
+revocation_filter = create_revocation_filter(REVOCATION_FILTER_BACKEND)
@@ -1,14 +1,11 @@
 from dependency_injector import containers, providers
 
 from src.config import get_app_settings
-from src.data_access.postgresql import Database
+from src.data_access.postgresql import get_database
 
 
 class Container(containers.DeclarativeContainer):
     config = providers.Object(get_app_settings())
 
-    db = providers.Singleton(
-        Database,
-        database_url=str(config().database_url),
-        max_connection_count=config().max_connection_count,
-    )
+    # Process-wide, every Container instance gets the same Database.
+    db = providers.Callable(get_database)
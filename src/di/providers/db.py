@@ -1,19 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from src.data_access.postgresql import Database
+from src.data_access.postgresql import Database, get_database
 
 
 def provide_db_stub() -> None:  # pragma: no cover
     ...
 
 
-def provide_db(database_url: str, max_connection_count: int) -> AsyncEngine:
-    return Database(
-        database_url=database_url, max_connection_count=max_connection_count
-    ).engine
+def provide_db() -> AsyncEngine:
+    return get_database().engine
 
 
-def provide_db_only(database_url: str, max_connection_count: int) -> Database:
-    return Database(
-        database_url=database_url, max_connection_count=max_connection_count
-    )
\ No newline at end of file
+def provide_db_only() -> Database:
+    return get_database()
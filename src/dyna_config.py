@@ -17,6 +17,12 @@ settings = Dynaconf(
 
 DB_URL = settings.db.get("url")
 DB_MAX_CONNECTION_COUNT = settings.db.get("max_connection_count")
+DB_POOL_MODE = settings.db.get("pool_mode")
+DB_WORKERS = settings.db.get("workers")
+DB_MAX_OVERFLOW = settings.db.get("max_overflow")
+DB_POOL_PRE_PING = settings.db.get("pool_pre_ping")
+DB_POOL_RECYCLE = settings.db.get("pool_recycle")
+DB_POOL_TIMEOUT = settings.db.get("pool_timeout")
 # DB_PORT = settings.db.get("port")
 
 
@@ -30,11 +36,94 @@ REDIS_HOST = settings.redis.get("host")
 REDIS_PORT = settings.redis.get("port")
 REDIS_URL = f"{REDIS_SCHEME}{REDIS_HOST}:{REDIS_PORT}"
 
+REVOCATION_FILTER_BACKEND = settings.revocation_filter.get("backend")
+REVOCATION_FILTER_KEY = settings.revocation_filter.get("key")
+REVOCATION_FILTER_CAPACITY = settings.revocation_filter.get("capacity")
+REVOCATION_FILTER_ERROR_RATE = settings.revocation_filter.get("error_rate")
+REVOCATION_FILTER_CHECK_INTERVAL = settings.revocation_filter.get(
+    "check_interval"
+)
+REVOCATION_FILTER_MAX_RETRY_DELAY = settings.revocation_filter.get(
+    "max_retry_delay"
+)
+
+INTROSPECTION_MAX_BATCH_SIZE = settings.introspection.get("max_batch_size")
+
+INTROSPECTION_CACHE_ENABLED = settings.introspection_cache.get("enabled")
+INTROSPECTION_CACHE_BACKEND = settings.introspection_cache.get("backend")
+INTROSPECTION_CACHE_INVALIDATION = settings.introspection_cache.get(
+    "invalidation"
+)
+INTROSPECTION_CACHE_CHANNEL = settings.introspection_cache.get("channel")
+INTROSPECTION_CACHE_TTL = settings.introspection_cache.get("ttl")
+INTROSPECTION_CACHE_NEGATIVE_TTL = settings.introspection_cache.get(
+    "negative_ttl"
+)
+INTROSPECTION_CACHE_MAX_SIZE = settings.introspection_cache.get("max_size")
+
+CLIENT_REGISTRY_INVALIDATION = settings.client_registry.get("invalidation")
+CLIENT_REGISTRY_CHANNEL = settings.client_registry.get("channel")
+CLIENT_REGISTRY_TTL = settings.client_registry.get("ttl")
+CLIENT_REGISTRY_MAX_SIZE = settings.client_registry.get("max_size")
+
+SCOPE_CATALOG_INVALIDATION = settings.scope_catalog.get("invalidation")
+SCOPE_CATALOG_CHANNEL = settings.scope_catalog.get("channel")
+
+USER_CLAIMS_INVALIDATION = settings.user_claims.get("invalidation")
+USER_CLAIMS_CHANNEL = settings.user_claims.get("channel")
+USER_CLAIMS_TTL = settings.user_claims.get("ttl")
+USER_CLAIMS_MAX_SIZE = settings.user_claims.get("max_size")
+
+EPHEMERAL_STORE_BACKEND = settings.ephemeral_store.get("backend")
+EPHEMERAL_STORE_PREFIX = settings.ephemeral_store.get("prefix")
+EPHEMERAL_STORE_STATE_TTL = settings.ephemeral_store.get("state_ttl")
+EPHEMERAL_STORE_CODE_CHALLENGE_TTL = settings.ephemeral_store.get(
+    "code_challenge_ttl"
+)
+
+CRYPTO_EXECUTOR_MODE = settings.crypto.get("executor_mode")
+CRYPTO_MAX_WORKERS = settings.crypto.get("max_workers")
+CRYPTO_MAX_QUEUE_SIZE = settings.crypto.get("max_queue_size")
+
+PASSWORD_HASH_ROUNDS = settings.password_hashing.get("rounds")
+PASSWORD_HASH_MAX_WORKERS = settings.password_hashing.get("max_workers")
+PASSWORD_HASH_MAX_CONCURRENCY = settings.password_hashing.get("max_concurrency")
+PASSWORD_HASH_ALGORITHM = settings.password_hashing.get("algorithm")
+PASSWORD_HASH_PBKDF2_ITERATIONS = settings.password_hashing.get(
+    "pbkdf2_iterations"
+)
+
+TOKEN_CACHE_ENABLED = settings.token_cache.get("enabled")
+TOKEN_CACHE_MAX_SIZE = settings.token_cache.get("max_size")
+
+KEY_RING_BACKEND = settings.key_ring.get("backend")
+KEY_RING_PATH = settings.key_ring.get("path")
+KEY_RING_ROTATION_INTERVAL = settings.key_ring.get("rotation_interval")
+KEY_RING_PUBLISH_AHEAD = settings.key_ring.get("publish_ahead")
+KEY_RING_RETENTION = settings.key_ring.get("retention")
+KEY_RING_RELOAD_INTERVAL = settings.key_ring.get("reload_interval")
+KEY_RING_ROTATION_CRONE = crontab(
+        **json.loads(
+            settings.key_ring.get("rotation_check_crone")
+        )
+    )
+
 CELERY_CLEANER_CRONE = crontab(
         **json.loads(
             settings.celery.get("db_cleaner_crone")
         )
     )
+PURGE_BATCH_SIZE = settings.purge.get("batch_size")
+PURGE_PAUSE = settings.purge.get("pause")
+PURGE_MAX_BATCHES = settings.purge.get("max_batches")
+PURGE_CONTINUATION_DELAY = settings.purge.get("continuation_delay")
+PURGE_MIN_INTERVAL = settings.purge.get("min_interval")
+PURGE_MAX_INTERVAL = settings.purge.get("max_interval")
+PURGE_PUSHGATEWAY = settings.purge.get("pushgateway")
+GRANT_PARTITION_INTERVAL = settings.grant_partitions.get("interval")
+GRANT_PARTITION_PREMAKE = settings.grant_partitions.get("premake")
+GRANT_PARTITION_LOCK_TIMEOUT = settings.grant_partitions.get("lock_timeout")
+GRANT_PARTITION_LOCK_RETRIES = settings.grant_partitions.get("lock_retries")
 
 IS_DEVELOPMENT = settings.env_for_dynaconf == "development"
 
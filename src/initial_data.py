@@ -1,11 +1,7 @@
-from src.dyna_config import (
-    DB_MAX_CONNECTION_COUNT,
-    DB_URL,
-)
+from src.data_access.postgresql import dispose_database, get_database
 from src.scripts.populate_data.populate_third_party_providers_data import (
     populate_identity_providers,
 )
-import src.di.providers as prov
 import logging
 import asyncio
 
@@ -13,11 +9,9 @@ logger = logging.getLogger(__name__)
 
 
 async def init() -> None:
-    db_engine = prov.provide_db(
-        database_url=DB_URL, max_connection_count=DB_MAX_CONNECTION_COUNT
-    )
-    session = prov.provide_async_session(db_engine)
-    await populate_identity_providers(session=session)
+    async with get_database().session_factory() as session:
+        await populate_identity_providers(session=session)
+    await dispose_database()
 
 
 async def main() -> None:
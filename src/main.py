@@ -1,6 +1,8 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from logging.config import dictConfig
-from typing import Optional, Any
+from typing import AsyncIterator, Optional, Any
 from fastapi import FastAPI
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
@@ -15,18 +17,26 @@ from src.presentation.middleware.https_global_middleware import (
 )
 from src.presentation.api import router
 from src.di import Container
-from src.dyna_config import (
-    DB_MAX_CONNECTION_COUNT,
-    DB_URL,
-    REDIS_URL,
-)
+from src.dyna_config import REDIS_URL
 
 import src.presentation.admin_ui.controllers as ui
 import src.di.providers as prov
 import logging
 from src.log import LOGGING_CONFIG
-from src.data_access.postgresql.repositories import UserRepository
-from src.business_logic.services.admin_auth import AdminAuthService
+from src.business_logic.jwt_manager.crypto_executor import crypto_executor
+from src.business_logic.jwt_manager.key_ring import key_ring
+from src.business_logic.services.password import password_executor
+from src.data_access.postgresql import dispose_database, get_database
+from src.business_logic.cache.introspection import introspection_cache
+from src.data_access.postgresql.client_registry import client_registry
+from src.data_access.postgresql.scope_catalog import scope_catalog
+from src.data_access.postgresql.user_claims import user_claims_cache
+from src.data_access.redis import (
+    ephemeral_store,
+    keep_revocation_filter,
+    rebuild_revocation_filter,
+    revocation_filter,
+)
 
 
 
@@ -39,11 +49,56 @@ class NewFastApi(FastAPI):
         self.container: Optional[Container] = None
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Redis activation
+    logger.info("Creating Redis connection with DataBase.")
+    redis = aioredis.from_url(REDIS_URL, encoding="utf8", decode_responses=True)
+    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    logger.info("Created Redis connection with DataBase.")
+
+    logger.info("Loading signing keys.")
+    await key_ring.refresh(force=True)
+
+    database = get_database()
+    logger.info("Building blacklisted tokens filter.")
+    await rebuild_revocation_filter(database.session_factory)
+    revocation_filter_keeper = asyncio.create_task(
+        keep_revocation_filter(database.session_factory)
+    )
+
+    logger.info("Subscribing to cache invalidations.")
+    client_registry.start()
+    introspection_cache.start()
+    scope_catalog.start()
+    user_claims_cache.start()
+
+    yield
+
+    logger.info("Stopping crypto executors.")
+    crypto_executor.shutdown()
+    password_executor.shutdown()
+    revocation_filter_keeper.cancel()
+    try:
+        await revocation_filter_keeper
+    except asyncio.CancelledError:
+        pass
+    await revocation_filter.close()
+    if ephemeral_store is not None:
+        await ephemeral_store.close()
+    await client_registry.close()
+    await introspection_cache.close()
+    await scope_catalog.close()
+    await user_claims_cache.close()
+    await redis.close()
+    await dispose_database()
+
+
 def get_application(test: bool = False) -> NewFastApi:
     # configure logging
     dictConfig(LOGGING_CONFIG)
 
-    application = NewFastApi()
+    application = NewFastApi(lifespan=lifespan)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -55,9 +110,7 @@ def get_application(test: bool = False) -> NewFastApi:
 
     application = setup_exception_handlers(application)
     setup_di(application)
-    container = Container()
-    container.db()
-    application.container = container
+    application.container = Container()
 
     application.include_router(router)
     application.mount(
@@ -69,15 +122,11 @@ def get_application(test: bool = False) -> NewFastApi:
     return application
 
 
-# TODO: move the creation of RSA keys here.
 def setup_di(app: FastAPI) -> None:
-    db_engine = prov.provide_db(
-        database_url=DB_URL, max_connection_count=DB_MAX_CONNECTION_COUNT
-    )
-
-    db = prov.provide_db_only(
-        database_url=DB_URL, max_connection_count=DB_MAX_CONNECTION_COUNT
-    )
+    # The one Database of the process, its connections are closed in the
+    # lifespan. sqladmin 0.10 needs an engine instance to mount the admin,
+    # so the engine object is built here; it connects on first use.
+    db = get_database()
     session = prov.ProviderSession(db.session_factory)
 
     app.dependency_overrides[
@@ -89,15 +138,11 @@ def setup_di(app: FastAPI) -> None:
     #Register admin-ui controllers on application start-up.
     admin = ui.CustomAdmin(
         app,
-        db_engine,
+        db.engine,
         templates_dir="src/presentation/admin_ui/controllers/templates",
         authentication_backend=ui.AdminAuthController(
             secret_key="1234",
-            auth_service=AdminAuthService(
-                user_repo=UserRepository(
-                    session=prov.provide_async_session(db_engine)
-                ),
-            ),
+            session_factory=db.session_factory,
         ),
     )
 
@@ -168,11 +213,3 @@ app = get_application()
 # expose the default Python metrics to the /metrics endpoint
 Instrumentator().instrument(app).expose(app)
 
-
-# Redis activation
-@app.on_event("startup")
-async def startup() -> None:
-    logger.info("Creating Redis connection with DataBase.")
-    redis = aioredis.from_url(REDIS_URL, encoding="utf8", decode_responses=True)
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
-    logger.info("Created Redis connection with DataBase.")
@@ -0,0 +1,110 @@
+"""
+Application level Prometheus metrics.
+
+Everything declared here is registered in the default registry and is
+therefore exposed on `/metrics` by the instrumentator set up in `main`,
+except the database cleaner metrics: they are updated in the Celery worker
+and pushed from there to a Pushgateway with `PURGE_REGISTRY`.
+"""
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+CRYPTO_EXECUTOR_QUEUE_DEPTH = Gauge(
+    "crypto_executor_queue_depth",
+    "Number of crypto jobs (token signing, password hashing) submitted and not finished yet.",
+    ["executor", "mode"],
+)
+CRYPTO_EXECUTOR_WAIT_SECONDS = Histogram(
+    "crypto_executor_wait_seconds",
+    "Time a crypto job waited before it started running.",
+    ["executor", "mode"],
+    buckets=(
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+    ),
+)
+VERIFIED_TOKEN_CACHE_REQUESTS = Counter(
+    "verified_token_cache_requests_total",
+    "Lookups of bearer tokens in the verified token cache.",
+    ["result"],
+)
+CLIENT_REGISTRY_REQUESTS = Counter(
+    "client_registry_requests_total",
+    "Lookups of client metadata in the client registry cache.",
+    ["result"],
+)
+USER_CLAIMS_REQUESTS = Counter(
+    "user_claims_requests_total",
+    "Lookups of user claims in the user claims cache.",
+    ["result"],
+)
+INTROSPECTION_CACHE_REQUESTS = Counter(
+    "introspection_cache_requests_total",
+    "Lookups of introspection responses per cache tier.",
+    ["tier", "result"],
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent acquiring a PostgreSQL connection from the pool.",
+    buckets=(
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+    ),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "PostgreSQL connections currently checked out of the pool.",
+)
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_capacity_connections",
+    "Maximum number of PostgreSQL connections the pool may open (size + overflow).",
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time spent hashing or verifying a password, waiting for the pool included.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+PURGE_REGISTRY = CollectorRegistry()
+PURGE_DELETED_ROWS = Gauge(
+    "purge_deleted_rows",
+    "Expired rows deleted by the last database cleaner run.",
+    ["table"],
+    registry=PURGE_REGISTRY,
+)
+PURGE_ROWS_PER_SECOND = Gauge(
+    "purge_rows_per_second",
+    "Delete throughput of the last database cleaner run.",
+    ["table"],
+    registry=PURGE_REGISTRY,
+)
+PURGE_LAG_SECONDS = Gauge(
+    "purge_lag_seconds",
+    "How long the oldest expired row left by the last cleaner run has been expired.",
+    ["table"],
+    registry=PURGE_REGISTRY,
+)
+PURGE_LAST_RUN = Gauge(
+    "purge_last_run_timestamp_seconds",
+    "Unix time the last database cleaner run finished.",
+    registry=PURGE_REGISTRY,
+)
@@ -4,6 +4,7 @@ from typing import Union, TypeVar
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.business_logic.cache.key_builders import invalidate_userinfo
 from src.data_access.postgresql.repositories import UserRepository
 from src.business_logic.services.admin_api import AdminUserService
 from src.data_access.postgresql.errors.user import DuplicationError
@@ -96,6 +97,7 @@ async def update_user(
         user_id=user_id, kwargs=data_to_change
     )
     await session.commit()
+    await invalidate_userinfo(user_id)
 
 @admin_user_router.delete(
     "/{user_id}", status_code=200, tags=["Administration User"], description= "Delete User by ID"
@@ -112,6 +114,7 @@ async def delete_user(
         )
     await user_class.delete_user(user_id=user_id)
     await session.commit()
+    await invalidate_userinfo(user_id)
 
 
 @admin_user_router.post(
@@ -125,7 +125,7 @@ class CustomAdmin(Admin):
 
                 elif identity == "user-password":
                     dict_form_data = dict(form_data)
-                    dict_form_data["value"] = PasswordHash.hash_password(
+                    dict_form_data["value"] = await PasswordHash.hash_password(
                         dict_form_data["value"]
                     )
 
@@ -4,32 +4,40 @@ from sqladmin.authentication import AuthenticationBackend
 from starlette.requests import Request
 from typing import Union
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 from src.business_logic.dto import AdminCredentialsDTO
 from src.business_logic.services import AdminAuthService
+from src.data_access.postgresql.repositories import UserRepository
 
 logger = logging.getLogger(__name__)
 
 
 class AdminAuthController(AuthenticationBackend):
-    def __init__(self, secret_key: str, auth_service: AdminAuthService) -> None:
-        self.auth_service = auth_service
+    def __init__(self, secret_key: str, session_factory: sessionmaker) -> None:
+        self.session_factory = session_factory
         super().__init__(secret_key=secret_key)
 
+    def get_auth_service(self, session: AsyncSession) -> AdminAuthService:
+        return AdminAuthService(user_repo=UserRepository(session=session))
+
     async def login(self, request: Request) -> bool:
         data_from_form = await request.form()
-        try:
-            token = await self.auth_service.authorize(
-                credentials=AdminCredentialsDTO(
-                    username=data_from_form.get("username"),
-                    password=data_from_form.get("password"),
+        # A session per login, so the connection goes back to the pool.
+        async with self.session_factory() as session:
+            try:
+                token = await self.get_auth_service(session).authorize(
+                    credentials=AdminCredentialsDTO(
+                        username=data_from_form.get("username"),
+                        password=data_from_form.get("password"),
+                    )
                 )
-            )
-            request.session.update({"Token": token})
-            return True
-        # TODO: Add different error types support!
-        except Exception as e:
-            logger.error(e)
-            return False
+                request.session.update({"Token": token})
+                return True
+            # TODO: Add different error types support!
+            except Exception as e:
+                logger.error(e)
+                return False
 
     async def logout(self, request: Request) -> bool:
         request.session.clear()
@@ -37,4 +45,6 @@ class AdminAuthController(AuthenticationBackend):
 
     async def authenticate(self, request: Request) -> Union[None, RedirectResponse]:
         token = request.session.get("Token")
-        return await self.auth_service.authenticate(token)
+        # Only the token signature is checked, no connection is taken.
+        async with self.session_factory() as session:
+            return await self.get_auth_service(session).authenticate(token)
@@ -7,8 +7,10 @@ from wtforms import Form
 from src.data_access.postgresql.tables.client import *
 
 from src.data_access.postgresql.tables import ClientScope
+from .mixins import ClientRegistryMixin, ReferenceDataMixin
 
-class ClientAdminController(ModelView, model=Client):
+
+class ClientAdminController(ClientRegistryMixin, ModelView, model=Client):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [
         Client.client_id,
@@ -92,7 +94,9 @@ class ResponseTypeAdminController(ModelView, model=ResponseType):
     ]
 
 
-class AccessTokenTypeAdminController(ModelView, model=AccessTokenType):
+class AccessTokenTypeAdminController(
+    ReferenceDataMixin, ModelView, model=AccessTokenType
+):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [
         AccessTokenType.id,
@@ -105,13 +109,15 @@ class ProtocolTypeController(ModelView, model=ProtocolType):
     column_list = [ProtocolType.id, ProtocolType.type]
 
 
-class RefreshTokenUsageTypeController(ModelView, model=RefreshTokenUsageType):
+class RefreshTokenUsageTypeController(
+    ReferenceDataMixin, ModelView, model=RefreshTokenUsageType
+):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [RefreshTokenUsageType.id, RefreshTokenUsageType.type]
 
 
 class RefreshTokenExpirationTypeController(
-    ModelView, model=RefreshTokenExpirationType
+    ReferenceDataMixin, ModelView, model=RefreshTokenExpirationType
 ):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [
@@ -131,7 +137,7 @@ class ClientClaimController(ModelView, model=ClientClaim):
 
 
 class ClientPostLogoutRedirectUriController(
-    ModelView, model=ClientPostLogoutRedirectUri
+    ClientRegistryMixin, ModelView, model=ClientPostLogoutRedirectUri
 ):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [
@@ -146,16 +152,18 @@ class ClientCorsOriginController(ModelView, model=ClientCorsOrigin):
     column_list = [ClientCorsOrigin.id, ClientCorsOrigin.origin]
 
 
-class ClientRedirectUriController(ModelView, model=ClientRedirectUri):
+class ClientRedirectUriController(
+    ClientRegistryMixin, ModelView, model=ClientRedirectUri
+):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [ClientRedirectUri.id, ClientRedirectUri.redirect_uri]
 
-class ClientScopeController(ModelView, model=ClientScope):
+class ClientScopeController(ClientRegistryMixin, ModelView, model=ClientScope):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [ClientScope.id, ClientScope.resource, ClientScope.scope, ClientScope.claim]
 
 
-class ClientSecretController(ModelView, model=ClientSecret):
+class ClientSecretController(ClientRegistryMixin, ModelView, model=ClientSecret):
     icon = "fa-solid fa-mobile-screen-button"
     column_list = [
         ClientSecret.id,
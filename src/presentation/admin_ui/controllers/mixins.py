@@ -0,0 +1,155 @@
+from typing import Any, Optional
+
+from src.business_logic.cache.introspection import introspection_cache
+from src.business_logic.cache.key_builders import invalidate_userinfo
+from src.business_logic.cache.static_documents import well_known_documents
+from src.data_access.postgresql.client_registry import client_registry
+from src.data_access.postgresql.reference_data import reference_data
+from src.data_access.postgresql.scope_catalog import scope_catalog
+
+
+class OpenIdConfigurationMixin:
+    """
+    Rebuilds the OpenID configuration after the model listed in it changes.
+
+    Mixed into the views of the claim types and API resources, which end up
+    in "claims_supported" and "scopes_supported".
+    """
+
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        well_known_documents.invalidate("openid-configuration")
+
+    async def after_model_delete(self, model: Any) -> None:
+        well_known_documents.invalidate("openid-configuration")
+
+
+class ScopeCatalogMixin(OpenIdConfigurationMixin):
+    """
+    Rebuilds the scope catalog and the OpenID configuration after a change.
+
+    Mixed into the views of the API resources, scopes and scope claims. The
+    cached client metadata holds their names too, so it is dropped as well.
+    """
+
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        await scope_catalog.publish_invalidation()
+        await client_registry.publish_invalidation()
+        await super().after_model_change(data, model, is_created)
+
+    async def after_model_delete(self, model: Any) -> None:
+        await scope_catalog.publish_invalidation()
+        await client_registry.publish_invalidation()
+        await super().after_model_delete(model)
+
+
+class ReferenceDataMixin:
+    """
+    Reloads the cached lookup table of the model after it changes.
+
+    Mixed into the views of the enumeration tables kept by `reference_data`
+    (grant types, access token types, refresh token types).
+    """
+
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        reference_data.invalidate(type(model))
+
+    async def after_model_delete(self, model: Any) -> None:
+        reference_data.invalidate(type(model))
+
+
+class ClientRegistryMixin:
+    """
+    Drops the cached client metadata in every worker after a change.
+
+    Mixed into the views of the client and its child tables. Those reference
+    the client by its integer id, so the whole registry is invalidated.
+    """
+
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        await client_registry.publish_invalidation()
+
+    async def after_model_delete(self, model: Any) -> None:
+        await client_registry.publish_invalidation()
+
+
+class IntrospectionCacheMixin:
+    """
+    Drops the cached introspection responses of a changed or deleted grant.
+
+    Mixed into the view of the persistent grants. The token of an edited
+    grant is kept from before the change and dropped once the change is
+    committed, together with the new one: a lookup racing with the commit
+    may have cached either.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Token of each grant under edit by this view, by grant id.
+        self._edited_tokens: dict[int, str] = {}
+
+    async def on_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        if not is_created:
+            self._edited_tokens[model.id] = model.grant_data
+
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        try:
+            previous = self._edited_tokens.get(model.id)
+            if previous is not None and previous != model.grant_data:
+                await introspection_cache.invalidate(previous)
+            await introspection_cache.invalidate(model.grant_data)
+        finally:
+            self._edited_tokens.pop(model.id, None)
+
+    async def after_model_delete(self, model: Any) -> None:
+        await introspection_cache.invalidate(model.grant_data)
+
+
+class UserClaimsMixin:
+    """
+    Drops the cached claims and userinfo responses of the changed user.
+
+    Mixed into the views of the users and their claims; `user_id_attribute`
+    names the column of the model holding the user id.
+    """
+
+    user_id_attribute = "user_id"
+
+    def get_user_id(self, model: Any) -> Optional[int]:
+        return getattr(model, self.user_id_attribute, None)
+
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        await invalidate_userinfo(self.get_user_id(model))
+
+    async def after_model_delete(self, model: Any) -> None:
+        await invalidate_userinfo(self.get_user_id(model))
+
+
+class UserClaimTypeMixin(OpenIdConfigurationMixin):
+    """
+    Drops the cached claims and userinfo responses of every user, which are
+    keyed by the claim type names, and rebuilds the OpenID configuration.
+    """
+
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool
+    ) -> None:
+        await invalidate_userinfo()
+        await super().after_model_change(data, model, is_created)
+
+    async def after_model_delete(self, model: Any) -> None:
+        await invalidate_userinfo()
+        await super().after_model_delete(model)
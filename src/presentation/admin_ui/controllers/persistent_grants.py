@@ -1,15 +1,22 @@
 from sqladmin import ModelView
+from .mixins import IntrospectionCacheMixin, ReferenceDataMixin
 from src.data_access.postgresql.tables import PersistentGrant, PersistentGrantType
 
 
-class PersistentGrantAdminController(ModelView, model=PersistentGrant):
+class PersistentGrantAdminController(
+    IntrospectionCacheMixin, ModelView, model=PersistentGrant
+):
     icon = "fa-solid fa-key"
     column_list = [PersistentGrant.id, 
                   # PersistentGrant.client_id, 
                    PersistentGrant.expiration,
                    PersistentGrant.grant_data
                    ]
+    # Computed from grant_data on insert and edit.
+    form_excluded_columns = [PersistentGrant.grant_data_digest]
 
-class PersistentGrantTypeAdminController(ModelView, model=PersistentGrantType):
+class PersistentGrantTypeAdminController(
+    ReferenceDataMixin, ModelView, model=PersistentGrantType
+):
     icon = "fa-solid fa-key"
     column_list = [PersistentGrantType.id, PersistentGrantType.type_of_grant]
\ No newline at end of file
@@ -1,4 +1,5 @@
 from sqladmin import ModelView
+from .mixins import ScopeCatalogMixin
 from src.data_access.postgresql.tables import (
     ApiClaim, 
     ApiClaimType, 
@@ -10,7 +11,7 @@ from src.data_access.postgresql.tables import (
     ApiSecretType,  
 )
 
-class ApiResourceAdminController(ModelView, model=ApiResource):
+class ApiResourceAdminController(ScopeCatalogMixin, ModelView, model=ApiResource):
     icon = "fa-solid fa-network-wired"
     column_list = [ApiResource.id, 
                    ApiResource.name, 
@@ -39,7 +40,7 @@ class ApiClaimTypeAdminController(ModelView, model=ApiClaimType):
     column_list = [ApiClaimType.id, 
                    ApiClaimType.claim_type,]
     
-class ApiScopeAdminController(ModelView, model=ApiScope):
+class ApiScopeAdminController(ScopeCatalogMixin, ModelView, model=ApiScope):
     icon = "fa-solid fa-network-wired"
     column_list = [ApiScope.id, 
                    ApiScope.api_resources,
@@ -48,14 +49,14 @@ class ApiScopeAdminController(ModelView, model=ApiScope):
                    ApiScope.emphasize,
                    ]
     
-class ApiScopeClaimAdminController(ModelView, model=ApiScopeClaim):
+class ApiScopeClaimAdminController(ScopeCatalogMixin, ModelView, model=ApiScopeClaim):
     icon = "fa-solid fa-network-wired"
     column_list = [ApiScopeClaim.id, 
                    ApiScopeClaim.api_scopes,
                    ApiScopeClaim.scope_claim_type,
                    ]
     
-class ApiScopeClaimTypeAdminController(ModelView, model=ApiScopeClaimType):
+class ApiScopeClaimTypeAdminController(ScopeCatalogMixin, ModelView, model=ApiScopeClaimType):
     icon = "fa-solid fa-network-wired"
     column_list = [ApiScopeClaimType.id,
                    ApiScopeClaimType.scope_claim, 
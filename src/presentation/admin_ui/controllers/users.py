@@ -10,10 +10,14 @@ from src.data_access.postgresql.tables import (
 )
 from wtforms import Form
 
+from .mixins import UserClaimsMixin, UserClaimTypeMixin
+
 class UserAdminController(
+    UserClaimsMixin,
     ModelView,
     model=User,
 ):
+    user_id_attribute = "id"
     icon = "fa-solid fa-user"
     # column_labels = {User.username: "username"}
     column_list = [User.id, User.username, User.claims]
@@ -66,13 +70,15 @@ class UserAdminController(
         )
 
 
-class UserClaimAdminController(ModelView, model=UserClaim):
+class UserClaimAdminController(UserClaimsMixin, ModelView, model=UserClaim):
     icon = "fa-solid fa-user"
 
     column_list = [UserClaim.claim_type, UserClaim.claim_value, UserClaim.user]
 
 
-class TypesUserClaimAdminController(ModelView, model=UserClaimType):
+class TypesUserClaimAdminController(
+    UserClaimTypeMixin, ModelView, model=UserClaimType
+):
     icon = "fa-solid fa-user"
     column_list = [
         UserClaimType.id,
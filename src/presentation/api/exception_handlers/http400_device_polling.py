@@ -0,0 +1,35 @@
+from typing import Union
+from src.business_logic.get_tokens.errors import (
+    AccessDeniedError,
+    AuthorizationPendingError,
+    ExpiredTokenError,
+    SlowDownError,
+)
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.status import HTTP_400_BAD_REQUEST
+
+
+ExceptionsToHandle = Union[
+    AuthorizationPendingError,
+    SlowDownError,
+    AccessDeniedError,
+    ExpiredTokenError,
+]
+
+ERRORS = {
+    AuthorizationPendingError: "authorization_pending",
+    SlowDownError: "slow_down",
+    AccessDeniedError: "access_denied",
+    ExpiredTokenError: "expired_token",
+}
+
+
+async def http400_device_polling_handler(
+    _: Request, exc: ExceptionsToHandle
+) -> JSONResponse:
+    headers = {"Cache-Control": "no-store", "Pragma": "no-cache"}
+    content = {"error": ERRORS[type(exc)]}
+    return JSONResponse(
+        content=content, headers=headers, status_code=HTTP_400_BAD_REQUEST
+    )
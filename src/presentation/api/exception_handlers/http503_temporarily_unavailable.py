@@ -0,0 +1,22 @@
+import logging
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
+
+from src.data_access.redis.errors import EphemeralStoreUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+async def http503_temporarily_unavailable_handler(
+    _: Request, exc: EphemeralStoreUnavailableError
+) -> JSONResponse:
+    logger.exception(exc)
+    headers = {"Cache-Control": "no-store", "Pragma": "no-cache"}
+    content = {"error": "temporarily_unavailable"}
+    return JSONResponse(
+        content=content,
+        headers=headers,
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+    )
@@ -2,7 +2,9 @@ from dataclasses import dataclass
 from typing import Optional, Union
 
 from fastapi import Form
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.dyna_config import INTROSPECTION_MAX_BATCH_SIZE
 
 
 @dataclass
@@ -17,6 +19,20 @@ class BodyRequestIntrospectionModel:
         return f"Model {self.__class__.__name__}"  # pragma: no coverage
 
 
+class IntrospectionTokenModel(BaseModel):
+    token: str
+    token_type_hint: Optional[str] = None
+
+
+class BodyRequestBatchIntrospectionModel(BaseModel):
+    tokens: list[IntrospectionTokenModel] = Field(
+        ..., min_items=1, max_items=INTROSPECTION_MAX_BATCH_SIZE
+    )
+
+    def __repr__(self) -> str:
+        return f"Model {self.__class__.__name__}"  # pragma: no coverage
+
+
 class ResponseIntrospectionModel(BaseModel):
     active: bool
     scope: Optional[Union[list[str], str]]
@@ -11,6 +11,7 @@ from src.data_access.postgresql.repositories import (
     UserRepository,
 )
 from src.presentation.api.models.introspection import (
+    BodyRequestBatchIntrospectionModel,
     BodyRequestIntrospectionModel,
     ResponseIntrospectionModel,
 )
@@ -54,3 +55,30 @@ async def post_introspection(
     introspection_class.request_body = request_body
     logger.debug(f"Introspection for token {request_body.token} started")
     return await introspection_class.analyze_token()
+
+
+@introspection_router.post(
+    "/batch", response_model=list[ResponseIntrospectionModel]
+)
+async def post_batch_introspection(
+    request: Request,
+    request_body: BodyRequestBatchIntrospectionModel,
+    auth_swagger: Optional[str] = Header(
+        default=None, description="Authorization"
+    ),  # crutch for swagger
+    session: AsyncSession = Depends(provide_async_session_stub),
+) -> list[dict[str, Any]]:
+    introspection_class = IntrospectionService(
+        session=session,
+        user_repo=UserRepository(session),
+        persistent_grant_repo=PersistentGrantRepository(session),
+        client_repo=ClientRepository(session),
+    )
+    introspection_class.request = request
+    introspection_class.authorization = (
+        request.headers.get("authorization") or auth_swagger
+    )
+    logger.debug(
+        f"Introspection of {len(request_body.tokens)} tokens started"
+    )
+    return await introspection_class.analyze_tokens(request_body.tokens)
@@ -2,6 +2,7 @@ import logging
 from fastapi import APIRouter, Depends, Header, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession  
 from src.business_logic.services import ClientService, ScopeService
+from src.data_access.postgresql.client_registry import client_registry
 from src.data_access.postgresql.errors import ClientNotFoundError
 from typing import Any, Callable
 from pydantic import ValidationError
@@ -59,6 +60,7 @@ async def update_client(
     client_service.request_model = request_body
     await client_service.update(client_id=client_id)
     await session.commit()
+    await client_registry.publish_invalidation(client_id)
     return {"message": "Client data updated successfully"}
 
 
@@ -120,4 +122,5 @@ async def delete_client(
         client_id=client_id
     )
     await session.commit()
+    await client_registry.publish_invalidation(client_id)
     return {"message": "Client deleted successfully"}
@@ -6,6 +6,7 @@ from src.presentation.api.models.user import (
     RequestUserModel,
     RequestAddInfoUserModel,
 )
+from src.business_logic.cache.key_builders import invalidate_userinfo
 from src.business_logic.services import AdminUserService
 from src.dyna_config import DOMAIN_NAME
 from fastapi.templating import Jinja2Templates
@@ -78,8 +79,11 @@ async def add_info(
         session=session, user_repo=UserRepository(session)
     )
     new_claims = request_body.__dict__
-    await user_service.add_user_info(data=new_claims, username=username)
+    user_id = await user_service.add_user_info(
+        data=new_claims, username=username
+    )
     await session.commit()
+    await invalidate_userinfo(user_id)
     return templates.TemplateResponse(
         "user_registration_success.html", {"request": request}
     )
@@ -6,6 +6,10 @@ from fastapi_cache.coder import JsonCoder
 from fastapi_cache.decorator import cache
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.business_logic.cache.key_builders import (
+    USERINFO_NAMESPACE,
+    userinfo_key_builder,
+)
 from src.business_logic.services.userinfo import UserInfoService
 from src.config.settings.cache_time import CacheTimeSettings
 from src.data_access.postgresql.repositories import (
@@ -32,7 +36,8 @@ userinfo_router = APIRouter(
 @cache(
     expire=CacheTimeSettings.USERINFO,
     coder=JsonCoder,
-    # key_builder=builder_with_parametr,
+    key_builder=userinfo_key_builder,
+    namespace=USERINFO_NAMESPACE,
 )
 async def get_userinfo(
     request: Request,
@@ -85,7 +90,8 @@ async def post_userinfo(
 @cache(
     expire=CacheTimeSettings.USERINFO_JWT,
     coder=JsonCoder,
-    # key_builder=builder_with_parametr,
+    key_builder=userinfo_key_builder,
+    namespace=USERINFO_NAMESPACE,
 )
 async def get_userinfo_jwt(
     request: Request,
@@ -103,6 +109,4 @@ async def get_userinfo_jwt(
     token = request.headers.get("authorization") or auth_swagger
     userinfo_class.authorization = token
     logger.info("Collecting Claims from DataBase.")
-    result = await userinfo_class.get_user_info()
-    result = {k: v for k, v in result.items() if v is not None}
-    return await userinfo_class.jwt.encode_jwt(payload=result)
+    return await userinfo_class.get_user_info_jwt()
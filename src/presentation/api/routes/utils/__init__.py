@@ -6,3 +6,4 @@ from .error_responses import (
     UnauthorizedClientResponse,
     UnsupportedGrantTypeResponse,
 )
+from .static_documents import static_document_response
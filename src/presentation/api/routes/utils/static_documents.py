@@ -0,0 +1,22 @@
+from fastapi import Request, Response, status
+
+from src.business_logic.cache.static_documents import StaticDocument
+
+
+def static_document_response(
+    request: Request, document: StaticDocument, max_age: int
+) -> Response:
+    """
+    Serves the pre-serialized document, or 304 if the client already has it.
+    """
+    headers = {
+        "ETag": document.etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if document.matches(request.headers.get("if-none-match")):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+    return Response(
+        content=document.body, media_type="application/json", headers=headers
+    )
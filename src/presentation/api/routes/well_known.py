@@ -4,10 +4,10 @@ from typing import Any
 from fastapi import (
     APIRouter,
     Request,
+    Response,
     status,
     Depends
 )
-from fastapi_cache.decorator import cache
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.business_logic.services import ScopeService
 from src.business_logic.services.well_known import WellKnownService
@@ -18,8 +18,8 @@ from src.presentation.api.models.well_known import (
     ResponseOpenIdConfiguration,
 )
 
-from fastapi.responses import JSONResponse
 from src.di.providers import provide_async_session_stub
+from src.presentation.api.routes.utils import static_document_response
 
 well_known_router = APIRouter(prefix="/.well-known", tags=["Well Known"])
 
@@ -29,13 +29,11 @@ logger = logging.getLogger(__name__)
 @well_known_router.get(
     "/openid-configuration", response_model=ResponseOpenIdConfiguration
 )
-@cache(expire=CacheTimeSettings.WELL_KNOWN_OPENID_CONFIG)
 async def get_openid_configuration(
   request: Request,
   session: AsyncSession = Depends(provide_async_session_stub),
-) -> JSONResponse:
+) -> Response:
     try:
-        logger.debug("Collecting Data for OpenID Configuration.")
         well_known_info_class = WellKnownService(
             session=session, 
             wlk_repo=WellKnownRepository(session),
@@ -45,9 +43,10 @@ async def get_openid_configuration(
             ),
         )
         well_known_info_class.request = request
-        result = await well_known_info_class.get_openid_configuration()
-        result_dict = {k: v for k, v in result.dict().items() if v is not None}
-        return JSONResponse(content=result_dict)
+        document = await well_known_info_class.get_openid_configuration_document()
+        return static_document_response(
+            request, document, max_age=CacheTimeSettings.WELL_KNOWN_OPENID_CONFIG
+        )
     except Exception as exception:
         logger.exception(exception)
 
@@ -55,17 +54,16 @@ async def get_openid_configuration(
 @well_known_router.get("/jwks", response_model=ResponseJWKS)
 async def get_jwks(
     request: Request,
-) -> dict[str, Any]:
+) -> Response:
     try:
         session = "no_session"
         well_known_info_class = WellKnownService(
             session=session, wlk_repo=WellKnownRepository(session),
         )
         well_known_info_class.request = request
-        return {
-            "keys": [
-                await well_known_info_class.get_jwks(),
-            ]
-        }
+        document = await well_known_info_class.get_jwks_document()
+        return static_document_response(
+            request, document, max_age=CacheTimeSettings.WELL_KNOWN_JWKS
+        )
     except Exception:
         raise  # HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -102,3 +102,16 @@ class TestWellKnown:
                 )
             )
             assert response_content["use"] == "sig"
+
+    async def test_jwks_not_modified(self, client: AsyncClient) -> None:
+        response = await client.request(method="GET", url="/.well-known/jwks")
+        assert response.status_code == status.HTTP_200_OK
+        assert "max-age" in response.headers["cache-control"]
+
+        response = await client.request(
+            method="GET",
+            url="/.well-known/jwks",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
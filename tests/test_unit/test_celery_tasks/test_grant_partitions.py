@@ -0,0 +1,68 @@
+import time
+from unittest.mock import MagicMock, Mock
+
+from sqlalchemy.exc import OperationalError
+
+from src.data_access.postgresql.partitions import GrantPartitions
+
+
+class TestGrantPartitions:
+    def test_buckets(self) -> None:
+        partitions = GrantPartitions(interval=100, premake=2)
+        assert partitions.bucket_start(1234) == 1200
+        assert partitions.partition_name(1200) == "persistent_grants_p1200"
+
+    def test_get_partitions_skips_default(self) -> None:
+        session = Mock()
+        session.execute.return_value = [
+            ("persistent_grants_default", "DEFAULT"),
+            ("persistent_grants_p100", "FOR VALUES FROM (100) TO (200)"),
+        ]
+        partitions = GrantPartitions(interval=100, premake=2)
+        assert partitions.get_partitions(session) == {
+            "persistent_grants_p100": (100, 200)
+        }
+
+    def test_only_expired_partitions_are_dropped(self) -> None:
+        now = int(time.time())
+        partitions = GrantPartitions(interval=100, premake=2)
+        partitions.get_partitions = Mock(
+            return_value={
+                "persistent_grants_p1": (now - 200, now - 100),
+                "persistent_grants_p2": (now - 100, now + 100),
+            }
+        )
+        session = MagicMock()
+        session.execute.return_value.scalar.return_value = 3
+
+        assert partitions.drop_expired_partitions(session) == 3
+        statements = [str(call.args[0]) for call in session.execute.call_args_list]
+        assert "SET LOCAL lock_timeout = 2000" in statements
+        assert "DROP TABLE persistent_grants_p1" in statements
+        assert not any("persistent_grants_p2" in statement for statement in statements)
+
+    def test_detach_is_retried_on_lock_timeout(self) -> None:
+        now = int(time.time())
+        partitions = GrantPartitions(interval=100, premake=2, lock_retries=1)
+        partitions.RETRY_PAUSE = 0
+        partitions.get_partitions = Mock(
+            return_value={"persistent_grants_p1": (now - 200, now - 100)}
+        )
+        lock_timeout = OperationalError(
+            "DETACH", {}, Mock(pgcode=GrantPartitions.LOCK_NOT_AVAILABLE)
+        )
+        session = MagicMock()
+
+        def execute(statement, *args):
+            if str(statement).startswith("ALTER TABLE"):
+                raise lock_timeout
+            return Mock(scalar=Mock(return_value=3))
+
+        session.execute.side_effect = execute
+
+        assert partitions.drop_expired_partitions(session) == 0
+        statements = [str(call.args[0]) for call in session.execute.call_args_list]
+        assert statements.count(
+            "ALTER TABLE persistent_grants DETACH PARTITION persistent_grants_p1"
+        ) == 2
+        assert "DROP TABLE persistent_grants_p1" not in statements
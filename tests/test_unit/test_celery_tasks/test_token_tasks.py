@@ -4,7 +4,10 @@ from src.data_access.postgresql.repositories import (
     BlacklistedTokenRepository,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.celery_logic.celery_main import Session
 from src.celery_logic.token_tasks import clear_database
+from src.data_access.postgresql.purge import ExpiredRowsPurge, PurgeResult
+from src.data_access.postgresql.tables import PersistentGrant
 
 
 @pytest.mark.usefixtures("engine", "pre_test_setup")
@@ -43,3 +46,64 @@ class TestTokenTasks:
         responce = clear_database()
         assert responce == "Total deleted: 0"
         
+
+    async def test_purge_in_batches(self, connection: AsyncSession) -> None:
+        persistent_grant_repo = PersistentGrantRepository(connection)
+        for grant_data in ("to_delete", "to_delete2", "to_delete3"):
+            await persistent_grant_repo.create(
+                client_id="test_client",
+                grant_data=grant_data,
+                user_id=2,
+                grant_type="authorization_code",
+                expiration_time=0
+            )
+        await connection.commit()
+        purge = ExpiredRowsPurge(
+            session_factory=Session, batch_size=2, max_batches=1, pause=0
+        )
+
+        first = purge.purge(PersistentGrant)
+        second = purge.purge(PersistentGrant)
+
+        assert (first.deleted, first.complete) == (2, False)
+        assert first.lag > 0
+        assert (second.deleted, second.complete) == (1, True)
+        assert second.lag == 0
+
+
+class TestNextRunDelay:
+    purge = ExpiredRowsPurge(
+        session_factory=Session,
+        batch_size=2,
+        max_batches=1,
+        pause=0,
+        continuation_delay=5,
+        min_interval=300,
+        max_interval=3600,
+    )
+
+    @staticmethod
+    def result(complete: bool = True, next_cleaning_time=None) -> PurgeResult:
+        return PurgeResult(
+            table="persistent_grants",
+            deleted=0,
+            duration=0,
+            lag=0,
+            complete=complete,
+            next_cleaning_time=next_cleaning_time,
+        )
+
+    def test_backlog_is_continued(self) -> None:
+        assert self.purge.get_next_run_delay(
+            [self.result(complete=False), self.result(next_cleaning_time=60)]
+        ) == 5
+
+    def test_follows_earliest_expiration(self) -> None:
+        assert self.purge.get_next_run_delay(
+            [self.result(next_cleaning_time=1200), self.result(next_cleaning_time=900)]
+        ) == 900
+        assert self.purge.get_next_run_delay([self.result(next_cleaning_time=10)]) == 300
+        assert self.purge.get_next_run_delay([self.result(next_cleaning_time=10**6)]) == 3600
+
+    def test_empty_tables(self) -> None:
+        assert self.purge.get_next_run_delay([self.result(), self.result()]) is None
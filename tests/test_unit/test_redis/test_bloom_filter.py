@@ -0,0 +1,158 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.data_access.redis import (
+    MemoryBloomFilter,
+    RedisBloomFilter,
+    revocation,
+)
+
+
+class FakeRedis:
+    """Bitmaps of a Redis server that fails every command while `down`."""
+
+    def __init__(self) -> None:
+        self.keys: dict[str, set[int]] = {}
+        self.down = False
+
+    def _check(self) -> None:
+        if self.down:
+            raise ConnectionError("Redis is down")
+
+    async def eval(self, script, numkeys, *args) -> None:
+        self._check()
+        keys, positions = args[:numkeys], args[numkeys:]
+        for key in keys:
+            if key in self.keys:
+                self.keys[key].update(positions)
+
+    def pipeline(self, transaction: bool) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: list = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    def set(self, key, value) -> None:
+        self.commands.append(lambda keys: keys.setdefault(key, set()))
+
+    def delete(self, key) -> None:
+        self.commands.append(lambda keys: keys.pop(key, None))
+
+    def exists(self, key) -> None:
+        self.commands.append(lambda keys: int(key in keys))
+
+    def getbit(self, key, position) -> None:
+        self.commands.append(lambda keys: int(position in keys.get(key, set())))
+
+    async def execute(self) -> list:
+        self.redis._check()
+        return [command(self.redis.keys) for command in self.commands]
+
+
+def create_worker(redis: FakeRedis) -> RedisBloomFilter:
+    bloom_filter = RedisBloomFilter(
+        redis_url="redis://", key="filter", capacity=100, error_rate=0.01
+    )
+    bloom_filter._redis = redis
+    return bloom_filter
+
+
+@pytest.mark.asyncio
+class TestMemoryBloomFilter:
+    async def test_not_built_filter_falls_back(self) -> None:
+        bloom_filter = MemoryBloomFilter(capacity=100, error_rate=0.01)
+        assert await bloom_filter.might_contain("token")
+
+    async def test_rebuild_and_add(self) -> None:
+        bloom_filter = MemoryBloomFilter(capacity=1000, error_rate=0.001)
+
+        async def load_items() -> list[str]:
+            # Added while the rebuild is running, must not be lost.
+            await bloom_filter.add("revoked-during-rebuild")
+            return [f"revoked-{i}" for i in range(100)]
+
+        await bloom_filter.rebuild(load_items)
+        await bloom_filter.add("revoked-later")
+
+        for token in ["revoked-during-rebuild", "revoked-later"] + [
+            f"revoked-{i}" for i in range(100)
+        ]:
+            assert await bloom_filter.might_contain(token)
+
+        false_positives = [
+            token
+            for token in (f"valid-{i}" for i in range(1000))
+            if await bloom_filter.might_contain(token)
+        ]
+        assert len(false_positives) < 10
+
+
+@pytest.mark.asyncio
+class TestRedisBloomFilter:
+    async def test_failed_addition_breaks_the_filter_of_every_worker(
+        self,
+    ) -> None:
+        redis = FakeRedis()
+        redis.keys["filter"] = set()
+        adding, other = create_worker(redis), create_worker(redis)
+        assert await other.is_ready()
+
+        # Neither the addition nor the broken mark reach Redis.
+        redis.down = True
+        await adding.add("revoked")
+        assert await adding.might_contain("revoked")
+        assert not await adding.is_ready()
+
+        redis.down = False
+        assert not await adding.is_ready()
+        assert "filter:broken" in redis.keys
+        assert await other.might_contain("revoked")
+        assert not await other.is_ready()
+
+
+@pytest.mark.asyncio
+class TestKeepRevocationFilter:
+    async def test_rebuild_is_retried_with_backoff(self) -> None:
+        delays = []
+
+        async def sleep(delay: float) -> None:
+            if len(delays) == 5:
+                raise asyncio.CancelledError
+            delays.append(delay)
+
+        bloom_filter = MemoryBloomFilter(capacity=100, error_rate=0.01)
+        results = iter([False, False, True])
+
+        async def rebuild_filter(_) -> bool:
+            if not next(results):
+                return False
+            await bloom_filter.rebuild(mock.AsyncMock(return_value=[]))
+            return True
+
+        rebuild = mock.AsyncMock(side_effect=rebuild_filter)
+        with mock.patch.object(
+            revocation, "revocation_filter", bloom_filter
+        ), mock.patch.object(
+            revocation, "rebuild_revocation_filter", rebuild
+        ), mock.patch.object(
+            revocation.asyncio, "sleep", sleep
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await revocation.keep_revocation_filter(
+                    mock.Mock(), check_interval=10, max_retry_delay=30
+                )
+
+        assert delays == [10, 20, 30, 10, 10]
+        assert rebuild.await_count == 3
@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+
+from src.data_access.redis import DevicePolling, MemoryEphemeralStore
+from src.data_access.redis.device_polling import (
+    APPROVED,
+    DENIED,
+    EXPIRED,
+    PENDING,
+    SLOW_DOWN,
+    UNKNOWN,
+)
+from src.data_access.redis.ephemeral import (
+    DEVICE_POLL,
+    DEVICE_POLL_INTERVAL,
+    DEVICE_POLL_THROTTLE,
+)
+
+
+class PausingStore(MemoryEphemeralStore):
+    """Holds every `add` until `resume` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.resume = asyncio.Event()
+
+    async def add(self, kind, key, value, ttl):
+        await self.resume.wait()
+        return await super().add(kind, key, value, ttl)
+
+
+@pytest.mark.asyncio
+class TestDevicePolling:
+    async def test_pending_and_slow_down(self) -> None:
+        polling = DevicePolling(MemoryEphemeralStore())
+        await polling.start("code", "client", 5, int(time.time()) + 600)
+
+        assert await polling.poll("code", "client") == PENDING
+        assert await polling.poll("code", "client") == SLOW_DOWN
+        interval = await polling.store.get(DEVICE_POLL_INTERVAL, "code")
+        assert interval == {"interval": 10}
+
+        await polling.store.delete(DEVICE_POLL_THROTTLE, "code")
+        assert await polling.poll("code", "client") == PENDING
+
+    async def test_unknown_code_or_client(self) -> None:
+        polling = DevicePolling(MemoryEphemeralStore())
+        await polling.start("code", "client", 5, int(time.time()) + 600)
+
+        assert await polling.poll("other", "client") == UNKNOWN
+        assert await polling.poll("code", "other") == UNKNOWN
+
+    async def test_expired(self) -> None:
+        polling = DevicePolling(MemoryEphemeralStore())
+        await polling.start("code", "client", 5, int(time.time()) - 1)
+
+        assert await polling.poll("code", "client") == EXPIRED
+
+    async def test_approve_deny_finish(self) -> None:
+        polling = DevicePolling(MemoryEphemeralStore())
+        expires_at = int(time.time()) + 600
+        await polling.start("approved", "client", 5, expires_at)
+        await polling.start("denied", "client", 5, expires_at)
+
+        await polling.approve("approved", ttl=600)
+        await polling.deny("denied")
+
+        assert await polling.poll("approved", "client") == APPROVED
+        assert await polling.poll("approved", "client") == APPROVED
+        assert await polling.poll("denied", "client") == DENIED
+
+        await polling.finish("approved")
+        assert await polling.poll("approved", "client") == UNKNOWN
+
+    async def test_slow_down_does_not_undo_approval(self) -> None:
+        store = PausingStore()
+        polling = DevicePolling(store)
+        await polling.start("code", "client", 5, int(time.time()) + 600)
+        store.resume.set()
+        assert await polling.poll("code", "client") == PENDING
+
+        # The poll has read the pending status when the user approves.
+        store.resume.clear()
+        poll = asyncio.create_task(polling.poll("code", "client"))
+        await asyncio.sleep(0)
+        await polling.approve("code", ttl=600)
+        store.resume.set()
+
+        assert await poll == SLOW_DOWN
+        assert await polling.poll("code", "client") == APPROVED
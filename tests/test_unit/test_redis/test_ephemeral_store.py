@@ -0,0 +1,264 @@
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError
+from sqlalchemy.exc import NoResultFound
+
+from src.data_access.postgresql.repositories import (
+    CodeChallengeRepository,
+    DeviceRepository,
+    PersistentGrantRepository,
+    ThirdPartyOIDCRepository,
+)
+from src.data_access.postgresql.errors import UserCodeNotFoundError
+from src.data_access.redis import (
+    EphemeralStoreUnavailableError,
+    MemoryEphemeralStore,
+    RedisEphemeralStore,
+)
+from src.business_logic.services.authorization.response_type_handlers import (
+    CodeResponseTypeHandler,
+)
+from src.data_access.redis.ephemeral import AUTHORIZATION_CODE
+from src.presentation.api.exception_handlers.http503_temporarily_unavailable import (
+    http503_temporarily_unavailable_handler,
+)
+
+
+@pytest.mark.asyncio
+class TestMemoryEphemeralStore:
+    async def test_put_get_pop(self) -> None:
+        store = MemoryEphemeralStore()
+        await store.put("state", "abc", {"state": "abc"}, ttl=60)
+
+        assert await store.get("state", "abc") == {"state": "abc"}
+        assert await store.get("code", "abc") is None
+        assert await store.pop("state", "abc") == {"state": "abc"}
+        assert await store.pop("state", "abc") is None
+
+    async def test_artifacts_expire(self) -> None:
+        store = MemoryEphemeralStore()
+        await store.put("state", "abc", {"state": "abc"}, ttl=0)
+
+        assert await store.get("state", "abc") is None
+
+    async def test_add_keeps_existing_artifact(self) -> None:
+        store = MemoryEphemeralStore()
+
+        assert await store.add("state", "abc", {"n": 1}, ttl=60)
+        assert not await store.add("state", "abc", {"n": 2}, ttl=60)
+        assert await store.get("state", "abc") == {"n": 1}
+
+
+@pytest.mark.asyncio
+class TestRedisEphemeralStore:
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda store: store.put("state", "abc", {}, ttl=60),
+            lambda store: store.add("state", "abc", {}, ttl=60),
+            lambda store: store.get("state", "abc"),
+            lambda store: store.pop("state", "abc"),
+            lambda store: store.delete("state", "abc"),
+        ],
+    )
+    async def test_redis_errors_mean_unavailable(self, call) -> None:
+        store = RedisEphemeralStore(redis_url="redis://", prefix="test")
+        store._redis = mock.AsyncMock()
+        for method in ("set", "get", "getdel", "delete"):
+            getattr(store._redis, method).side_effect = ConnectionError
+
+        with pytest.raises(EphemeralStoreUnavailableError):
+            await call(store)
+
+    async def test_unavailable_answer(self) -> None:
+        response = await http503_temporarily_unavailable_handler(
+            mock.MagicMock(), EphemeralStoreUnavailableError()
+        )
+
+        assert response.status_code == 503
+        assert response.body == b'{"error":"temporarily_unavailable"}'
+
+
+def use_store(store: MemoryEphemeralStore, *modules: str):
+    return [
+        mock.patch(
+            f"src.data_access.postgresql.repositories.{module}.ephemeral_store",
+            store,
+        )
+        for module in modules
+    ]
+
+
+@pytest.mark.asyncio
+class TestRepositoriesWithEphemeralStore:
+    @pytest.fixture(autouse=True)
+    def store(self):
+        store = MemoryEphemeralStore()
+        patches = use_store(
+            store,
+            "code_challenge",
+            "device",
+            "persistent_grant",
+            "third_party_oidc",
+        )
+        for patch in patches:
+            patch.start()
+        yield store
+        for patch in patches:
+            patch.stop()
+
+    async def test_state(self) -> None:
+        session = mock.AsyncMock()
+        repo = ThirdPartyOIDCRepository(session)
+
+        await repo.create_state("state")
+        assert await repo.is_state("state")
+        assert await repo.consume_state("state")
+        assert not await repo.consume_state("state")
+        session.execute.assert_not_awaited()
+        session.commit.assert_not_awaited()
+
+    async def test_code_challenge(self) -> None:
+        session = mock.AsyncMock()
+        repo = CodeChallengeRepository(session)
+
+        with mock.patch.object(
+            repo, "get_code_challenge_method_id", return_value=1
+        ):
+            await repo.create("test_client", "S256", "challenge")
+        code_challenge = await repo.get_code_challenge_by_client_id(
+            "test_client"
+        )
+        assert code_challenge.code_challenge == "challenge"
+        assert code_challenge.code_challenge_method.method == "S256"
+
+        await repo.delete_code_challenge_by_client_id("test_client")
+        with pytest.raises(NoResultFound):
+            await repo.get_code_challenge_by_client_id("test_client")
+        session.execute.assert_not_awaited()
+
+    async def test_device(self) -> None:
+        repo = DeviceRepository(mock.AsyncMock())
+        await repo.create(
+            client_id="test_client",
+            device_code="device_code",
+            user_code="USERCODE",
+            verification_uri="http://localhost/device/auth",
+            verification_uri_complete="http://localhost/device/auth?user_code=USERCODE",
+        )
+
+        device = await repo.get_device_by_user_code("USERCODE")
+        assert device.client.client_id == "test_client"
+        assert device.device_code == "device_code"
+        assert await repo.validate_device_code("device_code")
+        assert await repo.get_device_code_by_user_code("USERCODE") == "device_code"
+
+        await repo.delete_by_user_code("USERCODE")
+        assert not await repo.exists("USERCODE")
+        assert not await repo.validate_device_code("device_code")
+        with pytest.raises(UserCodeNotFoundError):
+            await repo.validate_user_code("USERCODE")
+
+    async def test_authorization_code_is_redeemed_once(self, store) -> None:
+        session = mock.AsyncMock()
+        session.execute.return_value = mock.MagicMock()
+        session.execute.return_value.first.return_value = None
+        repo = PersistentGrantRepository(session)
+        client = mock.MagicMock(id=7, redirect_uris=("https://www.google.com/",))
+        with mock.patch(
+            "src.data_access.postgresql.repositories.persistent_grant.client_registry.get",
+            mock.AsyncMock(return_value=client),
+        ):
+            await repo.create_authorization_code(
+                client_id="test_client",
+                code="code",
+                user_id=1,
+                scope="openid",
+                lifetime=60,
+            )
+            await store.put(
+                "code_challenge",
+                "test_client",
+                {"code_challenge": "challenge", "code_challenge_method": "plain"},
+                ttl=60,
+            )
+
+            resolved = await repo.resolve_authorization_code(
+                grant_data="code",
+                grant_type=AUTHORIZATION_CODE,
+                client_id="test_client",
+                redirect_uri="https://www.google.com/",
+            )
+            assert resolved.grant.client_id == 7
+            assert resolved.grant.user_id == 1
+            assert resolved.redirect_uri_matches
+            assert resolved.code_challenge == "challenge"
+            assert resolved.code_challenge_method == "plain"
+            # The transient grant is not deleted through the session.
+            await repo.delete_grant(resolved.grant)
+            session.delete.assert_not_awaited()
+
+            assert await repo.resolve_authorization_code(
+                grant_data="code",
+                grant_type=AUTHORIZATION_CODE,
+                client_id="test_client",
+                redirect_uri="https://www.google.com/",
+            ) is None
+
+    async def test_code_response_type_stores_redeemable_code(
+        self, store
+    ) -> None:
+        session = mock.AsyncMock()
+        repo = PersistentGrantRepository(session)
+        client = mock.MagicMock(id=7, redirect_uris=("https://www.google.com/",))
+        auth_service = mock.MagicMock(persistent_grant_repo=repo)
+        auth_service.client_repo.get_auth_code_lifetime_by_client = (
+            mock.AsyncMock(return_value=60)
+        )
+        auth_service.request_model.client_id = "test_client"
+        auth_service.request_model.scope = "openid"
+        auth_service.request_model.redirect_uri = "https://www.google.com/"
+        auth_service.request_model.state = None
+        with mock.patch(
+            "src.data_access.postgresql.repositories.persistent_grant.client_registry.get",
+            mock.AsyncMock(return_value=client),
+        ):
+            redirect_url = await CodeResponseTypeHandler(
+                auth_service
+            ).get_redirect_url(user_id=1)
+            code = redirect_url.split("code=")[1]
+
+            resolved = await repo.resolve_authorization_code(
+                grant_data=code,
+                grant_type=AUTHORIZATION_CODE,
+                client_id="test_client",
+                redirect_uri="https://www.google.com/",
+            )
+        assert resolved.grant.user_id == 1
+        assert resolved.grant.scope == "openid"
+        session.execute.assert_not_awaited()
+
+    async def test_authorization_code_missing_from_store_is_read_from_table(
+        self,
+    ) -> None:
+        session = mock.AsyncMock()
+        grant = mock.MagicMock(user_id=1)
+        session.execute.return_value = mock.MagicMock()
+        session.execute.return_value.first.return_value = (
+            grant,
+            True,
+            None,
+            None,
+        )
+        repo = PersistentGrantRepository(session)
+
+        resolved = await repo.resolve_authorization_code(
+            grant_data="code",
+            grant_type=AUTHORIZATION_CODE,
+            client_id="test_client",
+            redirect_uri="https://www.google.com/",
+        )
+
+        assert resolved.grant is grant
+        assert resolved.redirect_uri_matches
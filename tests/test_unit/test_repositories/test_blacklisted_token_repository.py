@@ -0,0 +1,29 @@
+import hashlib
+import time
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data_access.postgresql.repositories import BlacklistedTokenRepository
+from src.data_access.postgresql.tables import BlacklistedToken
+
+
+@pytest.mark.usefixtures("engine", "pre_test_setup")
+@pytest.mark.asyncio
+class TestBlacklistedTokenRepository:
+    async def test_create_stores_digest(self, connection: AsyncSession) -> None:
+        repo = BlacklistedTokenRepository(connection)
+        token = "header.payload.signature"
+        expiration = int(time.time()) + 600
+
+        await repo.create(token=token, expiration=expiration)
+        # Revoking the same token twice is not an error.
+        await repo.create(token=token, expiration=expiration)
+
+        digests = (
+            await connection.scalars(select(BlacklistedToken.token_digest))
+        ).all()
+        assert digests.count(hashlib.sha256(token.encode()).hexdigest()) == 1
+        assert await repo.exists(token=token)
+        assert not await repo.exists(token="other.payload.signature")
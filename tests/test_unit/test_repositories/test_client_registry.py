@@ -0,0 +1,60 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.data_access.postgresql.client_registry import ClientRegistry
+
+
+def make_client() -> MagicMock:
+    client = MagicMock(
+        id=1,
+        client_id="test_client",
+        client_uri="https://www.google.com/",
+        authorization_code_lifetime=300,
+        device_code_lifetime=600,
+        secrets=[MagicMock(value="past")],
+        redirect_uris=[MagicMock(redirect_uri="https://www.google.com/")],
+        post_logout_redirect_uris=[
+            MagicMock(post_logout_redirect_uri="http://thompson-chung.com/")
+        ],
+    )
+    openid = MagicMock(claim="openid")
+    openid.resource.name = "gcp-api"
+    openid.scope.name = "openid"
+    userinfo = MagicMock(claim="email")
+    userinfo.scope.name = "userinfo"
+    client.scope = [openid, userinfo]
+    return client
+
+
+def make_session(client: MagicMock = None) -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(
+        scalar=MagicMock(return_value=client)
+    )
+    return session
+
+
+@pytest.mark.asyncio
+class TestClientRegistry:
+    async def test_client_is_loaded_once(self) -> None:
+        session = make_session(make_client())
+        registry = ClientRegistry(ttl=60, max_size=10)
+
+        metadata = await registry.get(session, "test_client")
+        assert await registry.get(session, "test_client") is metadata
+        assert session.execute.await_count == 1
+
+        assert metadata.id == 1
+        assert metadata.client_uri == "https://www.google.com/"
+        assert metadata.secret == "past"
+        assert metadata.redirect_uris == ("https://www.google.com/",)
+        assert metadata.scopes == ("gcp-api:openid:openid", "email")
+        assert metadata.authorization_code_lifetime == 300
+
+    async def test_unknown_client_is_not_cached(self) -> None:
+        session = make_session(None)
+        registry = ClientRegistry(ttl=60, max_size=10)
+
+        assert await registry.get(session, "unknown") is None
+        assert len(registry) == 0
@@ -5,9 +5,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import exists, select, insert, update, delete, text
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 
 from src.data_access.postgresql.repositories.client import ClientRepository
+from src.data_access.postgresql.repositories.loading import LoadingProfile
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.data_access.postgresql.errors.client import (
@@ -39,6 +41,18 @@ class TestClientRepository:
         assert isinstance(client, Client)
         assert client.client_id == "test_client"
 
+    async def test_get_client_by_client_id_identity_profile(
+        self, connection: AsyncSession
+    ) -> None:
+        client_repo = ClientRepository(connection)
+        connection.expunge_all()
+        client = await client_repo.get_client_by_client_id(
+            client_id="test_client", profile=LoadingProfile.IDENTITY
+        )
+        assert client.client_id == "test_client"
+        with pytest.raises(InvalidRequestError):
+            client.redirect_uris
+
     async def test_get_client_by_client_id_not_exists(self, connection: AsyncSession) -> None:
         client_repo_error = ClientRepository(connection)
         with pytest.raises(ClientNotFoundError):
@@ -0,0 +1,110 @@
+from typing import Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.data_access.postgresql.invalidated_cache import (
+    InvalidatedCache,
+    create_invalidation_channel,
+)
+
+
+class SquareCache(InvalidatedCache[int, int]):
+    """Caches the square of positive numbers, fetched through the session."""
+
+    async def fetch(self, session: AsyncMock, key: int) -> Optional[int]:
+        await session.execute()
+        return key * key if key > 0 else None
+
+    def key_from_message(self, message: str) -> int:
+        return int(message)
+
+
+@pytest.mark.asyncio
+class TestInvalidatedCache:
+    async def test_entry_is_fetched_once(self) -> None:
+        session = AsyncMock()
+        cache = SquareCache(ttl=60, max_size=10)
+
+        assert await cache.get(session, 3) == 9
+        assert await cache.get(session, 3) == 9
+        assert session.execute.await_count == 1
+
+    async def test_expired_entry_is_fetched_again(self) -> None:
+        session = AsyncMock()
+        cache = SquareCache(ttl=0, max_size=10)
+
+        await cache.get(session, 3)
+        await cache.get(session, 3)
+        assert session.execute.await_count == 2
+
+    async def test_missing_data_is_not_cached(self) -> None:
+        session = AsyncMock()
+        cache = SquareCache(ttl=60, max_size=10)
+
+        assert await cache.get(session, -1) is None
+        assert await cache.get(session, -1) is None
+        assert session.execute.await_count == 2
+        assert len(cache) == 0
+
+    async def test_size_is_bounded(self) -> None:
+        session = AsyncMock()
+        cache = SquareCache(ttl=60, max_size=2)
+
+        for key in (1, 2, 3):
+            await cache.get(session, key)
+        assert len(cache) == 2
+        await cache.get(session, 1)
+        assert session.execute.await_count == 4
+
+    async def test_invalidate(self) -> None:
+        session = AsyncMock()
+        cache = SquareCache(ttl=60, max_size=10)
+        await cache.get(session, 1)
+        await cache.get(session, 2)
+
+        cache.invalidate(1)
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+
+    async def test_fetch_racing_with_invalidation_is_not_stored(self) -> None:
+        cache = SquareCache(ttl=60, max_size=10)
+        session = AsyncMock()
+        session.execute.side_effect = lambda: cache.invalidate(3)
+
+        assert await cache.get(session, 3) == 9
+        assert len(cache) == 0
+
+    async def test_publish_invalidation(self) -> None:
+        channel = AsyncMock()
+        cache = SquareCache(ttl=60, max_size=10, channel=channel)
+        await cache.get(AsyncMock(), 1)
+
+        await cache.publish_invalidation(1)
+        await cache.publish_invalidation()
+
+        assert len(cache) == 0
+        assert [call.args for call in channel.publish.await_args_list] == [
+            ("1",),
+            ("*",),
+        ]
+
+    async def test_messages_of_other_workers(self) -> None:
+        session = AsyncMock()
+        cache = SquareCache(ttl=60, max_size=10)
+        await cache.get(session, 1)
+        await cache.get(session, 2)
+
+        cache._on_message("1")
+        assert len(cache) == 1
+        cache._on_message(cache.ALL)
+        assert len(cache) == 0
+
+
+def test_create_invalidation_channel() -> None:
+    assert create_invalidation_channel("local", "redis://", "test") is None
+    channel = create_invalidation_channel("redis", "redis://", "test")
+    assert channel.channel == "test"
+    with pytest.raises(ValueError):
+        create_invalidation_channel("unknown", "redis://", "test")
@@ -5,6 +5,10 @@ from src.data_access.postgresql.repositories.persistent_grant import (
     PersistentGrantRepository,
     PersistentGrant,
 )
+from src.data_access.postgresql.repositories.client import ClientRepository
+from src.data_access.postgresql.tables.persistent_grant import (
+    get_grant_data_digest,
+)
 from src.data_access.postgresql.errors.persistent_grant import (
     PersistentGrantNotFoundError,
 )
@@ -36,6 +40,36 @@ class TestPersistentGrantRepository:
         assert grant.user_id == 2
         assert grant.grant_data == "iyuiyy"
 
+    async def test_grant_data_digest_follows_edits(self) -> None:
+        grant = PersistentGrant(grant_data="before")
+        assert grant.grant_data_digest == get_grant_data_digest("before")
+
+        grant.grant_data = "after"
+        assert grant.grant_data_digest == get_grant_data_digest("after")
+
+    async def test_grant_data_digest_filled_on_create(
+        self, connection: AsyncSession
+    ) -> None:
+        persistent_grant_repo = PersistentGrantRepository(connection)
+        await persistent_grant_repo.create(
+            client_id="test_client",
+            grant_data="grant_data_digest",
+            user_id=2,
+            grant_type="authorization_code",
+        )
+
+        grant = await persistent_grant_repo.get_grant(
+            grant_data="grant_data_digest", grant_type="authorization_code"
+        )
+        await persistent_grant_repo.delete(
+            grant_data="grant_data_digest", grant_type="authorization_code"
+        )
+
+        assert grant.grant_data_digest == get_grant_data_digest(
+            "grant_data_digest"
+        )
+        assert len(grant.grant_data_digest) == 64
+
     @no_type_check
     async def test_create_new_grant_not_full_data(
         self, connection: AsyncSession
@@ -228,3 +262,47 @@ class TestPersistentGrantRepository:
             await persistent_grant_repo.get_client_id_by_data(
                 grant_data="test_get_client_id_by_wrong_data"
             )
+
+    async def test_resolve_authorization_code(
+        self, connection: AsyncSession
+    ) -> None:
+        persistent_grant_repo = PersistentGrantRepository(connection)
+        redirect_uri = (
+            await ClientRepository(connection).list_all_redirect_uris_by_client(
+                client_id="test_client"
+            )
+        )[0]
+        await persistent_grant_repo.create(
+            client_id="test_client",
+            grant_data="test_resolve_authorization_code",
+            user_id=2,
+        )
+
+        resolved = await persistent_grant_repo.resolve_authorization_code(
+            grant_data="test_resolve_authorization_code",
+            grant_type="authorization_code",
+            client_id="test_client",
+            redirect_uri=redirect_uri,
+        )
+        assert resolved.grant.user_id == 2
+        assert resolved.redirect_uri_matches
+
+        resolved = await persistent_grant_repo.resolve_authorization_code(
+            grant_data="test_resolve_authorization_code",
+            grant_type="authorization_code",
+            client_id="test_client",
+            redirect_uri="https://wrong.uri",
+        )
+        assert not resolved.redirect_uri_matches
+
+        assert await persistent_grant_repo.resolve_authorization_code(
+            grant_data="test_resolve_authorization_code",
+            grant_type="authorization_code",
+            client_id="double_test",
+            redirect_uri=redirect_uri,
+        ) is None
+
+        await persistent_grant_repo.delete(
+            grant_data="test_resolve_authorization_code",
+            grant_type="authorization_code",
+        )
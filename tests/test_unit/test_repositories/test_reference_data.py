@@ -0,0 +1,49 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.data_access.postgresql.reference_data import (
+    LookupTable,
+    ReferenceData,
+)
+from src.data_access.postgresql.tables import PersistentGrantType
+
+
+@pytest.mark.asyncio
+class TestReferenceData:
+    async def test_table_is_loaded_once(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = [("authorization_code", 1), ("refresh_token", 2)]
+        table = LookupTable(PersistentGrantType.type_of_grant, max_age=300)
+
+        assert await table.get_id(session, "refresh_token") == 2
+        assert await table.get_id(session, "authorization_code") == 1
+        assert await table.get_names(session) == ["authorization_code", "refresh_token"]
+        assert session.execute.await_count == 1
+
+    async def test_missing_name_reloads_rate_limited(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = [("authorization_code", 1)]
+        table = LookupTable(PersistentGrantType.type_of_grant, max_age=300)
+        await table.get_ids(session)
+
+        table.MIN_RELOAD_INTERVAL = 0
+        session.execute.return_value = [("authorization_code", 1), ("device_code", 3)]
+        assert await table.get_id(session, "device_code") == 3
+
+        table.MIN_RELOAD_INTERVAL = 300
+        assert await table.get_id(session, "unknown") is None
+        assert session.execute.await_count == 2
+
+    async def test_invalidate_by_model(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = [("authorization_code", 1)]
+        reference_data = ReferenceData(max_age=300)
+        await reference_data.grant_types.get_ids(session)
+        await reference_data.access_token_types.get_ids(session)
+
+        reference_data.invalidate(PersistentGrantType)
+
+        await reference_data.grant_types.get_ids(session)
+        await reference_data.access_token_types.get_ids(session)
+        assert session.execute.await_count == 3
@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.data_access.postgresql.errors import (
+    ResourceDisabledError,
+    ResourceNotFoundError,
+)
+from src.data_access.postgresql.scope_catalog import (
+    ScopeCatalog,
+    ScopeCatalogCache,
+)
+
+CATALOG_ROWS = [
+    (1, "oidc", "OIDC", True, 1, "userinfo", "User info", 1, "openid"),
+    (1, "oidc", "OIDC", True, 1, "userinfo", "User info", 2, "email"),
+    (1, "oidc", "OIDC", True, 2, "revoke", "Revoke", 3, "post"),
+    (1, "oidc", "OIDC", True, 3, "introspection", "Introspect", 3, "post"),
+    (2, "gcp-api", "GCP", True, 4, "read", "Read", 4, "all"),
+    (3, "legacy", "Legacy", False, 5, "read", "Read", 4, "all"),
+    (4, "empty", "Empty", True, None, None, None, None, None),
+]
+
+
+def make_session() -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = CATALOG_ROWS
+    return session
+
+
+@pytest.mark.asyncio
+class TestScopeCatalog:
+    async def test_catalog_indexes(self) -> None:
+        catalog = await ScopeCatalog.load(make_session())
+
+        oidc = catalog.get_resource("oidc")
+        assert oidc.scopes["userinfo"].claims == {"openid": 1, "email": 2}
+        assert oidc.scopes["revoke"].full_names == ["oidc:revoke:post"]
+        assert catalog.get_resource("empty").scopes == {}
+        assert catalog.get_scope_claims("oidc", "userinfo") == ["openid", "email"]
+        assert catalog.get_scope_claims("oidc", "unknown") is None
+        assert catalog.all_scopes == [
+            "openid",
+            "email",
+            "oidc:revoke:post",
+            "oidc:introspection:post",
+            "gcp-api:read:all",
+        ]
+
+    async def test_missing_and_disabled_resources(self) -> None:
+        catalog = await ScopeCatalog.load(make_session())
+
+        with pytest.raises(ResourceNotFoundError):
+            catalog.get_resource("unknown")
+        with pytest.raises(ResourceNotFoundError):
+            catalog.get_scope_claims("unknown", "read")
+        with pytest.raises(ResourceDisabledError):
+            catalog.get_resource("legacy")
+        assert "legacy:read:all" not in catalog.all_scopes
+
+    async def test_catalog_is_built_once(self) -> None:
+        session = make_session()
+        cache = ScopeCatalogCache(max_age=300)
+
+        assert await cache.get(session) is await cache.get(session)
+        assert session.execute.await_count == 1
+
+        cache.invalidate()
+        await cache.get(session)
+        assert session.execute.await_count == 2
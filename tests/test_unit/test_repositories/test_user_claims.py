@@ -0,0 +1,39 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.data_access.postgresql.user_claims import UserClaimsCache
+
+CLAIM_ROWS = [("name", "Daniil"), ("email", "daniil@mail")]
+
+
+def make_session(rows: list = CLAIM_ROWS) -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = rows
+    return session
+
+
+@pytest.mark.asyncio
+class TestUserClaimsCache:
+    async def test_claims_are_loaded_once(self) -> None:
+        session = make_session()
+        cache = UserClaimsCache(ttl=60, max_size=10)
+
+        claims = await cache.get(session, 1)
+        assert await cache.get(session, 1) is claims
+        assert claims == {"name": "Daniil", "email": "daniil@mail"}
+        assert session.execute.await_count == 1
+
+    async def test_user_without_claims_is_not_cached(self) -> None:
+        cache = UserClaimsCache(ttl=60, max_size=10)
+
+        assert await cache.get(make_session([]), 1) == {}
+        assert len(cache) == 0
+
+    async def test_invalidation_message(self) -> None:
+        cache = UserClaimsCache(ttl=60, max_size=10)
+        await cache.get(make_session(), 1)
+
+        # Pub/sub messages carry the user id as a string.
+        cache._on_message("1")
+        assert len(cache) == 0
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -58,6 +58,7 @@ def third_party_oidc_repository_mock():
     third_party_oidc_repo.create_state.return_value = None
     third_party_oidc_repo.is_state.return_value = False
     third_party_oidc_repo.delete_state.return_value = None
+    third_party_oidc_repo.consume_state.return_value = False
     third_party_oidc_repo.get_credentials_by_provider_name.return_value = (
         "test_client",
         "test_secret",
@@ -88,7 +89,7 @@ def async_session_mock():
 
 @pytest.fixture
 def password_hash_mock():
-    return Mock()
+    return AsyncMock()
 
 
 @pytest_asyncio.fixture
@@ -256,11 +256,11 @@ class TestStateValidator:
 
     async def test_state_validator(self):
         state = "2y0M9hbzcCv5FZ28ZxRu2upCBI6LkS9conRvkVQPuTg!_!test_client!_!https://www.google.com/"
-        self.state_validator._third_party_oidc_repo.is_state.return_value = (
+        self.state_validator._third_party_oidc_repo.consume_state.return_value = (
             True
         )
         await self.state_validator(state)
-        self.state_validator._third_party_oidc_repo.delete_state.assert_called_once_with(
+        self.state_validator._third_party_oidc_repo.consume_state.assert_called_once_with(
             state
         )
 
@@ -383,10 +383,6 @@ class TestGithubAuthService:
             username=username, identity_provider_id="test_id"
         )
 
-    @patch(
-        "src.business_logic.third_party_auth.service_impls.mixins.time.time",
-        return_value=123,
-    )
     async def test_create_grant(self, third_party_access_token_request_model):
         username_type, provider_name = ("login", "test_provider")
         username = ("test_user",)
@@ -418,13 +414,12 @@ class TestGithubAuthService:
         self.auth_service._user_repo.get_user_id_by_username.assert_called_once_with(
             username
         )
-        # self.auth_service._persistent_grant_repo.create.assert_called_once_with(
-        #     client_id="test_client",
-        #     grant_data="test_secret",
-        #     user_id="test_user",
-        #     grant_type="authorization_code",
-        #     expiration_time=183,  # sum of auth_code_lifetime mocked as 60 and time.time mocked as 123
-        # )
+        create_authorization_code = (
+            self.auth_service._persistent_grant_repo.create_authorization_code
+        )
+        create_authorization_code.assert_awaited_once()
+        assert create_authorization_code.await_args.kwargs["code"] == "test_secret"
+        assert create_authorization_code.await_args.kwargs["client_id"] == "test_client"
 
     async def test_get_redirect_url(
         self, third_party_access_token_request_model
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from src.business_logic.jwt_manager import JWTManager
+from src.business_logic.jwt_manager.crypto_executor import (
+    CryptoExecutor,
+    sign_token,
+    verify_token,
+)
+from src.business_logic.jwt_manager.dto import (
+    AccessTokenPayload,
+    IdTokenPayload,
+    RefreshTokenPayload,
+)
+from src.config.rsa_keys import CreateRSAKeypair
+
+
+@pytest.mark.asyncio
+class TestCryptoExecutor:
+
+    @pytest.mark.parametrize("mode", ["inline", "thread"])
+    async def test_sign_and_verify(self, mode: str) -> None:
+        keys = CreateRSAKeypair().execute()
+        executor = CryptoExecutor(mode=mode, max_workers=2, max_queue_size=2)
+        try:
+            tokens = await asyncio.gather(
+                *(
+                    executor.run(sign_token, {"sub": str(i)}, keys.private_key, "RS256")
+                    for i in range(5)
+                )
+            )
+            decoded = [
+                await executor.run(verify_token, token, keys.public_key, ["RS256"])
+                for token in tokens
+            ]
+        finally:
+            executor.shutdown()
+
+        assert [claims["sub"] for claims in decoded] == [str(i) for i in range(5)]
+
+    async def test_unknown_mode(self) -> None:
+        with pytest.raises(ValueError):
+            CryptoExecutor(mode="gpu", max_workers=1, max_queue_size=1)
+
+
+@pytest.mark.asyncio
+class TestJWTManagerEncodeMany:
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    async def test_encode_many(self, parallel: bool) -> None:
+        manager = JWTManager()
+        payloads = [
+            AccessTokenPayload(
+                sub=1, iss="iss", client_id="client", iat=1, exp=2, aud=["aud"], jti="a", acr=0,
+            ),
+            RefreshTokenPayload(jti="b"),
+            IdTokenPayload(
+                sub=1, iss="iss", client_id="client", iat=1, exp=2, jti="c", acr=0,
+            ),
+        ]
+
+        tokens = await manager.encode_many(
+            payloads=payloads, algorithm="RS256", parallel=parallel
+        )
+
+        assert tokens == [
+            await manager.encode(payload=payload, algorithm="RS256")
+            for payload in payloads
+        ]
@@ -0,0 +1,113 @@
+import json
+import time
+from unittest import mock
+
+import pytest
+
+from src.business_logic.get_tokens.dto import RequestTokenModel
+from src.business_logic.get_tokens.errors import (
+    AccessDeniedError,
+    AuthorizationPendingError,
+    ExpiredTokenError,
+    InvalidGrantError,
+    SlowDownError,
+)
+from src.business_logic.get_tokens.service_impls.device_code import (
+    DeviceCodeTokenService,
+)
+from src.data_access.redis import DevicePolling, MemoryEphemeralStore
+from src.presentation.api.exception_handlers.http400_device_polling import (
+    http400_device_polling_handler,
+)
+
+REQUEST = RequestTokenModel(
+    client_id="test_client",
+    grant_type="urn:ietf:params:oauth:grant-type:device_code",
+    device_code="device_code",
+)
+
+
+def make_service() -> DeviceCodeTokenService:
+    return DeviceCodeTokenService(
+        session=mock.AsyncMock(),
+        device_code_validator=mock.AsyncMock(),
+        grant_exp_validator=mock.AsyncMock(),
+        client_validator=mock.AsyncMock(),
+        redirect_uri_validator=mock.AsyncMock(),
+        jwt_manager=mock.AsyncMock(),
+        persistent_grant_repo=mock.AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+class TestDeviceCodePolling:
+    @pytest.fixture(autouse=True)
+    def polling(self):
+        polling = DevicePolling(MemoryEphemeralStore())
+        with mock.patch(
+            "src.business_logic.get_tokens.service_impls.device_code.device_polling",
+            polling,
+        ):
+            yield polling
+
+    async def test_pending_then_slow_down(self, polling) -> None:
+        service = make_service()
+        await polling.start(
+            "device_code", "test_client", 5, int(time.time()) + 600
+        )
+
+        with pytest.raises(AuthorizationPendingError):
+            await service.get_tokens(REQUEST)
+        with pytest.raises(SlowDownError):
+            await service.get_tokens(REQUEST)
+        service._device_code_validator.assert_not_awaited()
+        service._persistent_grant_repo.get_grant.assert_not_awaited()
+
+    async def test_expired_token(self, polling) -> None:
+        service = make_service()
+        await polling.start(
+            "device_code", "test_client", 5, int(time.time()) - 1
+        )
+
+        with pytest.raises(ExpiredTokenError):
+            await service.get_tokens(REQUEST)
+        service._device_code_validator.assert_not_awaited()
+
+    async def test_missing_device_code(self, polling) -> None:
+        service = make_service()
+        request = REQUEST.copy(update={"device_code": None})
+
+        with pytest.raises(InvalidGrantError):
+            await service.get_tokens(request)
+        service._device_code_validator.assert_not_awaited()
+
+    async def test_approved_code_not_yet_committed_is_pending(
+        self, polling
+    ) -> None:
+        service = make_service()
+        service._device_code_validator.side_effect = InvalidGrantError
+        await polling.start(
+            "device_code", "test_client", 5, int(time.time()) + 600
+        )
+        await polling.approve("device_code", ttl=600)
+
+        with pytest.raises(AuthorizationPendingError):
+            await service.get_tokens(REQUEST)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exc, error",
+    [
+        (AuthorizationPendingError(), "authorization_pending"),
+        (SlowDownError(), "slow_down"),
+        (AccessDeniedError(), "access_denied"),
+        (ExpiredTokenError(), "expired_token"),
+    ],
+)
+async def test_device_polling_errors_response(exc, error) -> None:
+    response = await http400_device_polling_handler(mock.MagicMock(), exc)
+
+    assert response.status_code == 400
+    assert json.loads(response.body) == {"error": error}
+    assert response.headers["Cache-Control"] == "no-store"
@@ -0,0 +1,116 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.business_logic.cache.introspection import IntrospectionCache
+
+ACTIVE = {"active": True, "sub": "1", "exp": time.time() + 600}
+INACTIVE = {"active": False}
+
+
+@pytest.mark.asyncio
+class TestIntrospectionCache:
+    async def test_response_is_cached_per_hint(self) -> None:
+        cache = IntrospectionCache(ttl=60, negative_ttl=10, max_size=10)
+
+        lookup = await cache.get("token", "refresh_token")
+        assert lookup.response is None
+        await cache.put(lookup, ACTIVE)
+
+        assert (await cache.get("token", "refresh_token")).response == ACTIVE
+        assert (await cache.get("Bearer token", "refresh_token")).response == ACTIVE
+        assert (await cache.get("token", None)).response is None
+
+    async def test_expiration(self) -> None:
+        cache = IntrospectionCache(ttl=60, negative_ttl=0, max_size=10)
+
+        await cache.put(await cache.get("inactive", None), INACTIVE)
+        await cache.put(
+            await cache.get("expired", None),
+            {"active": True, "exp": time.time() - 1},
+        )
+
+        assert (await cache.get("inactive", None)).response is None
+        assert (await cache.get("expired", None)).response is None
+
+    async def test_size_is_bounded(self) -> None:
+        cache = IntrospectionCache(ttl=60, negative_ttl=10, max_size=2)
+
+        for token in ("first", "second", "third"):
+            await cache.put(await cache.get(token, None), INACTIVE)
+
+        assert len(cache) == 2
+        assert (await cache.get("first", None)).response is None
+
+    async def test_invalidate_and_flush(self) -> None:
+        channel = AsyncMock()
+        cache = IntrospectionCache(
+            ttl=60, negative_ttl=10, max_size=10, channel=channel
+        )
+        for token in ("first", "second"):
+            await cache.put(await cache.get(token, "refresh_token"), ACTIVE)
+
+        await cache.invalidate("first")
+        assert (await cache.get("first", "refresh_token")).response is None
+        assert len(cache) == 1
+
+        await cache.flush()
+        assert len(cache) == 0
+        assert [call.args for call in channel.publish.await_args_list] == [
+            (cache.get_digest("first"),),
+            ("*",),
+        ]
+
+    async def test_response_racing_with_invalidation_is_not_stored(
+        self,
+    ) -> None:
+        cache = IntrospectionCache(ttl=60, negative_ttl=10, max_size=10)
+
+        lookup = await cache.get("token", "refresh_token")
+        await cache.invalidate("token")
+        await cache.put(lookup, ACTIVE)
+
+        assert len(cache) == 0
+
+    async def test_redis_write_is_conditional_on_the_digest_version(
+        self,
+    ) -> None:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=["3", "1", None])
+        redis = MagicMock()
+        redis.pipeline.return_value.__aenter__.return_value = pipe
+        cache = IntrospectionCache(
+            ttl=60, negative_ttl=10, max_size=10, redis_url="redis://"
+        )
+        cache._redis = redis
+        digest = cache.get_digest("token")
+
+        lookup = await cache.get("token", None)
+        assert (lookup.epoch, lookup.version) == (3, 1)
+
+        await cache.invalidate("token")
+        pipe.incr.assert_called_once_with(f"introspection:{digest}:version")
+        pipe.delete.assert_called_once_with(f"introspection:{digest}")
+
+        # Only the script compares the version with the one bumped above.
+        await cache.put(lookup, ACTIVE)
+        args = pipe.eval.call_args.args
+        assert args[0] == cache.PUT_SCRIPT
+        assert args[2:7] == (
+            cache.EPOCH_KEY,
+            f"introspection:{digest}:version",
+            f"introspection:{digest}",
+            3,
+            1,
+        )
+        assert len(cache) == 0
+
+    async def test_disabled(self) -> None:
+        cache = IntrospectionCache(
+            ttl=60, negative_ttl=10, max_size=10, enabled=False
+        )
+
+        await cache.put(await cache.get("token", None), ACTIVE)
+
+        assert len(cache) == 0
@@ -0,0 +1,67 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.business_logic.cache.introspection import introspection_cache
+from src.business_logic.services.introspection import IntrospectionService
+from src.presentation.api.models.introspection import IntrospectionTokenModel
+
+
+@pytest.fixture(autouse=True)
+def clear_introspection_cache() -> None:
+    introspection_cache.invalidate_local()
+
+
+@pytest.mark.asyncio
+class TestBatchIntrospection:
+    async def test_analyze_tokens(self) -> None:
+        jwt = AsyncMock()
+        jwt.decode_tokens_no_aud_iss_check.return_value = [
+            {"sub": "1", "client_id": "test_client"},
+            {"sub": "2"},
+            {"sub": "1"},
+            None,
+            {"sub": "3"},
+        ]
+        persistent_grant_repo = AsyncMock()
+        persistent_grant_repo.get_grant_types_by_data.return_value = {
+            "refresh": ["refresh_token"],
+        }
+        user_repo = AsyncMock()
+        user_repo.get_usernames_by_ids.return_value = {1: "TonyStark"}
+        service = IntrospectionService(
+            session=AsyncMock(),
+            user_repo=user_repo,
+            client_repo=AsyncMock(),
+            persistent_grant_repo=persistent_grant_repo,
+            jwt=jwt,
+        )
+        service.request = MagicMock(url="http://testserver/introspection/batch")
+
+        responses = await service.analyze_tokens(
+            [
+                IntrospectionTokenModel(token="access", token_type_hint="access_token"),
+                IntrospectionTokenModel(token="unknown"),
+                IntrospectionTokenModel(token="refresh"),
+                IntrospectionTokenModel(token="invalid"),
+                IntrospectionTokenModel(token="refresh", token_type_hint="device_code"),
+            ]
+        )
+
+        assert [response["active"] for response in responses] == [
+            True, False, True, False, False,
+        ]
+        assert responses[0]["username"] == "TonyStark"
+        assert responses[0]["client_id"] == "test_client"
+        assert responses[0]["iss"] == "http://testserver"
+        assert responses[2]["username"] == "TonyStark"
+        assert list(
+            persistent_grant_repo.get_grant_types_by_data.await_args.args[0]
+        ) == ["unknown", "refresh", "refresh"]
+        assert set(user_repo.get_usernames_by_ids.await_args.args[0]) == {1}
+
+        # The second batch is answered from the introspection cache.
+        assert await service.analyze_tokens(
+            [IntrospectionTokenModel(token="refresh")]
+        ) == [responses[2]]
+        assert jwt.decode_tokens_no_aud_iss_check.await_count == 1
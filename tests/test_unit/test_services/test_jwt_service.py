@@ -1,6 +1,13 @@
+import time
+from unittest import mock
+
 import pytest
+from jwt.exceptions import ExpiredSignatureError, InvalidAudienceError
 
+from src.business_logic.jwt_manager.crypto_executor import crypto_executor
+from src.business_logic.jwt_manager.token_cache import verified_token_cache
 from src.business_logic.services.jwt_token import JWTService
+from src.config.rsa_keys import rsa_key_cache
 
 
 @pytest.mark.asyncio
@@ -15,3 +22,83 @@ class TestJWTService:
             assert type(decoded_dict) == dict
             assert decoded_dict["sub"] == 123
             assert decoded_dict["name"] == "Danya"
+
+    async def test_keys_are_parsed_once(self) -> None:
+        rsa_key_cache.clear()
+        service = JWTService()
+        other_service = JWTService()
+
+        token = await service.encode_jwt(payload={"sub": "1"})
+        await other_service.encode_jwt(payload={"sub": "2"})
+        await service.decode_token(token=token)
+        await other_service.decode_token(token=token)
+
+        stats = rsa_key_cache.stats()
+        assert stats["misses"] == 2
+        assert stats["hits"] == 2
+        assert stats["private_keys"] == 1
+        assert stats["public_keys"] == 1
+
+    async def test_verified_tokens_are_cached(self) -> None:
+        verified_token_cache.clear()
+        service = JWTService()
+        token = await service.encode_jwt(
+            payload={"sub": "1", "aud": ["userinfo"], "exp": int(time.time()) + 600}
+        )
+
+        with mock.patch(
+            "src.business_logic.services.jwt_token.crypto_executor.run",
+            wraps=crypto_executor.run,
+        ) as run:
+            for _ in range(3):
+                decoded = await service.decode_token(token=token, audience="userinfo")
+                assert decoded["sub"] == "1"
+            await service.decode_token_no_aud_iss_check(token=token)
+            assert run.call_count == 1
+
+            with pytest.raises(InvalidAudienceError):
+                await service.decode_token(token=token, audience="admin")
+            with pytest.raises(InvalidAudienceError):
+                await service.decode_token(token=token)
+
+            verified_token_cache.invalidate("Bearer " + token)
+            await service.decode_token(token=token, audience="userinfo")
+            assert run.call_count == 2
+
+    async def test_expired_token_is_not_served_from_cache(self) -> None:
+        verified_token_cache.clear()
+        service = JWTService()
+        token = await service.encode_jwt(payload={"sub": "1", "exp": int(time.time()) - 1})
+        verified_token_cache.put(token, {"sub": "1", "exp": int(time.time()) - 1})
+
+        with pytest.raises(ExpiredSignatureError):
+            await service.decode_token(token=token)
+        assert len(verified_token_cache) == 0
+
+    async def test_decode_tokens_in_bulk(self) -> None:
+        verified_token_cache.clear()
+        service = JWTService()
+        service.VERIFY_CHUNK_SIZE = 2
+        exp = int(time.time()) + 600
+        tokens = [
+            await service.encode_jwt(payload={"sub": str(sub), "exp": exp})
+            for sub in range(3)
+        ]
+        expired = await service.encode_jwt(
+            payload={"sub": "3", "exp": int(time.time()) - 1}
+        )
+        await service.decode_token_no_aud_iss_check(token=tokens[0])
+
+        with mock.patch(
+            "src.business_logic.services.jwt_token.crypto_executor.run",
+            wraps=crypto_executor.run,
+        ) as run:
+            decoded = await service.decode_tokens_no_aud_iss_check(
+                [*tokens, expired, "not a token"]
+            )
+            # The first token is cached, the other three make two chunks.
+            assert run.call_count == 2
+
+        assert [claims and claims["sub"] for claims in decoded] == [
+            "0", "1", "2", None, None,
+        ]
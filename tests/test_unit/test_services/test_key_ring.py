@@ -0,0 +1,109 @@
+import asyncio
+import time
+from unittest import mock
+
+import jwt
+import pytest
+
+from src.business_logic.jwt_manager.key_ring import (
+    KeyRingNotLoadedError,
+    RSAKeyRing,
+    UnknownKeyError,
+)
+from src.business_logic.jwt_manager.key_store import FileKeyStore, MemoryKeyStore
+from src.business_logic.services.jwt_token import JWTService
+from src.config.rsa_keys import get_key_id
+
+
+def create_key_ring(store=None) -> RSAKeyRing:
+    return RSAKeyRing(
+        store=store or MemoryKeyStore(),
+        rotation_interval=3600,
+        publish_ahead=60,
+        retention=600,
+        reload_interval=300,
+    )
+
+
+@pytest.mark.asyncio
+class TestRSAKeyRing:
+
+    async def test_first_key_is_created(self) -> None:
+        key_ring = create_key_ring()
+        key = await key_ring.get_signing_key()
+
+        assert key.kid == get_key_id(key.n, key.e)
+        assert [item.kid for item in await key_ring.get_verification_keys()] == [key.kid]
+
+    async def test_signing_key_is_not_loaded_synchronously(self) -> None:
+        key_ring = create_key_ring()
+
+        with pytest.raises(KeyRingNotLoadedError):
+            key_ring.signing_key
+        key = await key_ring.get_signing_key()
+        assert key_ring.signing_key.kid == key.kid
+
+    async def test_rotation_publishes_ahead_and_retains(self) -> None:
+        key_ring = create_key_ring()
+        old_key = await key_ring.get_signing_key()
+
+        assert key_ring.rotate() is None
+        new_key = key_ring.rotate(force=True)
+
+        assert new_key.not_before > time.time()
+        assert (await key_ring.get_signing_key()).kid == old_key.kid
+        published = [key.kid for key in await key_ring.get_verification_keys()]
+        assert published == [new_key.kid, old_key.kid]
+        assert (await key_ring.get_verification_key(old_key.kid)).expires_at == (
+            new_key.not_before + 600
+        )
+
+    @pytest.mark.parametrize("force", [False, True])
+    async def test_concurrent_refreshes_load_once(self, force) -> None:
+        store = MemoryKeyStore()
+        key_ring = create_key_ring(store)
+        await key_ring.get_signing_key()
+        if not force:
+            key_ring._loaded_at = None
+
+        load_keys = store.load
+
+        def slow_load() -> list:
+            time.sleep(0.05)
+            return load_keys()
+
+        with mock.patch.object(store, "load", side_effect=slow_load) as load:
+            await asyncio.gather(
+                *(key_ring.refresh(force=force) for _ in range(10))
+            )
+
+        assert load.call_count == 1
+
+    async def test_unknown_kid(self) -> None:
+        key_ring = create_key_ring()
+        await key_ring.get_signing_key()
+
+        with pytest.raises(UnknownKeyError):
+            await key_ring.get_verification_key("unknown")
+
+    async def test_workers_share_file_store(self, tmp_path) -> None:
+        path = str(tmp_path / "signing_keys.json")
+        first, second = create_key_ring(FileKeyStore(path)), create_key_ring(FileKeyStore(path))
+
+        assert (await first.get_signing_key()).kid == (await second.get_signing_key()).kid
+
+        # A key rotated by another worker is found by the kid of its tokens.
+        second.MIN_RELOAD_INTERVAL = 0
+        new_key = first.rotate(force=True)
+        assert (await second.get_verification_key(new_key.kid)).kid == new_key.kid
+
+
+@pytest.mark.asyncio
+class TestJWTServiceKid:
+
+    async def test_token_carries_kid(self) -> None:
+        jwt_service = JWTService()
+        token = await jwt_service.encode_jwt(payload={"sub": 1})
+
+        assert jwt.get_unverified_header(token)["kid"] == jwt_service.keys.kid
+        assert (await jwt_service.decode_token(token))["sub"] == 1
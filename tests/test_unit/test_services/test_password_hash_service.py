@@ -1,5 +1,13 @@
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
+from pydantic import SecretStr
 
+from src.business_logic.authorization.validators import (
+    UserCredentialsValidator,
+)
+from src.business_logic.password_hashing import BcryptHasher, PBKDF2Hasher
 from src.business_logic.services.password import PasswordHash
 from src.data_access.postgresql.errors import (
     WrongPasswordError,
@@ -9,23 +17,107 @@ from tests.test_unit.fixtures import TEST_VALIDATE_PASSWORD
 from typing import no_type_check
 
 
+@pytest.mark.asyncio
 class TestPasswordHash:
-    def test_hash_password(self) -> None:
-        password = PasswordHash.hash_password("some_password")
+    async def test_hash_password(self) -> None:
+        password = await PasswordHash.hash_password("some_password")
         assert type(password) == str
 
     @no_type_check
-    def test_hash_password_wrong_format(self) -> None:
+    async def test_hash_password_wrong_format(self) -> None:
         with pytest.raises(WrongPasswordFormatError):
-            PasswordHash.hash_password(2345)
+            await PasswordHash.hash_password(2345)
 
     @pytest.mark.parametrize("test_input, expected", TEST_VALIDATE_PASSWORD[:3])
-    def test_validate_password(self, test_input: str, expected: str) -> None:
-        assert PasswordHash.validate_password(test_input, expected)
+    async def test_validate_password(
+        self, test_input: str, expected: str
+    ) -> None:
+        assert await PasswordHash.validate_password(test_input, expected)
 
     @pytest.mark.parametrize("test_input, expected", TEST_VALIDATE_PASSWORD[3:])
-    def test_validate_password_error(
+    async def test_validate_password_error(
         self, test_input: str, expected: str
     ) -> None:
         with pytest.raises(WrongPasswordError):
-            PasswordHash.validate_password(test_input, expected)
+            await PasswordHash.validate_password(test_input, expected)
+
+    async def test_concurrent_validation(self) -> None:
+        password, hashed = TEST_VALIDATE_PASSWORD[0]
+        results = await asyncio.gather(
+            *(PasswordHash.is_password_valid(password, hashed) for _ in range(4))
+        )
+        assert all(results)
+
+
+@pytest.mark.asyncio
+class TestPasswordRehash:
+    async def test_hash_is_decoded(self) -> None:
+        password = await PasswordHash.hash_password("some_password")
+        assert password.startswith("$2b$") and len(password) == 60
+        assert not PasswordHash.needs_rehash(password)
+
+    async def test_pbkdf2_hash(self) -> None:
+        hasher = PBKDF2Hasher(cost=1000)
+        hashed = hasher.hash(b"some_password")
+        assert hashed.startswith("$pbkdf2-sha256$1000$")
+        assert hasher.verify(b"some_password", hashed)
+        assert not hasher.verify(b"other_password", hashed)
+        assert PasswordHash.needs_rehash(hashed)
+        assert await PasswordHash.is_password_valid(
+            SecretStr("some_password"), hashed
+        )
+
+    async def test_other_cost_needs_rehash(self) -> None:
+        hashed = BcryptHasher(cost=4).hash(b"some_password")
+        assert PasswordHash.needs_rehash(hashed)
+
+    async def test_unknown_format(self) -> None:
+        assert not await PasswordHash.is_password_valid(
+            SecretStr("some_password"), "plain"
+        )
+
+    @pytest.mark.parametrize(
+        "hashed",
+        [
+            "$pbkdf2-sha256$",
+            "$pbkdf2-sha256$many$c2FsdA$ZGlnZXN0",
+            "$pbkdf2-sha256$1000$c2FsdA$ZGlnZXN0$extra",
+            "$pbkdf2-sha256$1000$!!!$ZGlnZXN0",
+            "$2b$12$short",
+        ],
+    )
+    async def test_malformed_hash(self, hashed: str) -> None:
+        assert not await PasswordHash.is_password_valid(
+            SecretStr("some_password"), hashed
+        )
+
+    async def test_login_upgrades_hash(self) -> None:
+        old_hash = BcryptHasher(cost=4).hash(b"some_password")
+        user_repo = AsyncMock()
+        user_repo.exists_user.return_value = True
+        user_repo.get_hashed_password_by_username.return_value = old_hash
+        validator = UserCredentialsValidator(
+            user_repo=user_repo, password_service=PasswordHash()
+        )
+
+        await validator("user", SecretStr("some_password"))
+
+        username, replaced, new_hash = (
+            user_repo.replace_hashed_password.call_args.args
+        )
+        assert (username, replaced) == ("user", old_hash)
+        assert not PasswordHash.needs_rehash(new_hash)
+
+    async def test_login_keeps_current_hash(self) -> None:
+        user_repo = AsyncMock()
+        user_repo.exists_user.return_value = True
+        user_repo.get_hashed_password_by_username.return_value = (
+            await PasswordHash.hash_password("some_password")
+        )
+        validator = UserCredentialsValidator(
+            user_repo=user_repo, password_service=PasswordHash()
+        )
+
+        await validator("user", SecretStr("some_password"))
+
+        user_repo.replace_hashed_password.assert_not_called()
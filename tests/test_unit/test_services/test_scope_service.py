@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from src.business_logic.services.scope import ScopeService
+from src.data_access.postgresql.scope_catalog import ScopeCatalog
+from tests.test_unit.test_repositories.test_scope_catalog import make_session
+
+
+@pytest_asyncio.fixture
+async def scope_service() -> ScopeService:
+    resource_repo = AsyncMock()
+    resource_repo.get_catalog.return_value = await ScopeCatalog.load(
+        make_session()
+    )
+    return ScopeService(session=AsyncMock(), resource_repo=resource_repo)
+
+
+@pytest.mark.asyncio
+class TestScopeService:
+    async def test_get_ids(self, scope_service: ScopeService) -> None:
+        assert await scope_service.get_ids(["email", "oidc"]) == [
+            {"resource_id": 1, "scope_id": 1, "claim_id": 2},
+            {"resource_id": 1, "scope_id": 1},
+        ]
+
+    async def test_get_revoke_introspection_aud(
+        self, scope_service: ScopeService
+    ) -> None:
+        assert await scope_service.get_revoke_introspection_aud("oidc") == [
+            "oidc:revoke:post",
+            "oidc:introspection:post",
+        ]
+
+    async def test_get_all_scopes_of_resource_by_name(
+        self, scope_service: ScopeService
+    ) -> None:
+        assert await scope_service.get_all_scopes_of_resource_by_name(
+            "gcp-api"
+        ) == {"gcp-api:read:all": "Read"}
+
+    async def test_get_resource_api_description(
+        self, scope_service: ScopeService
+    ) -> None:
+        assert await scope_service.get_resource_api_description(
+            "gcp-api.read.all"
+        ) == {"GCP": "Read : all"}
+        assert await scope_service.get_resource_api_description(
+            "gcp-api.write.all"
+        ) == {"Impossible": "Error"}
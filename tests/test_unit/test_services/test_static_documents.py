@@ -0,0 +1,40 @@
+import pytest
+
+from src.business_logic.cache.static_documents import StaticDocumentCache
+
+
+@pytest.mark.asyncio
+class TestStaticDocumentCache:
+
+    async def test_document_is_built_once_per_version(self) -> None:
+        builds = []
+
+        async def build() -> dict:
+            builds.append(1)
+            return {"keys": len(builds)}
+
+        cache = StaticDocumentCache(max_age=300)
+        first = await cache.get("jwks", build, version=("a",))
+        second = await cache.get("jwks", build, version=("a",))
+        assert first is second
+        assert first.body == b'{"keys":1}'
+
+        rotated = await cache.get("jwks", build, version=("b", "a"))
+        assert rotated.etag != first.etag
+        assert len(builds) == 2
+
+        cache.invalidate("jwks")
+        await cache.get("jwks", build, version=("b", "a"))
+        assert len(builds) == 3
+
+    async def test_if_none_match(self) -> None:
+        async def build() -> dict:
+            return {"issuer": "http://localhost"}
+
+        document = await StaticDocumentCache(max_age=300).get("openid", build)
+
+        assert document.matches(document.etag)
+        assert document.matches(f'"other", {document.etag}')
+        assert document.matches("*")
+        assert not document.matches('"other"')
+        assert not document.matches(None)
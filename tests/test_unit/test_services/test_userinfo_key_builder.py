@@ -0,0 +1,45 @@
+from unittest import mock
+
+import pytest
+
+from src.business_logic.cache.key_builders import userinfo_key_builder
+from src.business_logic.services.jwt_token import JWTService
+
+
+async def get_userinfo() -> None:
+    pass
+
+
+async def build_key(claims: dict, token: str = "Bearer token") -> str:
+    request = mock.MagicMock(headers={"authorization": token})
+    with mock.patch.object(
+        JWTService,
+        "decode_token_no_aud_iss_check",
+        mock.AsyncMock(return_value=claims),
+    ):
+        return await userinfo_key_builder(
+            get_userinfo,
+            "fastapi-cache:userinfo",
+            request=request,
+            args=(),
+            kwargs={},
+        )
+
+
+@pytest.mark.asyncio
+class TestUserinfoKeyBuilder:
+    async def test_key_depends_on_subject_and_scope_set(self) -> None:
+        key = await build_key({"sub": "1", "scope": "openid profile"})
+
+        assert key.startswith("fastapi-cache:userinfo:1:get_userinfo:")
+        assert key == await build_key(
+            {"sub": "1", "scope": "profile openid openid"}, token="other"
+        )
+        assert key != await build_key({"sub": "2", "scope": "openid profile"})
+        assert key != await build_key({"sub": "1", "scope": "openid email"})
+
+    async def test_request_is_required(self) -> None:
+        with pytest.raises(ValueError):
+            await userinfo_key_builder(
+                get_userinfo, "fastapi-cache:userinfo", args=(), kwargs={}
+            )
@@ -143,8 +143,9 @@ class TestWellKnownService:
     ) -> None:
         wks = wlk_services
         jwt_service = JWTService()
-        result = await wks.get_jwks()
+        result = (await wks.get_jwks())["keys"][0]
         test_token = await jwt_service.encode_jwt(payload={"sub": 1})
+        assert result["kid"] == jwt.get_unverified_header(test_token)["kid"]
 
         if result["alg"] == "RS256":
             n = base64_to_long(result["n"])